@@ -0,0 +1,29 @@
+"""Index api_definitions.method and bodies.body_type
+
+Revision ID: b3f1c2d4e5a6
+Revises: 9791d0c3a1d4
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f1c2d4e5a6'
+down_revision: Union[str, Sequence[str], None] = '9791d0c3a1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_api_definitions_method'), 'api_definitions', ['method'], unique=False)
+    op.create_index(op.f('ix_bodies_body_type'), 'bodies', ['body_type'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_bodies_body_type'), table_name='bodies')
+    op.drop_index(op.f('ix_api_definitions_method'), table_name='api_definitions')
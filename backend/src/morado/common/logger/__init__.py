@@ -22,40 +22,57 @@ Configuration:
     configure_logger(config)
 """
 
-# Core logger functionality
-# Note: These will be implemented in task 4
-# For now, we provide placeholder imports that will work once task 4 is complete
-try:
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from morado.common.logger.config import (
+        ConfigurationManager,
+        LoggerConfig,
+        ProcessorConfig,
+    )
     from morado.common.logger.logger import (
         LoggerSystem,
         configure_logger,
         get_logger,
     )
-except ImportError:
-    # Fallback for when logger.py is not yet implemented
-    import structlog
-
-    def get_logger(name=None):
-        """Get a logger instance (fallback implementation)"""
-        return structlog.get_logger(name)
-
-    def configure_logger(config=None, config_file=None, **overrides):
-        """Configure logger (fallback implementation)"""
+    from morado.common.utils.uuid import UUIDConfig
+
+# Names resolved on first access (PEP 562), so importing the package for the
+# context helpers or decorators does not pull in structlog and pydantic
+_LAZY_ATTRS = {
+    # Core logger functionality
+    "LoggerSystem": "morado.common.logger.logger",
+    "configure_logger": "morado.common.logger.logger",
+    "get_logger": "morado.common.logger.logger",
+    # Configuration
+    "ConfigurationManager": "morado.common.logger.config",
+    "LoggerConfig": "morado.common.logger.config",
+    "ProcessorConfig": "morado.common.logger.config",
+    # UUID configuration (re-exported for convenience)
+    "UUIDConfig": "morado.common.utils.uuid",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access and cache it."""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily exported names."""
+    return sorted(globals().keys() | _LAZY_ATTRS.keys())
 
-    class LoggerSystem:
-        """Logger system placeholder"""
-
-
-# Context management
-# Configuration
-from morado.common.logger.config import (
-    ConfigurationManager,
-    LoggerConfig,
-    ProcessorConfig,
-)
 
 # Import context management functions from context module
 from morado.common.logger.context import (
+    RequestScope,
     async_request_scope,
     clear_context,
     get_context_data,
@@ -106,9 +123,6 @@ except ImportError:
         return decorator
 
 
-# UUID configuration (re-exported for convenience)
-from morado.common.utils.uuid import UUIDConfig
-
 # Public API
 __all__ = [
     "ConfigurationManager",
@@ -117,6 +131,7 @@ __all__ = [
     "LoggerSystem",
     "ProcessorConfig",
     "RequestContext",
+    "RequestScope",
     "UUIDConfig",
     "async_request_scope",
     "async_with_request_context",
@@ -61,10 +61,9 @@ def set_context_data(key: str, value: Any) -> None:
         >>> set_context_data("user_id", 123)
         >>> set_context_data("operation", "create_order")
     """
+    # Copy rather than mutate, since an enclosing scope may share the dict
     data = context_data_var.get()
-    if data is None:
-        data = {}
-    data[key] = value
+    data = {key: value} if data is None else {**data, key: value}
     context_data_var.set(data)
 
 
@@ -126,6 +125,105 @@ def get_log_context() -> dict[str, Any]:
     return context
 
 
+def _push_scope(
+    request_id: str | None,
+    user_id: int | None,
+    trace_id: str | None,
+    extra_context: dict[str, Any],
+) -> tuple[contextvars.Token, contextvars.Token]:
+    """Set up the context of a request scope on top of the current context.
+
+    Leaving the scope with :func:`_pop_scope` restores exactly the context
+    that was set before.
+
+    Args:
+        request_id: Optional request ID (auto-generated if None)
+        user_id: Optional user ID
+        trace_id: Optional trace ID
+        extra_context: Additional context key-value pairs
+
+    Returns:
+        Tokens of the request ID and context data variables
+    """
+    # Auto-generate request_id if not provided
+    if request_id is None:
+        request_id = str(uuid4())
+
+    data = context_data_var.get()
+    if user_id is not None or trace_id is not None or extra_context:
+        # Context data dicts are never mutated in place, so only a scope
+        # that adds values needs a dict of its own
+        data = {} if data is None else data.copy()
+        if user_id is not None:
+            data["user_id"] = user_id
+        if trace_id is not None:
+            data["trace_id"] = trace_id
+        data.update(extra_context)
+
+    return request_id_var.set(request_id), context_data_var.set(data)
+
+
+def _pop_scope(tokens: tuple[contextvars.Token, contextvars.Token]) -> None:
+    """Restore the context that was current before :func:`_push_scope`.
+
+    Args:
+        tokens: Tokens returned by :func:`_push_scope`
+    """
+    request_id_token, context_data_token = tokens
+    context_data_var.reset(context_data_token)
+    request_id_var.reset(request_id_token)
+
+
+class RequestScope:
+    """Class-based request scope for both ``with`` and ``async with``.
+
+    Behaves like :func:`request_scope` and :func:`async_request_scope` but
+    avoids creating a generator and its context manager wrapper on every
+    entry. An instance holds the tokens of one active scope, so it must not
+    be entered again before it exits.
+
+    Example:
+        >>> with RequestScope(user_id=123):
+        ...     logger.info("Processing request")
+    """
+
+    __slots__ = ("_tokens", "extra_context", "request_id", "trace_id", "user_id")
+
+    def __init__(
+        self,
+        request_id: str | None = None,
+        user_id: int | None = None,
+        trace_id: str | None = None,
+        **extra_context: Any,
+    ) -> None:
+        """Initialize the scope.
+
+        Args:
+            request_id: Optional request ID (auto-generated if None)
+            user_id: Optional user ID
+            trace_id: Optional trace ID
+            **extra_context: Additional context key-value pairs
+        """
+        self.request_id = request_id
+        self.user_id = user_id
+        self.trace_id = trace_id
+        self.extra_context = extra_context
+
+    def __enter__(self) -> None:
+        self._tokens = _push_scope(
+            self.request_id, self.user_id, self.trace_id, self.extra_context
+        )
+
+    def __exit__(self, *exc_info: object) -> None:
+        _pop_scope(self._tokens)
+
+    async def __aenter__(self) -> None:
+        self.__enter__()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        _pop_scope(self._tokens)
+
+
 @contextmanager
 def request_scope(
     request_id: str | None = None,
@@ -135,7 +233,8 @@ def request_scope(
 ) -> Generator[None, None, None]:
     """Context manager for request scope with automatic context management.
 
-    Sets up request context at the beginning and clears it at the end.
+    Sets up request context at the beginning and restores the previous
+    context at the end.
     Auto-generates request_id if not provided.
 
     Args:
@@ -151,26 +250,13 @@ def request_scope(
         >>> with request_scope(user_id=123):
         ...     logger.info("Processing request")
     """
-    # Auto-generate request_id if not provided
-    if request_id is None:
-        request_id = str(uuid4())
-
-    # Set request ID
-    set_request_id(request_id)
-
-    # Set additional context
-    if user_id is not None:
-        set_context_data("user_id", user_id)
-    if trace_id is not None:
-        set_context_data("trace_id", trace_id)
-    for key, value in extra_context.items():
-        set_context_data(key, value)
+    tokens = _push_scope(request_id, user_id, trace_id, extra_context)
 
     try:
         yield
     finally:
-        # Clear context when done
-        clear_context()
+        # Restore the context that was current before the scope
+        _pop_scope(tokens)
 
 
 @asynccontextmanager
@@ -182,7 +268,8 @@ async def async_request_scope(
 ) -> AsyncGenerator[None, None]:
     """Async context manager for request scope with automatic context management.
 
-    Sets up request context at the beginning and clears it at the end.
+    Sets up request context at the beginning and restores the previous
+    context at the end.
     Auto-generates request_id if not provided.
 
     Args:
@@ -198,23 +285,10 @@ async def async_request_scope(
         >>> async with async_request_scope(user_id=123):
         ...     logger.info("Processing async request")
     """
-    # Auto-generate request_id if not provided
-    if request_id is None:
-        request_id = str(uuid4())
-
-    # Set request ID
-    set_request_id(request_id)
-
-    # Set additional context
-    if user_id is not None:
-        set_context_data("user_id", user_id)
-    if trace_id is not None:
-        set_context_data("trace_id", trace_id)
-    for key, value in extra_context.items():
-        set_context_data(key, value)
+    tokens = _push_scope(request_id, user_id, trace_id, extra_context)
 
     try:
         yield
     finally:
-        # Clear context when done
-        clear_context()
+        # Restore the context that was current before the scope
+        _pop_scope(tokens)
@@ -6,14 +6,287 @@ from function arguments and log function execution.
 
 import functools
 import inspect
+import logging
 from collections.abc import Callable
 from typing import Any, TypeVar, cast
 
-from morado.common.logger.context import async_request_scope, request_scope
+from morado.common.logger.context import _pop_scope, _push_scope
 
 # Type variable for preserving function signatures
 F = TypeVar("F", bound=Callable[..., Any])
 
+# The decorators only take request_id, user_id and trace_id from arguments
+_NO_EXTRA_CONTEXT: dict[str, Any] = {}
+
+# Parameter kinds that can be passed by position
+_POSITIONAL_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+# Wrapper attributes copied from decorated functions; unlike functools.wraps
+# the annotations and __dict__ are left alone
+_WRAPPER_ASSIGNMENTS = ("__module__", "__name__", "__qualname__", "__doc__")
+
+
+def _wraps[W: Callable[..., Any]](func: Callable[..., Any], wrapper: W) -> W:
+    """Make a wrapper look like the function it wraps.
+
+    A lighter functools.wraps(): copies the name, qualified name, module and
+    docstring and sets ``__wrapped__``, which inspect.signature() follows.
+
+    Args:
+        func: Wrapped function
+        wrapper: Wrapper function
+
+    Returns:
+        The wrapper
+    """
+    return functools.update_wrapper(
+        wrapper, func, assigned=_WRAPPER_ASSIGNMENTS, updated=()
+    )
+
+
+def _argument_location(
+    sig: inspect.Signature, name: str
+) -> tuple[str, bool, int | None, Any]:
+    """Find where a named argument is passed in calls to a function.
+
+    Args:
+        sig: Signature of the called function
+        name: Name of the parameter
+
+    Returns:
+        Tuple of the name, whether it may be passed by keyword, its
+        positional index (None if keyword-only) and its default (None if it
+        has none). Names that are not named parameters always resolve to None.
+    """
+    param = sig.parameters.get(name)
+    if param is None or param.kind in (
+        inspect.Parameter.VAR_POSITIONAL,
+        inspect.Parameter.VAR_KEYWORD,
+    ):
+        return name, False, None, None
+
+    default = None if param.default is inspect.Parameter.empty else param.default
+    by_keyword = param.kind is not inspect.Parameter.POSITIONAL_ONLY
+    index = (
+        list(sig.parameters).index(name) if param.kind in _POSITIONAL_KINDS else None
+    )
+    return name, by_keyword, index, default
+
+
+def _context_extractor(
+    func: Callable[..., Any], *names: str
+) -> Callable[[tuple[Any, ...], dict[str, Any]], list[Any]]:
+    """Build an extractor for named arguments of calls to a function.
+
+    The signature is inspected once here, so the returned extractor only
+    indexes ``args``/``kwargs``. Each value equals what
+    ``sig.bind(*args, **kwargs)`` followed by ``apply_defaults()`` and
+    ``arguments.get(name)`` would return, without binding every argument.
+
+    Args:
+        func: Decorated function
+        *names: Names of the parameters to read
+
+    Returns:
+        Function taking the call's ``args`` and ``kwargs`` and returning the
+        values of ``names`` in order
+    """
+    sig = inspect.signature(func)
+    locations = [_argument_location(sig, name) for name in names]
+
+    def extract(args: tuple[Any, ...], kwargs: dict[str, Any]) -> list[Any]:
+        nargs = len(args)
+        values = []
+        for name, by_keyword, index, default in locations:
+            if by_keyword and name in kwargs:
+                values.append(kwargs[name])
+            elif index is not None and index < nargs:
+                values.append(args[index])
+            else:
+                values.append(default)
+        return values
+
+    return extract
+
+
+def _argument_binder(
+    func: Callable[..., Any],
+) -> Callable[[tuple[Any, ...], dict[str, Any]], dict[str, Any]]:
+    """Build a function naming the arguments of calls to a function.
+
+    For signatures without ``*args`` or ``**kwargs`` the parameter names and
+    defaults are read once here, so the returned function only merges them
+    with ``args``/``kwargs``. It gives the names and values that
+    ``sig.bind(*args, **kwargs)`` followed by ``apply_defaults()`` would for
+    valid calls; invalid calls are left for the function itself to reject.
+    Other signatures are bound per call.
+
+    Args:
+        func: Decorated function
+
+    Returns:
+        Function taking the call's ``args`` and ``kwargs`` and returning a
+        dict of argument values by parameter name
+    """
+    sig = inspect.signature(func)
+    params = sig.parameters.values()
+
+    if any(
+        param.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+        for param in params
+    ):
+
+        def bind(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+            bound_args = sig.bind(*args, **kwargs)
+            bound_args.apply_defaults()
+            return bound_args.arguments
+
+        return bind
+
+    positional = tuple(
+        param.name for param in params if param.kind in _POSITIONAL_KINDS
+    )
+    names_and_defaults = tuple((param.name, param.default) for param in params)
+    empty = inspect.Parameter.empty
+
+    def merge(args: tuple[Any, ...], kwargs: dict[str, Any]) -> dict[str, Any]:
+        supplied = dict(zip(positional, args, strict=False))
+        supplied.update(kwargs)
+        # Walk the parameters so the names come out in signature order
+        return {
+            name: supplied.get(name, default)
+            for name, default in names_and_defaults
+            if name in supplied or default is not empty
+        }
+
+    return merge
+
+
+# structlog methods log_execution() can log with and their numeric levels;
+# other level names log at info
+_LOG_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+def _make_log_funcs(
+    module: str, level: str
+) -> tuple[Callable[..., None], Callable[[], bool]]:
+    """Build the logging functions log_execution() uses for one function.
+
+    The structlog import and logger lookup happen once per decorated
+    function. The returned functions still go through the lazy logger proxy
+    per call, so logging configured after decoration is honored.
+
+    Args:
+        module: Module name of the decorated function
+        level: Log level name
+
+    Returns:
+        Tuple of a function taking an event name and keyword log data, and a
+        function telling whether the level is currently enabled
+    """
+    try:
+        import structlog
+    except ImportError:
+        # Fallback to print if structlog not available
+        def print_log(event: str, **kw: Any) -> None:
+            print(f"[{level}] {event} {kw}")
+
+        return print_log, lambda: True
+
+    logger = structlog.get_logger(module)
+    method_name = level.lower()
+    if method_name not in _LOG_LEVELS:
+        method_name = "info"
+    level_no = _LOG_LEVELS[method_name]
+
+    def log(event: str, **kw: Any) -> None:
+        getattr(logger, method_name)(event, **kw)
+
+    def enabled() -> bool:
+        # Loggers without level filtering always emit
+        is_enabled_for = getattr(logger, "is_enabled_for", None)
+        return is_enabled_for is None or is_enabled_for(level_no)
+
+    return log, enabled
+
+
+def _sync_context_wrapper[F: Callable[..., Any]](
+    func: F,
+    extract_context: Callable[[tuple[Any, ...], dict[str, Any]], list[Any]],
+    auto_generate: bool,
+) -> F:
+    """Wrap a sync function to run within a request scope.
+
+    Args:
+        func: Function to wrap
+        extract_context: Extractor of request_id, user_id and trace_id
+        auto_generate: Whether to open a scope when no request_id is passed
+
+    Returns:
+        Wrapped function
+    """
+
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Extract context values from arguments
+        request_id, user_id, trace_id = extract_context(args, kwargs)
+
+        # If auto_generate is False and request_id is None, don't create scope
+        if not auto_generate and request_id is None:
+            return func(*args, **kwargs)
+
+        # Set the context variables directly rather than through a scope object
+        tokens = _push_scope(request_id, user_id, trace_id, _NO_EXTRA_CONTEXT)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _pop_scope(tokens)
+
+    return cast(F, _wraps(func, wrapper))
+
+
+def _async_context_wrapper[F: Callable[..., Any]](
+    func: F,
+    extract_context: Callable[[tuple[Any, ...], dict[str, Any]], list[Any]],
+    auto_generate: bool,
+) -> F:
+    """Wrap an async function to run within a request scope.
+
+    Args:
+        func: Coroutine function to wrap
+        extract_context: Extractor of request_id, user_id and trace_id
+        auto_generate: Whether to open a scope when no request_id is passed
+
+    Returns:
+        Wrapped coroutine function
+    """
+
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # Extract context values from arguments
+        request_id, user_id, trace_id = extract_context(args, kwargs)
+
+        # If auto_generate is False and request_id is None, don't create scope
+        if not auto_generate and request_id is None:
+            return await func(*args, **kwargs)
+
+        # Set the context variables directly rather than through a scope object
+        tokens = _push_scope(request_id, user_id, trace_id, _NO_EXTRA_CONTEXT)
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _pop_scope(tokens)
+
+    return cast(F, _wraps(func, wrapper))
+
 
 def with_request_context(
     request_id_arg: str = "request_id",
@@ -45,57 +318,14 @@ def with_request_context(
     """
 
     def decorator(func: F) -> F:
-        # Check if function is async
-        if inspect.iscoroutinefunction(func):
+        # Resolve argument positions once instead of binding on every call
+        extract_context = _context_extractor(
+            func, request_id_arg, user_id_arg, trace_id_arg
+        )
 
-            @functools.wraps(func)
-            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                # Extract context values from arguments
-                sig = inspect.signature(func)
-                bound_args = sig.bind(*args, **kwargs)
-                bound_args.apply_defaults()
-
-                # Get context values from bound arguments
-                request_id = bound_args.arguments.get(request_id_arg)
-                user_id = bound_args.arguments.get(user_id_arg)
-                trace_id = bound_args.arguments.get(trace_id_arg)
-
-                # If auto_generate is False and request_id is None, don't create scope
-                if not auto_generate and request_id is None:
-                    return await func(*args, **kwargs)
-
-                # Create async request scope with extracted context
-                async with async_request_scope(
-                    request_id=request_id, user_id=user_id, trace_id=trace_id
-                ):
-                    return await func(*args, **kwargs)
-
-            return cast(F, async_wrapper)
-        else:
-
-            @functools.wraps(func)
-            def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                # Extract context values from arguments
-                sig = inspect.signature(func)
-                bound_args = sig.bind(*args, **kwargs)
-                bound_args.apply_defaults()
-
-                # Get context values from bound arguments
-                request_id = bound_args.arguments.get(request_id_arg)
-                user_id = bound_args.arguments.get(user_id_arg)
-                trace_id = bound_args.arguments.get(trace_id_arg)
-
-                # If auto_generate is False and request_id is None, don't create scope
-                if not auto_generate and request_id is None:
-                    return func(*args, **kwargs)
-
-                # Create request scope with extracted context
-                with request_scope(
-                    request_id=request_id, user_id=user_id, trace_id=trace_id
-                ):
-                    return func(*args, **kwargs)
-
-            return cast(F, sync_wrapper)
+        if inspect.iscoroutinefunction(func):
+            return _async_context_wrapper(func, extract_context, auto_generate)
+        return _sync_context_wrapper(func, extract_context, auto_generate)
 
     return decorator
 
@@ -108,9 +338,8 @@ def async_with_request_context(
 ) -> Callable[[F], F]:
     """Async-specific decorator to apply request context from function arguments.
 
-    This is an async-specific version of with_request_context that uses
-    async_request_scope internally. Use this for async functions when you want
-    to be explicit about async behavior.
+    This is an async-specific version of with_request_context. Use this for
+    async functions when you want to be explicit about async behavior.
 
     Args:
         request_id_arg: Name of the argument containing request_id
@@ -139,29 +368,12 @@ def async_with_request_context(
             )
             raise TypeError(msg)
 
-        @functools.wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Extract context values from arguments
-            sig = inspect.signature(func)
-            bound_args = sig.bind(*args, **kwargs)
-            bound_args.apply_defaults()
-
-            # Get context values from bound arguments
-            request_id = bound_args.arguments.get(request_id_arg)
-            user_id = bound_args.arguments.get(user_id_arg)
-            trace_id = bound_args.arguments.get(trace_id_arg)
+        # Resolve argument positions once instead of binding on every call
+        extract_context = _context_extractor(
+            func, request_id_arg, user_id_arg, trace_id_arg
+        )
 
-            # If auto_generate is False and request_id is None, don't create scope
-            if not auto_generate and request_id is None:
-                return await func(*args, **kwargs)
-
-            # Create async request scope with extracted context
-            async with async_request_scope(
-                request_id=request_id, user_id=user_id, trace_id=trace_id
-            ):
-                return await func(*args, **kwargs)
-
-        return cast(F, wrapper)
+        return _async_context_wrapper(func, extract_context, auto_generate)
 
     return decorator
 
@@ -195,31 +407,25 @@ def log_execution(
     """
 
     def decorator(func: F) -> F:
+        # Resolve parameter names once instead of binding on every call
+        bind_arguments = _argument_binder(func) if include_args else None
+        func_name = getattr(func, "__name__", "<unknown>")
+        log_func, log_enabled = _make_log_funcs(
+            getattr(func, "__module__", "unknown"), level
+        )
+
         # Check if function is async
         if inspect.iscoroutinefunction(func):
 
-            @functools.wraps(func)
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                # Try to get a logger
-                try:
-                    import structlog
-
-                    func_module = getattr(func, "__module__", "unknown")
-                    logger = structlog.get_logger(func_module)
-                    log_func = getattr(logger, level.lower(), logger.info)
-                except (ImportError, AttributeError):
-                    # Fallback to print if structlog not available
-                    def log_func(event: str, **kw: Any) -> None:
-                        print(f"[{level}] {event} {kw}")
+                # A disabled level logs nothing, so skip building any log data
+                if not log_enabled():
+                    return await func(*args, **kwargs)
 
                 # Build entry log data
-                func_name = getattr(func, "__name__", "<unknown>")
                 entry_data: dict[str, Any] = {"function": func_name}
-                if include_args:
-                    sig = inspect.signature(func)
-                    bound_args = sig.bind(*args, **kwargs)
-                    bound_args.apply_defaults()
-                    entry_data["args"] = dict(bound_args.arguments)
+                if bind_arguments is not None:
+                    entry_data["args"] = bind_arguments(args, kwargs)
 
                 # Log entry
                 log_func("function_entry", **entry_data)
@@ -248,31 +454,18 @@ def log_execution(
                     )
                     raise
 
-            return cast(F, async_wrapper)
+            return cast(F, _wraps(func, async_wrapper))
         else:
 
-            @functools.wraps(func)
             def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-                # Try to get a logger
-                try:
-                    import structlog
-
-                    func_module = getattr(func, "__module__", "unknown")
-                    logger = structlog.get_logger(func_module)
-                    log_func = getattr(logger, level.lower(), logger.info)
-                except (ImportError, AttributeError):
-                    # Fallback to print if structlog not available
-                    def log_func(event: str, **kw: Any) -> None:
-                        print(f"[{level}] {event} {kw}")
+                # A disabled level logs nothing, so skip building any log data
+                if not log_enabled():
+                    return func(*args, **kwargs)
 
                 # Build entry log data
-                func_name = getattr(func, "__name__", "<unknown>")
                 entry_data: dict[str, Any] = {"function": func_name}
-                if include_args:
-                    sig = inspect.signature(func)
-                    bound_args = sig.bind(*args, **kwargs)
-                    bound_args.apply_defaults()
-                    entry_data["args"] = dict(bound_args.arguments)
+                if bind_arguments is not None:
+                    entry_data["args"] = bind_arguments(args, kwargs)
 
                 # Log entry
                 log_func("function_entry", **entry_data)
@@ -301,6 +494,6 @@ def log_execution(
                     )
                     raise
 
-            return cast(F, sync_wrapper)
+            return cast(F, _wraps(func, sync_wrapper))
 
     return decorator
@@ -38,6 +38,8 @@ class LoggerSystem:
     ) -> None:
         """Configure the logger system.
 
+        Calls with a configuration equal to the current one are no-ops.
+
         Args:
             config: LoggerConfig instance to use
             config_file: Path to configuration file (TOML/YAML)
@@ -57,6 +59,11 @@ class LoggerSystem:
             else:
                 config = ConfigurationManager.load_from_env(**overrides)
 
+        # Reconfiguring with an equal configuration would only rebuild the
+        # same processor chain (and reopen a file output)
+        if cls._configured and config == cls._config:
+            return
+
         cls._config = config
 
         # Configure structlog
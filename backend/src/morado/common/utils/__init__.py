@@ -9,6 +9,12 @@ UUID Generation:
     # Generate standard UUID4
     id1 = uuid4()
 
+    # Generate a batch of UUID4s
+    ids = uuid4_many(1000)
+
+    # Generate a UUID4 as 16 raw bytes, e.g. for a BINARY(16) column
+    raw_id = uuid4_bytes()
+
     # Generate ULID-like sortable ID
     id2 = ulid()
 
@@ -67,6 +73,10 @@ Configuration:
     request_id = UUIDGenerator.generate(config)
 """
 
+import importlib
+import string
+from typing import TYPE_CHECKING, Any
+
 from morado.common.utils.exceptions import (
     FileExistsError,
     FileNotFoundError,
@@ -75,52 +85,61 @@ from morado.common.utils.exceptions import (
 )
 from morado.common.utils.filesystem import FileSystemUtil
 from morado.common.utils.time import TimeUtil
-from morado.common.utils.uuid import (
-    UUIDConfig,
-    UUIDGenerator,
-)
 
+if TYPE_CHECKING:
+    from morado.common.utils.uuid import UUIDConfig, UUIDGenerator
 
-# Convenience functions for common UUID formats
-def uuid4() -> str:
-    """Generate a standard RFC 4122 UUID4.
+    uuid4 = UUIDGenerator.uuid4
+    uuid4_bytes = UUIDGenerator.uuid4_bytes
+    uuid4_many = UUIDGenerator.uuid4_many
+    ulid = UUIDGenerator.ulid
+    numeric = UUIDGenerator.numeric
+    alphanumeric_many = UUIDGenerator.alphanumeric_many
 
-    Returns:
-        UUID4 string in standard format (e.g., "550e8400-e29b-41d4-a716-446655440000")
+# The uuid module pulls in pydantic, which dominates the import time of this
+# package, so its names are only imported on first access (PEP 562)
+_UUID_MODULE = "morado.common.utils.uuid"
+_LAZY_ATTRS = ("UUIDConfig", "UUIDGenerator")
 
-    Example:
-        >>> id = uuid4()
-        >>> len(id)
-        36
-    """
-    return UUIDGenerator.uuid4()
+# Convenience functions for common UUID formats; uuid4, ulid and numeric are
+# the generator's static methods themselves, so calls skip a forwarding frame
+_LAZY_GENERATOR_ATTRS = (
+    "uuid4",
+    "uuid4_bytes",
+    "uuid4_many",
+    "ulid",
+    "numeric",
+    "alphanumeric_many",
+)
 
+# Same as the uuid module's default charset, spelled out so that defining
+# alphanumeric() does not import it
+_DEFAULT_ALPHANUMERIC = string.ascii_uppercase + string.digits
 
-def ulid() -> str:
-    """Generate a ULID-like sortable timestamp-based ID.
 
-    ULIDs are lexicographically sortable and encode timestamp information,
-    making them ideal for distributed systems and time-series data.
+def __getattr__(name: str) -> Any:
+    """Import a lazily exported name on first access and cache it."""
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_UUID_MODULE), name)
+    elif name in _LAZY_GENERATOR_ATTRS:
+        value = getattr(__getattr__("UUIDGenerator"), name)
+    else:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    globals()[name] = value
+    return value
 
-    Returns:
-        ULID string (26 characters, base32 encoded)
 
-    Example:
-        >>> id1 = ulid()
-        >>> import time
-        >>> time.sleep(0.001)
-        >>> id2 = ulid()
-        >>> id1 < id2  # Sortable by time
-        True
-    """
-    return UUIDGenerator.ulid()
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazily exported names."""
+    return sorted(globals().keys() | {*_LAZY_ATTRS, *_LAZY_GENERATOR_ATTRS})
 
 
 def alphanumeric(
     length: int = 24,
     prefix: str = "",
     suffix: str = "",
-    charset: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+    charset: str = _DEFAULT_ALPHANUMERIC,
     use_timestamp: bool = False,
     secure: bool = True,
 ) -> str:
@@ -144,39 +163,12 @@ def alphanumeric(
         >>> len(id)
         24
     """
-    return UUIDGenerator.alphanumeric(
-        length=length,
-        prefix=prefix,
-        suffix=suffix,
-        charset=charset,
-        use_timestamp=use_timestamp,
-        secure=secure,
-    )
-
-
-def numeric(
-    length: int = 20, prefix: str = "", suffix: str = "", use_timestamp: bool = False
-) -> str:
-    """Generate a numeric-only ID.
-
-    Args:
-        length: Total length of the ID (including prefix and suffix)
-        prefix: Optional numeric prefix to prepend
-        suffix: Optional numeric suffix to append
-        use_timestamp: Whether to include timestamp component
-
-    Returns:
-        Numeric ID string
+    # Only a sys.modules lookup once the uuid module has been loaded
+    from morado.common.utils.uuid import UUIDGenerator
 
-    Example:
-        >>> id = numeric(length=20, prefix="123")
-        >>> id.startswith("123")
-        True
-        >>> len(id)
-        20
-    """
-    return UUIDGenerator.numeric(
-        length=length, prefix=prefix, suffix=suffix, use_timestamp=use_timestamp
+    # Positional arguments skip building a kwargs dict per call
+    return UUIDGenerator.alphanumeric(
+        length, prefix, suffix, charset, use_timestamp, secure
     )
 
 
@@ -195,8 +187,11 @@ __all__ = [
     # Core UUID generator
     "UUIDGenerator",
     "alphanumeric",
+    "alphanumeric_many",
     "numeric",
     "ulid",
     # Convenience functions
     "uuid4",
+    "uuid4_bytes",
+    "uuid4_many",
 ]
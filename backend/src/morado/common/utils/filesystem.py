@@ -4,7 +4,12 @@ This module provides the FileSystemUtil class with static methods for common
 file system operations that work consistently across Windows, Linux, and macOS.
 """
 
+import fnmatch
+import os
+import re
 import shutil
+import stat
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 
@@ -14,6 +19,104 @@ from .exceptions import FileSystemError
 
 PathLike = str | Path
 
+# Path separators of the platform, as Path would split on them
+_SEPARATORS = os.sep + (os.altsep or "")
+
+# Flags for name patterns; file names match case-insensitively where
+# fnmatch.fnmatch() would normalize their case (Windows)
+_PATTERN_FLAGS = re.IGNORECASE if os.path.normcase("A") == "a" else 0
+
+# Local timezone, looked up once instead of on every get_modified_time() call.
+# Datetimes built with it still denote the right instant if the UTC offset
+# changes later (e.g. DST), only their offset stays the one from startup.
+_LOCAL_TZ = datetime.now().astimezone().tzinfo
+
+
+def _as_path(path: PathLike) -> Path:
+    """Return path as a Path, reusing it if it already is one."""
+    # Path() subclasses are concrete (PosixPath/WindowsPath), so an exact
+    # type check would never match
+    return path if isinstance(path, Path) else Path(path)
+
+
+def _stat(path: PathLike) -> os.stat_result | None:
+    """Return the stat result of path, or None if it does not exist.
+
+    One os.stat() call answers both "does it exist" and "is it a directory",
+    which Path.exists() followed by Path.is_dir() would ask the OS separately.
+    """
+    try:
+        return os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _scan_files(directory: str, pattern: str | None, recursive: bool) -> Iterator[Path]:
+    """Iterate over the files in a directory with os.scandir().
+
+    Directory entries carry their file type, so unlike Path.rglob() followed
+    by is_file() this needs no extra stat per entry (except for symlinks)
+    and only builds Path objects for the files it yields. Like rglob(),
+    symlinks to files are listed but symlinked directories are not entered.
+
+    Args:
+        directory: Directory to list
+        pattern: Optional glob pattern matched against file names
+        recursive: If True, also list the files of subdirectories
+
+    Yields:
+        Path objects representing the matching files
+    """
+    # Compile the pattern once instead of going through fnmatch() per entry
+    match = (
+        re.compile(fnmatch.translate(pattern), _PATTERN_FLAGS).match
+        if pattern
+        else None
+    )
+    stack = [directory]
+    while stack:
+        path = stack.pop()
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            # Like rglob(), skip subdirectories that cannot be read; only a
+            # failure on the listed directory itself is an error
+            if path is directory:
+                raise
+            continue
+        with entries:
+            for entry in entries:
+                if recursive and entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif (match is None or match(entry.name)) and entry.is_file():
+                    yield Path(entry.path)
+
+
+def _iter_files(dir_obj: Path, pattern: str | None, recursive: bool) -> Iterator[Path]:
+    """Iterate over the files of a checked directory for iter_files().
+
+    Args:
+        dir_obj: Existing directory to list
+        pattern: Optional glob pattern to filter files
+        recursive: If True, also list the files of subdirectories
+
+    Yields:
+        Path objects representing the matching files
+
+    Raises:
+        FileSystemError: If listing operation fails
+    """
+    try:
+        # Patterns with path segments or "**" still go through pathlib
+        if pattern and ("**" in pattern or "/" in pattern or os.sep in pattern):
+            paths = dir_obj.rglob(pattern) if recursive else dir_obj.glob(pattern)
+            yield from (p for p in paths if p.is_file())
+        else:
+            yield from _scan_files(str(dir_obj), pattern or None, recursive)
+    except OSError as e:
+        msg = f"Failed to list files in '{dir_obj}': {e}"
+        raise FileSystemError(msg) from e
+
 
 class FileSystemUtil:
     """Cross-platform file system utility class.
@@ -45,7 +148,7 @@ class FileSystemUtil:
             >>> FileSystemUtil.exists("/nonexistent/path")
             False
         """
-        return Path(path).exists()
+        return _as_path(path).exists()
 
     @staticmethod
     def get_size(path: PathLike) -> int:
@@ -66,14 +169,14 @@ class FileSystemUtil:
             >>> print(f"File is {size} bytes")
             File is 1024 bytes
         """
-        path_obj = Path(path)
-        if not path_obj.exists():
+        st = _stat(path)
+        if st is None:
             msg = f"Path does not exist: {path}"
             raise FileNotFoundError(msg)
-        if path_obj.is_dir():
+        if stat.S_ISDIR(st.st_mode):
             msg = f"Path is a directory, not a file: {path}"
             raise IsADirectoryError(msg)
-        return path_obj.stat().st_size
+        return st.st_size
 
     @staticmethod
     def get_modified_time(path: PathLike) -> datetime:
@@ -93,12 +196,11 @@ class FileSystemUtil:
             >>> print(f"Last modified: {mod_time}")
             Last modified: 2024-01-15 10:30:45+00:00
         """
-        path_obj = Path(path)
-        if not path_obj.exists():
+        st = _stat(path)
+        if st is None:
             msg = f"Path does not exist: {path}"
             raise FileNotFoundError(msg)
-        timestamp = path_obj.stat().st_mtime
-        return datetime.fromtimestamp(timestamp, tz=datetime.now().astimezone().tzinfo)
+        return datetime.fromtimestamp(st.st_mtime, tz=_LOCAL_TZ)
 
     @staticmethod
     def get_extension(path: PathLike) -> str:
@@ -117,7 +219,15 @@ class FileSystemUtil:
             >>> FileSystemUtil.get_extension("/path/to/file")
             ''
         """
-        return Path(path).suffix
+        if isinstance(path, str):
+            # Same rules as Path.suffix, without parsing the whole path
+            name = path.rstrip(_SEPARATORS)
+            for sep in _SEPARATORS:
+                name = name.rpartition(sep)[2]
+            if name != ".":
+                i = name.rfind(".")
+                return name[i:] if 0 < i < len(name) - 1 else ""
+        return _as_path(path).suffix
 
     @staticmethod
     def get_directory(path: PathLike) -> Path:
@@ -135,7 +245,7 @@ class FileSystemUtil:
             >>> FileSystemUtil.get_directory("/path/to/dir/")
             PosixPath('/path/to')
         """
-        return Path(path).parent
+        return _as_path(path).parent
 
     @staticmethod
     def get_absolute_path(path: PathLike) -> Path:
@@ -153,7 +263,7 @@ class FileSystemUtil:
             >>> FileSystemUtil.get_absolute_path("/already/absolute")
             PosixPath('/already/absolute')
         """
-        return Path(path).resolve()
+        return _as_path(path).resolve()
 
     @staticmethod
     def join_path(*parts: PathLike) -> Path:
@@ -174,10 +284,8 @@ class FileSystemUtil:
         if not parts:
             return Path()
 
-        base = Path(parts[0])
-        for part in parts[1:]:
-            base = base / part
-        return base
+        # One os.path.join() and one parse instead of a Path per component
+        return Path(os.path.join(*map(os.fspath, parts)))
 
     @staticmethod
     def create_directory(
@@ -207,7 +315,7 @@ class FileSystemUtil:
         if path is None or (isinstance(path, str) and not path.strip()):
             raise ValueError("Path cannot be None or empty string")
 
-        path_obj = Path(path)
+        path_obj = _as_path(path)
 
         try:
             if path_obj.exists() and not exist_ok:
@@ -239,15 +347,19 @@ class FileSystemUtil:
         if path is None or (isinstance(path, str) and not path.strip()):
             raise ValueError("Path cannot be None or empty string")
 
-        path_obj = Path(path)
+        path_obj = _as_path(path)
 
-        if not path_obj.exists():
+        st = _stat(path_obj)
+        if st is None:
             if not missing_ok:
                 raise CustomFileNotFoundError(str(path))
             return
 
         try:
-            if path_obj.is_dir():
+            if stat.S_ISDIR(st.st_mode):
+                # rmtree() already walks with directory fds and unlinkat()
+                # where the platform has them; a plain os.walk() loop is no
+                # faster and would follow symlinked directories on the way
                 shutil.rmtree(path_obj)
             else:
                 path_obj.unlink()
@@ -256,13 +368,25 @@ class FileSystemUtil:
             raise FileSystemError(msg) from e
 
     @staticmethod
-    def copy_file(src: PathLike, dst: PathLike, overwrite: bool = False) -> Path:
+    def copy_file(
+        src: PathLike,
+        dst: PathLike,
+        overwrite: bool = False,
+        preserve_metadata: bool = True,
+    ) -> Path:
         """Copy a file from source to destination.
 
+        The file contents are copied in the kernel where the platform allows
+        it (sendfile/copy_file_range on Linux). Copying metadata as well
+        costs extra stat/utime/chmod calls, which callers that do not need
+        it can skip with ``preserve_metadata=False``.
+
         Args:
             src: Source file path (string or Path object)
             dst: Destination file path (string or Path object)
             overwrite: If True, overwrite destination if it exists (default: False)
+            preserve_metadata: If True, also copy permission bits and
+                timestamps (default: True)
 
         Returns:
             Path object representing the destination file
@@ -285,21 +409,30 @@ class FileSystemUtil:
         if dst is None or (isinstance(dst, str) and not dst.strip()):
             raise ValueError("Destination path cannot be None or empty string")
 
-        src_obj = Path(src)
-        dst_obj = Path(dst)
+        src_obj = _as_path(src)
+        dst_obj = _as_path(dst)
 
-        if not src_obj.exists():
+        src_st = _stat(src_obj)
+        if src_st is None:
             raise CustomFileNotFoundError(str(src))
 
-        if src_obj.is_dir():
+        if stat.S_ISDIR(src_st.st_mode):
             msg = f"Source is a directory, not a file: {src}"
             raise IsADirectoryError(msg)
 
-        if dst_obj.exists() and not overwrite:
+        dst_st = _stat(dst_obj)
+        if dst_st is not None and not overwrite:
             raise CustomFileExistsError(str(dst))
 
         try:
-            shutil.copy2(src_obj, dst_obj)
+            if preserve_metadata:
+                shutil.copy2(src_obj, dst_obj)
+            else:
+                # Like copy2(), copy into the directory if dst is one
+                dst_is_dir = dst_st is not None and stat.S_ISDIR(dst_st.st_mode)
+                shutil.copyfile(
+                    src_obj, dst_obj / src_obj.name if dst_is_dir else dst_obj
+                )
             return dst_obj
         except OSError as e:
             msg = f"Failed to copy '{src}' to '{dst}': {e}"
@@ -334,19 +467,20 @@ class FileSystemUtil:
         if dst is None or (isinstance(dst, str) and not dst.strip()):
             raise ValueError("Destination path cannot be None or empty string")
 
-        src_obj = Path(src)
-        dst_obj = Path(dst)
+        src_obj = _as_path(src)
+        dst_obj = _as_path(dst)
 
-        if not src_obj.exists():
+        if _stat(src_obj) is None:
             raise CustomFileNotFoundError(str(src))
 
-        if dst_obj.exists() and not overwrite:
+        dst_st = _stat(dst_obj)
+        if dst_st is not None and not overwrite:
             raise CustomFileExistsError(str(dst))
 
         try:
             # If destination exists and overwrite is True, remove it first
-            if dst_obj.exists() and overwrite:
-                if dst_obj.is_dir():
+            if dst_st is not None:
+                if stat.S_ISDIR(dst_st.st_mode):
                     shutil.rmtree(dst_obj)
                 else:
                     dst_obj.unlink()
@@ -358,10 +492,15 @@ class FileSystemUtil:
             raise FileSystemError(msg) from e
 
     @staticmethod
-    def list_files(
+    def iter_files(
         directory: PathLike, pattern: str | None = None, recursive: bool = False
-    ) -> list[Path]:
-        """List files in a directory with optional filtering.
+    ) -> Iterator[Path]:
+        """Iterate over files in a directory with optional filtering.
+
+        Lazy form of list_files() for large trees: files are yielded as the
+        directories are scanned instead of being collected into a list. The
+        directory is checked when this is called; listing errors surface
+        while iterating.
 
         Args:
             directory: Directory path to list files from (string or Path object)
@@ -369,7 +508,7 @@ class FileSystemUtil:
             recursive: If True, search recursively in subdirectories (default: False)
 
         Returns:
-            List of Path objects representing the matching files
+            Iterator of Path objects representing the matching files
 
         Raises:
             FileNotFoundError: If directory doesn't exist
@@ -378,17 +517,14 @@ class FileSystemUtil:
             NotADirectoryError: If path is not a directory
 
         Example:
-            >>> FileSystemUtil.list_files("/tmp")
-            [PosixPath('/tmp/file1.txt'), PosixPath('/tmp/file2.py')]
-            >>> FileSystemUtil.list_files("/tmp", pattern="*.txt")
-            [PosixPath('/tmp/file1.txt')]
-            >>> FileSystemUtil.list_files("/tmp", pattern="**/*.py", recursive=True)
-            [PosixPath('/tmp/subdir/file.py')]
+            >>> for path in FileSystemUtil.iter_files("/var/log", pattern="*.log"):
+            ...     print(path.name)
+            syslog.log
         """
         if directory is None or (isinstance(directory, str) and not directory.strip()):
             raise ValueError("Directory path cannot be None or empty string")
 
-        dir_obj = Path(directory)
+        dir_obj = _as_path(directory)
 
         if not dir_obj.exists():
             raise CustomFileNotFoundError(str(directory))
@@ -397,20 +533,34 @@ class FileSystemUtil:
             msg = f"Path is not a directory: {directory}"
             raise NotADirectoryError(msg)
 
-        try:
-            if pattern:
-                if recursive:
-                    # Use rglob for recursive pattern matching
-                    return [p for p in dir_obj.rglob(pattern) if p.is_file()]
-                else:
-                    # Use glob for non-recursive pattern matching
-                    return [p for p in dir_obj.glob(pattern) if p.is_file()]
-            elif recursive:
-                # List all files recursively
-                return [p for p in dir_obj.rglob("*") if p.is_file()]
-            else:
-                # List all files in directory (non-recursive)
-                return [p for p in dir_obj.iterdir() if p.is_file()]
-        except OSError as e:
-            msg = f"Failed to list files in '{directory}': {e}"
-            raise FileSystemError(msg) from e
+        return _iter_files(dir_obj, pattern, recursive)
+
+    @staticmethod
+    def list_files(
+        directory: PathLike, pattern: str | None = None, recursive: bool = False
+    ) -> list[Path]:
+        """List files in a directory with optional filtering.
+
+        Args:
+            directory: Directory path to list files from (string or Path object)
+            pattern: Optional glob pattern to filter files (e.g., "*.txt", "**/*.py")
+            recursive: If True, search recursively in subdirectories (default: False)
+
+        Returns:
+            List of Path objects representing the matching files
+
+        Raises:
+            FileNotFoundError: If directory doesn't exist
+            FileSystemError: If listing operation fails
+            ValueError: If directory is None or empty string
+            NotADirectoryError: If path is not a directory
+
+        Example:
+            >>> FileSystemUtil.list_files("/tmp")
+            [PosixPath('/tmp/file1.txt'), PosixPath('/tmp/file2.py')]
+            >>> FileSystemUtil.list_files("/tmp", pattern="*.txt")
+            [PosixPath('/tmp/file1.txt')]
+            >>> FileSystemUtil.list_files("/tmp", pattern="**/*.py", recursive=True)
+            [PosixPath('/tmp/subdir/file.py')]
+        """
+        return list(FileSystemUtil.iter_files(directory, pattern, recursive))
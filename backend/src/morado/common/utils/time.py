@@ -15,11 +15,40 @@ Example:
     local_now = TimeUtil.now_local()
 """
 
+from collections.abc import Iterable
 from datetime import UTC, datetime, timedelta
 from zoneinfo import ZoneInfo
 
 from .exceptions import TimeParseError
 
+_ZERO_DURATION = timedelta(0)
+
+
+def _duration(kwargs: dict) -> timedelta:
+    """Build the timedelta for the duration keyword arguments of a TimeUtil call.
+
+    Args:
+        kwargs: Duration components passed to the timedelta constructor.
+
+    Returns:
+        timedelta: The duration, or a shared zero duration if none was given.
+
+    Raises:
+        TypeError: If kwargs are invalid for timedelta.
+    """
+    if not kwargs:
+        return _ZERO_DURATION
+    try:
+        return timedelta(**kwargs)
+    except TypeError as e:
+        msg = f"Invalid duration arguments: {e!s}"
+        raise TypeError(msg)
+
+
+def _now(utc: bool) -> datetime:
+    """Get the current aware timestamp in UTC or in the local timezone."""
+    return datetime.now(UTC) if utc else datetime.now().astimezone()
+
 
 class TimeUtil:
     """Time utility class for common time operations.
@@ -431,13 +460,7 @@ class TimeUtil:
                 "dt.replace(tzinfo=timezone.utc)"
             )
 
-        try:
-            duration = timedelta(**kwargs)
-        except TypeError as e:
-            msg = f"Invalid duration arguments: {e!s}"
-            raise TypeError(msg)
-
-        return dt + duration
+        return dt + _duration(kwargs)
 
     @staticmethod
     def subtract_duration(dt: datetime, **kwargs) -> datetime:
@@ -495,13 +518,7 @@ class TimeUtil:
                 "dt.replace(tzinfo=timezone.utc)"
             )
 
-        try:
-            duration = timedelta(**kwargs)
-        except TypeError as e:
-            msg = f"Invalid duration arguments: {e!s}"
-            raise TypeError(msg)
-
-        return dt - duration
+        return dt - _duration(kwargs)
 
     @staticmethod
     def add_to_now(utc: bool = True, **kwargs) -> datetime:
@@ -535,8 +552,8 @@ class TimeUtil:
             or
             TimeUtil.add_duration(TimeUtil.now_local(), **kwargs)
         """
-        base_time = TimeUtil.now_utc() if utc else TimeUtil.now_local()
-        return TimeUtil.add_duration(base_time, **kwargs)
+        # The base time is always aware, so skip add_duration()'s checks
+        return _now(utc) + _duration(kwargs)
 
     @staticmethod
     def subtract_from_now(utc: bool = True, **kwargs) -> datetime:
@@ -570,8 +587,36 @@ class TimeUtil:
             or
             TimeUtil.subtract_duration(TimeUtil.now_local(), **kwargs)
         """
-        base_time = TimeUtil.now_utc() if utc else TimeUtil.now_local()
-        return TimeUtil.subtract_duration(base_time, **kwargs)
+        return _now(utc) - _duration(kwargs)
+
+    @staticmethod
+    def add_to_now_batch(
+        offsets: Iterable[timedelta], utc: bool = True
+    ) -> list[datetime]:
+        """Add several offsets to one reading of the current time.
+
+        Batch form of add_to_now() for callers computing many times at once
+        (expiry times, schedule windows). The clock is read once, so all
+        results are relative to the same instant, and no timedelta has to
+        be built from keyword arguments per item.
+
+        Args:
+            offsets: Offsets to add; negative offsets give past times.
+            utc: If True, uses UTC time; if False, uses local time. Default is True.
+
+        Returns:
+            list[datetime]: Timezone-aware datetimes, one per offset, in order.
+
+        Example:
+            >>> from datetime import timedelta
+            >>> from morado.common.utils.time import TimeUtil
+            >>> # Start of each of the last 7 days, relative to now
+            >>> days = TimeUtil.add_to_now_batch(timedelta(days=-d) for d in range(7))
+            >>> len(days)
+            7
+        """
+        now = _now(utc)
+        return [now + offset for offset in offsets]
 
     @staticmethod
     def add_to_time(dt: datetime | None = None, utc: bool = True, **kwargs) -> datetime:
@@ -614,14 +659,12 @@ class TimeUtil:
             for maximum flexibility.
         """
         if dt is None:
-            base_time = TimeUtil.now_utc() if utc else TimeUtil.now_local()
-        else:
-            if not isinstance(dt, datetime):
-                msg = f"Expected datetime object or None, got {type(dt).__name__}"
-                raise TypeError(msg)
-            base_time = dt
+            return _now(utc) + _duration(kwargs)
+        if not isinstance(dt, datetime):
+            msg = f"Expected datetime object or None, got {type(dt).__name__}"
+            raise TypeError(msg)
 
-        return TimeUtil.add_duration(base_time, **kwargs)
+        return TimeUtil.add_duration(dt, **kwargs)
 
     @staticmethod
     def subtract_from_time(
@@ -666,14 +709,12 @@ class TimeUtil:
             subtract_from_now() for maximum flexibility.
         """
         if dt is None:
-            base_time = TimeUtil.now_utc() if utc else TimeUtil.now_local()
-        else:
-            if not isinstance(dt, datetime):
-                msg = f"Expected datetime object or None, got {type(dt).__name__}"
-                raise TypeError(msg)
-            base_time = dt
+            return _now(utc) - _duration(kwargs)
+        if not isinstance(dt, datetime):
+            msg = f"Expected datetime object or None, got {type(dt).__name__}"
+            raise TypeError(msg)
 
-        return TimeUtil.subtract_duration(base_time, **kwargs)
+        return TimeUtil.subtract_duration(dt, **kwargs)
 
     @staticmethod
     def convert_timezone(dt: datetime, target_tz: str | ZoneInfo) -> datetime:
@@ -4,6 +4,8 @@ Enhanced UUID generation utility module
 Supports multiple formats, charsets, prefixes/suffixes, and length constraints
 """
 
+import functools
+import os
 import random
 import secrets
 import string
@@ -14,6 +16,28 @@ from typing import Any, Literal
 
 from pydantic import BaseModel, field_validator, model_validator
 
+# Default random-part charset, shared by every default argument below
+_DEFAULT_ALPHANUMERIC = string.ascii_uppercase + string.digits
+
+
+@functools.lru_cache(maxsize=32)
+def _byte_tables(charset: str) -> tuple[bytes, bytes] | None:
+    """
+    Build the bytes.translate() tables mapping random bytes onto a charset
+    Bytes at or above the largest multiple of len(charset) are deleted
+    instead of mapped, so every character stays equally likely
+    :param charset: Character set to map onto
+    :return: (translation table, rejected bytes), or None for charsets that
+        are not single-byte ASCII
+    """
+    if not charset.isascii() or len(charset) > 256:
+        return None
+    charset_bytes = charset.encode("ascii")
+    size = len(charset_bytes)
+    limit = 256 - 256 % size
+    table = bytes(charset_bytes[b % size] for b in range(256))
+    return table, bytes(range(limit, 256))
+
 
 class UUIDConfig(BaseModel):
     """Configuration for UUID generation"""
@@ -24,7 +48,7 @@ class UUIDConfig(BaseModel):
     prefix: str = ""
     suffix: str = ""
     length: int | None = 38
-    charset: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789"
+    charset: str = _DEFAULT_ALPHANUMERIC
     use_timestamp: bool = True
     secure: bool = True
 
@@ -73,7 +97,7 @@ class UUIDGenerator:
     # Predefined character sets
     NUMERIC = string.digits
     ALPHANUMERIC_LOWER = string.ascii_lowercase + string.digits
-    ALPHANUMERIC_UPPER = string.ascii_uppercase + string.digits
+    ALPHANUMERIC_UPPER = _DEFAULT_ALPHANUMERIC
     ALPHANUMERIC_MIXED = string.ascii_letters + string.digits
     HEX = string.digits + "ABCDEF"
 
@@ -126,6 +150,39 @@ class UUIDGenerator:
         """
         return str(stdlib_uuid.uuid4())
 
+    @staticmethod
+    def uuid4_bytes() -> bytes:
+        """
+        Generate a standard RFC 4122 UUID4 as its 16 raw bytes
+        For storage as BINARY(16)/BLOB, skips building the UUID object and
+        its hex string form
+        :return: 16 bytes, equal to uuid.UUID(...).bytes of a UUID4
+        """
+        raw = bytearray(os.urandom(16))
+        raw[6] = raw[6] & 0x0F | 0x40  # version 4
+        raw[8] = raw[8] & 0x3F | 0x80  # RFC 4122 variant
+        return bytes(raw)
+
+    @staticmethod
+    def uuid4_many(count: int) -> list[str]:
+        """
+        Generate several standard RFC 4122 UUID4s at once
+        Reads the random bytes for all UUIDs in one os.urandom() call (the
+        source uuid.uuid4() uses) and formats them without UUID objects
+        :param count: Number of UUIDs to generate
+        :return: List of UUID4 strings in standard format
+        """
+        raw = bytearray(os.urandom(16 * count))
+        # Set the version (4) and RFC 4122 variant bits of every UUID
+        raw[6::16] = bytes(b & 0x0F | 0x40 for b in raw[6::16])
+        raw[8::16] = bytes(b & 0x3F | 0x80 for b in raw[8::16])
+        hexed = raw.hex()
+        return [
+            f"{hexed[i : i + 8]}-{hexed[i + 8 : i + 12]}-{hexed[i + 12 : i + 16]}"
+            f"-{hexed[i + 16 : i + 20]}-{hexed[i + 20 : i + 32]}"
+            for i in range(0, 32 * count, 32)
+        ]
+
     @staticmethod
     def ulid() -> str:
         """
@@ -155,7 +212,7 @@ class UUIDGenerator:
         length: int = 38,
         prefix: str = "",
         suffix: str = "",
-        charset: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+        charset: str = _DEFAULT_ALPHANUMERIC,
         use_timestamp: bool = False,
         secure: bool = True,
     ) -> str:
@@ -169,14 +226,54 @@ class UUIDGenerator:
         :param secure: Whether to use cryptographically secure random
         :return: Alphanumeric ID string
         """
+        # Plain random characters need none of the prefix/suffix handling
+        if not (prefix or suffix or use_timestamp) and length > 0:
+            return UUIDGenerator._generate_random_string(length, charset, secure)
+
         return UUIDGenerator._generate_custom(
-            prefix=prefix,
-            suffix=suffix,
-            length=length,
-            charset=charset,
-            use_timestamp=use_timestamp,
-            secure=secure,
+            prefix, suffix, length, charset, use_timestamp, secure
+        )
+
+    @staticmethod
+    def alphanumeric_many(
+        count: int,
+        length: int = 38,
+        prefix: str = "",
+        suffix: str = "",
+        charset: str = _DEFAULT_ALPHANUMERIC,
+        use_timestamp: bool = False,
+        secure: bool = True,
+    ) -> list[str]:
+        """
+        Generate several alphanumeric IDs at once
+        Draws the random parts of all IDs as one random string and slices it,
+        so the secure path makes one token_bytes() call for the whole batch
+        :param count: Number of IDs to generate
+        :param length: Total length of each ID (default: 38)
+        :param prefix: Prefix string
+        :param suffix: Suffix string
+        :param charset: Character set to use
+        :param use_timestamp: Whether to include timestamp (shared by the batch)
+        :param secure: Whether to use cryptographically secure random
+        :return: List of alphanumeric ID strings
+        """
+        head = prefix
+        if use_timestamp:
+            head += UUIDGenerator._generate_timestamp_prefix()
+            if len(head) - len(prefix) > length:
+                raise ValueError("Timestamp prefix exceeds specified total length")
+
+        rand_len = length - len(head) - len(suffix)
+        if rand_len <= 0:
+            raise ValueError("Prefix/suffix length exceeds or equals total length")
+
+        random_part = UUIDGenerator._generate_random_string(
+            count * rand_len, charset, secure
         )
+        return [
+            head + random_part[i : i + rand_len] + suffix
+            for i in range(0, count * rand_len, rand_len)
+        ]
 
     @staticmethod
     def numeric(
@@ -193,6 +290,12 @@ class UUIDGenerator:
         :param use_timestamp: Whether to include timestamp
         :return: Numeric ID string
         """
+        # Plain random digits need none of the prefix/suffix handling
+        if not (prefix or suffix or use_timestamp) and length > 0:
+            return UUIDGenerator._generate_random_string(
+                length, UUIDGenerator.NUMERIC, True
+            )
+
         # Validate prefix and suffix are numeric
         if prefix and not prefix.isdigit():
             raise ValueError("Prefix must be numeric for numeric UUID")
@@ -200,12 +303,7 @@ class UUIDGenerator:
             raise ValueError("Suffix must be numeric for numeric UUID")
 
         return UUIDGenerator._generate_custom(
-            prefix=prefix,
-            suffix=suffix,
-            length=length,
-            charset=UUIDGenerator.NUMERIC,
-            use_timestamp=use_timestamp,
-            secure=True,
+            prefix, suffix, length, UUIDGenerator.NUMERIC, use_timestamp, True
         )
 
     @staticmethod
@@ -227,7 +325,30 @@ class UUIDGenerator:
         :return: Random string
         """
         if secure:
-            return "".join(secrets.choice(charset) for _ in range(length))
+            # Oversample by a quarter so one token_bytes() call nearly always
+            # survives rejection
+            chunk = length + (length >> 2) + 1
+            tables = _byte_tables(charset)
+            if tables is None:
+                size = len(charset)
+                if size > 256:
+                    return "".join(secrets.choice(charset) for _ in range(length))
+                # Same rejection sampling as the tables, one character at a
+                # time, instead of an os.urandom() call per character
+                limit = 256 - 256 % size
+                picked: list[str] = []
+                while len(picked) < length:
+                    picked += [
+                        charset[b % size]
+                        for b in secrets.token_bytes(chunk)
+                        if b < limit
+                    ]
+                return "".join(picked[:length])
+            table, rejected = tables
+            result = b""
+            while len(result) < length:
+                result += secrets.token_bytes(chunk).translate(table, rejected)
+            return result[:length].decode("ascii")
         else:
             return "".join(random.choices(charset, k=length))
 
@@ -236,7 +357,7 @@ class UUIDGenerator:
         prefix: str = "",
         suffix: str = "",
         length: int | None = None,
-        charset: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+        charset: str = _DEFAULT_ALPHANUMERIC,
         use_timestamp: bool = False,
         secure: bool = False,
     ) -> str:
@@ -299,7 +420,7 @@ def generate_alphanumeric(
     length: int = 38,
     prefix: str = "",
     suffix: str = "",
-    charset: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+    charset: str = _DEFAULT_ALPHANUMERIC,
     use_timestamp: bool = False,
     secure: bool = True,
 ) -> str:
@@ -328,7 +449,7 @@ def generate_custom_uuid(
     prefix: str = "",
     suffix: str = "",
     length: int | None = None,
-    charset: str = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789",
+    charset: str = _DEFAULT_ALPHANUMERIC,
     random_part_length: int | None = None,
     use_timestamp: bool = False,
     secure: bool = False,
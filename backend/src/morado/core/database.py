@@ -7,7 +7,7 @@ and initialization for the Morado application using SQLAlchemy.
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -22,6 +22,26 @@ from morado.core.config import get_settings
 logger = get_logger(__name__)
 
 
+def enable_sqlite_foreign_keys(engine: Engine) -> None:
+    """Enforce foreign keys on every new connection of a SQLite engine.
+
+    SQLite ignores ``FOREIGN KEY`` constraints, including their
+    ``ON DELETE`` rules, unless each connection turns them on. Engines for
+    other databases are left unchanged.
+
+    Args:
+        engine: Synchronous engine, or the ``sync_engine`` of an async one
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models.
 
@@ -84,7 +104,9 @@ class DatabaseManager:
                 if "@" in db_url
                 else db_url,  # Hide credentials
                 "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
                 "echo": settings.database_echo,
+                "query_cache_size": settings.database_query_cache_size,
             },
         )
 
@@ -92,13 +114,22 @@ class DatabaseManager:
         async_db_url = db_url.replace("postgresql://", "postgresql+asyncpg://")
 
         try:
+            # psycopg2 batches executemany via execute_values/execute_batch
+            # only when asked to; other drivers do not accept the option.
+            engine_options = {}
+            if make_url(db_url).get_driver_name() == "psycopg2":
+                engine_options["executemany_mode"] = "values_plus_batch"
+
             # Create synchronous engine
             self.engine = create_engine(
                 db_url,
                 pool_size=settings.database_pool_size,
-                max_overflow=20,
+                max_overflow=settings.database_max_overflow,
                 pool_pre_ping=True,
+                pool_recycle=settings.database_pool_recycle,
                 echo=settings.database_echo,
+                query_cache_size=settings.database_query_cache_size,
+                **engine_options,
             )
             logger.debug("Synchronous database engine created")
 
@@ -106,12 +137,17 @@ class DatabaseManager:
             self.async_engine = create_async_engine(
                 async_db_url,
                 pool_size=settings.database_pool_size,
-                max_overflow=20,
+                max_overflow=settings.database_max_overflow,
                 pool_pre_ping=True,
+                pool_recycle=settings.database_pool_recycle,
                 echo=settings.database_echo,
+                query_cache_size=settings.database_query_cache_size,
             )
             logger.debug("Asynchronous database engine created")
 
+            enable_sqlite_foreign_keys(self.engine)
+            enable_sqlite_foreign_keys(self.async_engine.sync_engine)
+
             # Create session factories
             self.session_factory = sessionmaker(
                 bind=self.engine,
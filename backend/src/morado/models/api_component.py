@@ -196,7 +196,7 @@ class Body(Base, TimestampMixin, UUIDMixin):
 
     # Body内容
     body_type: Mapped[BodyType] = mapped_column(
-        Enum(BodyType), default=BodyType.REQUEST, comment="Body类型"
+        Enum(BodyType), default=BodyType.REQUEST, index=True, comment="Body类型"
     )
     content_type: Mapped[str] = mapped_column(
         String(100), default="application/json", comment="内容类型"
@@ -314,7 +314,7 @@ class ApiDefinition(Base, TimestampMixin, UUIDMixin):
 
     # API基本信息
     method: Mapped[HttpMethod] = mapped_column(
-        Enum(HttpMethod), nullable=False, comment="HTTP方法"
+        Enum(HttpMethod), nullable=False, index=True, comment="HTTP方法"
     )
     path: Mapped[str] = mapped_column(String(500), nullable=False, comment="API路径")
     base_url: Mapped[str | None] = mapped_column(String(500), comment="基础URL")
@@ -6,7 +6,7 @@ that all specific repositories inherit from.
 
 from typing import Any, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import delete, func, insert, inspect, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
@@ -42,6 +42,7 @@ class BaseRepository[ModelType: Base]:
             model: SQLAlchemy model class
         """
         self.model = model
+        self._column_names = frozenset(attr.key for attr in inspect(model).column_attrs)
 
     # Synchronous methods
 
@@ -122,8 +123,6 @@ class BaseRepository[ModelType: Base]:
             >>> total = repo.count(session)
             >>> active_count = repo.count(session, filters={"is_active": True})
         """
-        from sqlalchemy import func
-
         stmt = select(func.count()).select_from(self.model)
 
         if filters:
@@ -152,6 +151,50 @@ class BaseRepository[ModelType: Base]:
         session.refresh(instance)
         return instance
 
+    def create_returning(self, session: Session, **kwargs: Any) -> ModelType:
+        """Create a new record with a single INSERT ... RETURNING statement.
+
+        Unlike create(), server-generated values are returned by the INSERT
+        itself, so no separate refresh SELECT is issued.
+
+        Args:
+            session: Database session
+            **kwargs: Field values for the new record
+
+        Returns:
+            Created model instance
+
+        Example:
+            >>> user = repo.create_returning(session, name="John")
+        """
+        stmt = insert(self.model).values(**kwargs).returning(self.model)
+        return session.scalars(stmt).one()
+
+    def create_many(
+        self, session: Session, rows: list[dict[str, Any]]
+    ) -> list[ModelType]:
+        """Create multiple records with a single batched INSERT.
+
+        All rows are sent as one executemany statement, which SQLAlchemy
+        renders as multi-row ``INSERT ... VALUES`` (insertmanyvalues) on
+        supporting dialects. Rows should share the same set of keys.
+
+        Args:
+            session: Database session
+            rows: Field values for each new record
+
+        Returns:
+            Created model instances in the same order as ``rows``
+
+        Example:
+            >>> users = repo.create_many(session, [{"name": "John"}, {"name": "Jane"}])
+        """
+        if not rows:
+            return []
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        return list(session.scalars(stmt, rows).all())
+
     def update(self, session: Session, instance: ModelType, **kwargs: Any) -> ModelType:
         """Update an existing record.
 
@@ -175,6 +218,68 @@ class BaseRepository[ModelType: Base]:
         session.refresh(instance)
         return instance
 
+    def update_by_id(
+        self, session: Session, record_id: int, **kwargs: Any
+    ) -> ModelType | None:
+        """Update a record by ID with a single UPDATE ... RETURNING statement.
+
+        The record is not loaded first; fields that are not mapped columns
+        are ignored.
+
+        Args:
+            session: Database session
+            record_id: Record ID
+            **kwargs: Field values to update
+
+        Returns:
+            Updated model instance or None if not found
+
+        Example:
+            >>> user = repo.update_by_id(session, 1, name="Jane")
+        """
+        values = {
+            field: value
+            for field, value in kwargs.items()
+            if field in self._column_names
+        }
+        if not values:
+            return self.get_by_id(session, record_id)
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == record_id)  # type: ignore[attr-defined]
+            .values(**values)
+            .returning(self.model)
+        )
+        return session.execute(stmt).scalar_one_or_none()
+
+    def update_many(self, session: Session, rows: list[dict[str, Any]]) -> None:
+        """Update multiple records by primary key with one batched UPDATE.
+
+        Uses the ORM bulk UPDATE by primary key path: every row must contain
+        the record ``id`` and is sent as part of a single executemany
+        statement. Fields that are not mapped columns are ignored.
+
+        Args:
+            session: Database session
+            rows: Record ID and field values to update for each record
+
+        Example:
+            >>> repo.update_many(session, [{"id": 1, "name": "Jane"}])
+        """
+        if not rows:
+            return
+
+        values = [
+            {
+                field: value
+                for field, value in row.items()
+                if field in self._column_names
+            }
+            for row in rows
+        ]
+        session.execute(update(self.model), values)
+
     def delete(self, session: Session, instance: ModelType) -> None:
         """Delete a record.
 
@@ -208,6 +313,26 @@ class BaseRepository[ModelType: Base]:
             return True
         return False
 
+    def delete_by_id_without_load(self, session: Session, record_id: int) -> bool:
+        """Delete a record by ID with a single DELETE statement.
+
+        Unlike delete_by_id(), the record is not loaded first, so ORM-level
+        cascades do not run; dependent rows are removed by the database's
+        ``ON DELETE`` rules.
+
+        Args:
+            session: Database session
+            record_id: Record ID
+
+        Returns:
+            True if deleted, False if not found
+
+        Example:
+            >>> success = repo.delete_by_id_without_load(session, 1)
+        """
+        stmt = delete(self.model).where(self.model.id == record_id)  # type: ignore[attr-defined]
+        return session.execute(stmt).rowcount > 0
+
     # Asynchronous methods
 
     async def get_by_id_async(
@@ -293,7 +418,7 @@ class BaseRepository[ModelType: Base]:
         Example:
             >>> total = await repo.count_async(session)
         """
-        stmt = select(self.model)
+        stmt = select(func.count()).select_from(self.model)
 
         if filters:
             for field, value in filters.items():
@@ -322,6 +447,47 @@ class BaseRepository[ModelType: Base]:
         await session.refresh(instance)
         return instance
 
+    async def create_returning_async(
+        self, session: AsyncSession, **kwargs: Any
+    ) -> ModelType:
+        """Create a new record with a single INSERT ... RETURNING statement (async).
+
+        Args:
+            session: Async database session
+            **kwargs: Field values for the new record
+
+        Returns:
+            Created model instance
+
+        Example:
+            >>> user = await repo.create_returning_async(session, name="John")
+        """
+        stmt = insert(self.model).values(**kwargs).returning(self.model)
+        result = await session.scalars(stmt)
+        return result.one()
+
+    async def create_many_async(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> list[ModelType]:
+        """Create multiple records with a single batched INSERT (async).
+
+        Args:
+            session: Async database session
+            rows: Field values for each new record
+
+        Returns:
+            Created model instances in the same order as ``rows``
+
+        Example:
+            >>> users = await repo.create_many_async(session, [{"name": "John"}])
+        """
+        if not rows:
+            return []
+
+        stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+        result = await session.scalars(stmt, rows)
+        return list(result.all())
+
     async def update_async(
         self, session: AsyncSession, instance: ModelType, **kwargs: Any
     ) -> ModelType:
@@ -347,6 +513,64 @@ class BaseRepository[ModelType: Base]:
         await session.refresh(instance)
         return instance
 
+    async def update_by_id_async(
+        self, session: AsyncSession, record_id: int, **kwargs: Any
+    ) -> ModelType | None:
+        """Update a record by ID with a single UPDATE ... RETURNING statement (async).
+
+        Args:
+            session: Async database session
+            record_id: Record ID
+            **kwargs: Field values to update
+
+        Returns:
+            Updated model instance or None if not found
+
+        Example:
+            >>> user = await repo.update_by_id_async(session, 1, name="Jane")
+        """
+        values = {
+            field: value
+            for field, value in kwargs.items()
+            if field in self._column_names
+        }
+        if not values:
+            return await self.get_by_id_async(session, record_id)
+
+        stmt = (
+            update(self.model)
+            .where(self.model.id == record_id)  # type: ignore[attr-defined]
+            .values(**values)
+            .returning(self.model)
+        )
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def update_many_async(
+        self, session: AsyncSession, rows: list[dict[str, Any]]
+    ) -> None:
+        """Update multiple records by primary key with one batched UPDATE (async).
+
+        Args:
+            session: Async database session
+            rows: Record ID and field values to update for each record
+
+        Example:
+            >>> await repo.update_many_async(session, [{"id": 1, "name": "Jane"}])
+        """
+        if not rows:
+            return
+
+        values = [
+            {
+                field: value
+                for field, value in row.items()
+                if field in self._column_names
+            }
+            for row in rows
+        ]
+        await session.execute(update(self.model), values)
+
     async def delete_async(self, session: AsyncSession, instance: ModelType) -> None:
         """Delete a record (async).
 
@@ -379,3 +603,22 @@ class BaseRepository[ModelType: Base]:
             await self.delete_async(session, instance)
             return True
         return False
+
+    async def delete_by_id_without_load_async(
+        self, session: AsyncSession, record_id: int
+    ) -> bool:
+        """Delete a record by ID with a single DELETE statement (async).
+
+        Args:
+            session: Async database session
+            record_id: Record ID
+
+        Returns:
+            True if deleted, False if not found
+
+        Example:
+            >>> success = await repo.delete_by_id_without_load_async(session, 1)
+        """
+        stmt = delete(self.model).where(self.model.id == record_id)  # type: ignore[attr-defined]
+        result = await session.execute(stmt)
+        return result.rowcount > 0
@@ -4,10 +4,26 @@ This module provides data access methods for TestCase, TestCaseScript,
 and TestCaseComponent models.
 """
 
-from sqlalchemy import select
+from collections.abc import Iterator
+from typing import Literal
+
+from sqlalchemy import (
+    Insert,
+    Integer,
+    Select,
+    Update,
+    insert,
+    literal,
+    select,
+    union_all,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
+from sqlalchemy.orm.interfaces import LoaderOption
 
+from morado.models.component import TestComponent
+from morado.models.script import TestScript
 from morado.models.test_case import (
     TestCase,
     TestCaseComponent,
@@ -17,6 +33,157 @@ from morado.models.test_case import (
 )
 from morado.repositories.base import BaseRepository
 
+LoaderStrategy = Literal["selectin", "joined"]
+
+
+def _relation_options(strategy: LoaderStrategy) -> tuple[LoaderOption, ...]:
+    """Build loader options for a test case with scripts and components.
+
+    ``selectin`` issues one extra SELECT per collection and avoids the
+    cartesian row blow-up of joining two collections; ``joined`` loads
+    everything in a single query. Relationships that are not part of the
+    result are set to raise on access so accidental lazy loads surface.
+
+    Args:
+        strategy: Eager loading strategy for the collections
+
+    Returns:
+        Tuple of loader options
+    """
+    loader = selectinload if strategy == "selectin" else joinedload
+    return (
+        loader(TestCase.test_case_scripts).joinedload(TestCaseScript.script),
+        loader(TestCase.test_case_components).joinedload(TestCaseComponent.component),
+        raiseload(TestCase.creator),
+        raiseload(TestCase.test_suite_cases),
+        raiseload(TestCase.executions),
+    )
+
+
+def _filtered_select(
+    status: TestCaseStatus | None,
+    priority: TestCasePriority | None,
+    category: str | None,
+    environment: str | None,
+    automated_only: bool,
+    tags: list[str] | None,
+) -> Select[tuple[TestCase]]:
+    """Build a test case SELECT with one WHERE clause per given filter.
+
+    Args:
+        status: Filter by status
+        priority: Filter by priority
+        category: Filter by category
+        environment: Filter by environment
+        automated_only: Only automated test cases; implies active status
+            unless ``status`` is given
+        tags: Filter by tags
+
+    Returns:
+        SELECT statement for matching test cases
+    """
+    stmt = select(TestCase)
+
+    if automated_only:
+        stmt = stmt.where(TestCase.is_automated)
+        if status is None:
+            status = TestCaseStatus.ACTIVE
+    if status is not None:
+        stmt = stmt.where(TestCase.status == status)
+    if priority is not None:
+        stmt = stmt.where(TestCase.priority == priority)
+    if category is not None:
+        stmt = stmt.where(TestCase.category == category)
+    if environment is not None:
+        stmt = stmt.where(TestCase.environment == environment)
+    if tags:
+        stmt = stmt.where(TestCase.tags.contains(tags))
+
+    return stmt
+
+
+def _execution_settings_select(test_case_id: int) -> Select:
+    """Build the SELECT of the execution-relevant columns of a test case.
+
+    Args:
+        test_case_id: Test case ID
+
+    Returns:
+        SELECT statement returning at most one row
+    """
+    return select(
+        TestCase.id,
+        TestCase.uuid,
+        TestCase.name,
+        TestCase.description,
+        TestCase.priority,
+        TestCase.status,
+        TestCase.category,
+        TestCase.execution_order,
+        TestCase.timeout,
+        TestCase.retry_count,
+        TestCase.continue_on_failure,
+        TestCase.test_data,
+        TestCase.environment,
+    ).where(TestCase.id == test_case_id)
+
+
+def _execution_items_select(test_case_id: int) -> Select:
+    """Build the UNION ALL of enabled scripts and components of a test case.
+
+    Args:
+        test_case_id: Test case ID
+
+    Returns:
+        SELECT statement ordered by execution order, scripts first on ties
+    """
+    scripts = (
+        select(
+            literal("script").label("type"),
+            TestCaseScript.execution_order.label("order"),
+            TestCaseScript.script_id.label("id"),
+            TestScript.name.label("name"),
+            TestCaseScript.script_parameters.label("parameters"),
+            TestCaseScript.description.label("description"),
+        )
+        .join(TestScript, TestCaseScript.script_id == TestScript.id)
+        .where(TestCaseScript.test_case_id == test_case_id)
+        .where(TestCaseScript.is_enabled.is_(True))
+    )
+    components = (
+        select(
+            literal("component").label("type"),
+            TestCaseComponent.execution_order.label("order"),
+            TestCaseComponent.component_id.label("id"),
+            TestComponent.name.label("name"),
+            TestCaseComponent.component_parameters.label("parameters"),
+            TestCaseComponent.description.label("description"),
+        )
+        .join(TestComponent, TestCaseComponent.component_id == TestComponent.id)
+        .where(TestCaseComponent.test_case_id == test_case_id)
+        .where(TestCaseComponent.is_enabled.is_(True))
+    )
+    items = union_all(scripts, components).subquery()
+    return select(items).order_by(items.c.order, items.c.type.desc())
+
+
+def _status_update(test_case_id: int, status: TestCaseStatus) -> Update:
+    """Build the UPDATE setting the status of a test case.
+
+    Args:
+        test_case_id: Test case ID
+        status: New test case status
+
+    Returns:
+        UPDATE statement
+    """
+    return (
+        update(TestCase)
+        .where(TestCase.id == test_case_id)
+        .values(status=status)
+        .execution_options(synchronize_session="evaluate")
+    )
+
 
 class TestCaseRepository(BaseRepository[TestCase]):
     """Repository for TestCase model.
@@ -34,6 +201,28 @@ class TestCaseRepository(BaseRepository[TestCase]):
         """Initialize TestCase repository."""
         super().__init__(TestCase)
 
+    def get_without_relations(
+        self, session: Session, test_case_id: int
+    ) -> TestCase | None:
+        """Get test case by ID with every relationship set to raise on access.
+
+        Accessing any relationship of the returned instance raises instead of
+        silently emitting a lazy-load SELECT, so a missing eager load shows up
+        as a bug rather than as an N+1 query pattern.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+
+        Returns:
+            TestCase instance or None
+
+        Example:
+            >>> test_case = repo.get_without_relations(session, 1)
+            >>> test_case.test_case_scripts  # raises InvalidRequestError
+        """
+        return session.get(TestCase, test_case_id, options=[raiseload("*")])
+
     def get_with_scripts(self, session: Session, test_case_id: int) -> TestCase | None:
         """Get test case with associated scripts.
 
@@ -87,13 +276,18 @@ class TestCaseRepository(BaseRepository[TestCase]):
         return session.execute(stmt).unique().scalar_one_or_none()
 
     def get_with_relations(
-        self, session: Session, test_case_id: int
+        self,
+        session: Session,
+        test_case_id: int,
+        loader_strategy: LoaderStrategy = "selectin",
     ) -> TestCase | None:
         """Get test case with all relations (scripts and components).
 
         Args:
             session: Database session
             test_case_id: Test case ID
+            loader_strategy: Eager loading strategy for the collections
+                (selectin/joined)
 
         Returns:
             TestCase instance with all relations loaded, or None
@@ -106,14 +300,7 @@ class TestCaseRepository(BaseRepository[TestCase]):
         stmt = (
             select(TestCase)
             .where(TestCase.id == test_case_id)
-            .options(
-                joinedload(TestCase.test_case_scripts).joinedload(
-                    TestCaseScript.script
-                ),
-                joinedload(TestCase.test_case_components).joinedload(
-                    TestCaseComponent.component
-                ),
-            )
+            .options(*_relation_options(loader_strategy))
         )
         return session.execute(stmt).unique().scalar_one_or_none()
 
@@ -293,8 +480,175 @@ class TestCaseRepository(BaseRepository[TestCase]):
         )
         return list(session.execute(stmt).scalars().all())
 
+    def get_filtered(
+        self,
+        session: Session,
+        status: TestCaseStatus | None = None,
+        priority: TestCasePriority | None = None,
+        category: str | None = None,
+        environment: str | None = None,
+        automated_only: bool = False,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TestCase]:
+        """Get test cases matching all of the given filters.
+
+        Every filter that is set becomes a WHERE predicate of a single query,
+        so filters can be freely combined.
+
+        Args:
+            session: Database session
+            status: Filter by status
+            priority: Filter by priority
+            category: Filter by category
+            environment: Filter by environment
+            automated_only: Only automated test cases; implies active status
+                unless ``status`` is given
+            tags: Filter by tags
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of TestCase instances
+
+        Example:
+            >>> cases = repo.get_filtered(
+            ...     session, status=TestCaseStatus.ACTIVE, priority=TestCasePriority.HIGH
+            ... )
+        """
+        stmt = _filtered_select(
+            status, priority, category, environment, automated_only, tags
+        )
+        stmt = stmt.offset(skip).limit(limit)
+        return list(session.execute(stmt).scalars().all())
+
+    def iter_filtered(
+        self,
+        session: Session,
+        status: TestCaseStatus | None = None,
+        priority: TestCasePriority | None = None,
+        category: str | None = None,
+        environment: str | None = None,
+        automated_only: bool = False,
+        tags: list[str] | None = None,
+        yield_per: int = 1000,
+    ) -> Iterator[TestCase]:
+        """Stream test cases matching all of the given filters.
+
+        Rows are fetched through a server-side cursor in chunks of
+        ``yield_per``, so only one chunk of instances is held in memory at a
+        time. The session must not be committed while iterating.
+
+        Args:
+            session: Database session
+            status: Filter by status
+            priority: Filter by priority
+            category: Filter by category
+            environment: Filter by environment
+            automated_only: Only automated test cases; implies active status
+                unless ``status`` is given
+            tags: Filter by tags
+            yield_per: Number of rows fetched per chunk
+
+        Returns:
+            Iterator over TestCase instances
+
+        Example:
+            >>> for test_case in repo.iter_filtered(session, status=TestCaseStatus.ACTIVE):
+            ...     print(test_case.name)
+        """
+        stmt = _filtered_select(
+            status, priority, category, environment, automated_only, tags
+        ).execution_options(yield_per=yield_per)
+        return iter(session.execute(stmt).scalars())
+
+    def get_execution_settings(
+        self, session: Session, test_case_id: int
+    ) -> dict | None:
+        """Get the columns of a test case needed to execute it.
+
+        Only the execution-relevant columns are selected and returned as a
+        dictionary, so no TestCase instance is constructed.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+
+        Returns:
+            Dictionary of test case settings, or None if not found
+
+        Example:
+            >>> settings = repo.get_execution_settings(session, 1)
+            >>> print(settings["timeout"])
+        """
+        stmt = _execution_settings_select(test_case_id)
+        row = session.execute(stmt).mappings().first()
+        return dict(row) if row is not None else None
+
+    def get_execution_items(self, session: Session, test_case_id: int) -> list[dict]:
+        """Get enabled scripts and components of a test case in execution order.
+
+        Scripts and components are combined with UNION ALL and ordered by the
+        database, returning plain dictionaries without loading ORM instances.
+        Scripts come before components that share the same execution order.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+
+        Returns:
+            List of dictionaries with ``type``, ``order``, ``id``, ``name``,
+            ``parameters`` and ``description`` keys
+
+        Example:
+            >>> for item in repo.get_execution_items(session, 1):
+            ...     print(f"{item['order']}: {item['type']} {item['name']}")
+        """
+        stmt = _execution_items_select(test_case_id)
+        return [dict(row) for row in session.execute(stmt).mappings()]
+
+    def update_status(
+        self, session: Session, test_case_id: int, status: TestCaseStatus
+    ) -> bool:
+        """Set the status of a test case with a single UPDATE statement.
+
+        No SELECT is issued and no ORM instance is loaded; a matching instance
+        already present in the session gets the new status applied in Python.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+            status: New test case status
+
+        Returns:
+            True if a row was updated, False if the test case does not exist
+
+        Example:
+            >>> repo.update_status(session, 1, TestCaseStatus.ACTIVE)
+        """
+        stmt = _status_update(test_case_id, status)
+        return session.execute(stmt).rowcount > 0
+
     # Async methods
 
+    async def get_without_relations_async(
+        self, session: AsyncSession, test_case_id: int
+    ) -> TestCase | None:
+        """Get test case by ID with every relationship set to raise (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            TestCase instance or None
+
+        Example:
+            >>> test_case = await repo.get_without_relations_async(session, 1)
+        """
+        return await session.get(TestCase, test_case_id, options=[raiseload("*")])
+
     async def get_with_scripts_async(
         self, session: AsyncSession, test_case_id: int
     ) -> TestCase | None:
@@ -315,7 +669,7 @@ class TestCaseRepository(BaseRepository[TestCase]):
             )
         )
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_with_components_async(
         self, session: AsyncSession, test_case_id: int
@@ -339,16 +693,21 @@ class TestCaseRepository(BaseRepository[TestCase]):
             )
         )
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_with_relations_async(
-        self, session: AsyncSession, test_case_id: int
+        self,
+        session: AsyncSession,
+        test_case_id: int,
+        loader_strategy: LoaderStrategy = "selectin",
     ) -> TestCase | None:
         """Get test case with all relations (async).
 
         Args:
             session: Async database session
             test_case_id: Test case ID
+            loader_strategy: Eager loading strategy for the collections
+                (selectin/joined)
 
         Returns:
             TestCase instance with all relations loaded, or None
@@ -356,17 +715,10 @@ class TestCaseRepository(BaseRepository[TestCase]):
         stmt = (
             select(TestCase)
             .where(TestCase.id == test_case_id)
-            .options(
-                joinedload(TestCase.test_case_scripts).joinedload(
-                    TestCaseScript.script
-                ),
-                joinedload(TestCase.test_case_components).joinedload(
-                    TestCaseComponent.component
-                ),
-            )
+            .options(*_relation_options(loader_strategy))
         )
         result = await session.execute(stmt)
-        return result.scalar_one_or_none()
+        return result.unique().scalar_one_or_none()
 
     async def get_by_status_async(
         self,
@@ -465,6 +817,90 @@ class TestCaseRepository(BaseRepository[TestCase]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_filtered_async(
+        self,
+        session: AsyncSession,
+        status: TestCaseStatus | None = None,
+        priority: TestCasePriority | None = None,
+        category: str | None = None,
+        environment: str | None = None,
+        automated_only: bool = False,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TestCase]:
+        """Get test cases matching all of the given filters (async).
+
+        Args:
+            session: Async database session
+            status: Filter by status
+            priority: Filter by priority
+            category: Filter by category
+            environment: Filter by environment
+            automated_only: Only automated test cases; implies active status
+                unless ``status`` is given
+            tags: Filter by tags
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of TestCase instances
+        """
+        stmt = _filtered_select(
+            status, priority, category, environment, automated_only, tags
+        )
+        stmt = stmt.offset(skip).limit(limit)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_execution_settings_async(
+        self, session: AsyncSession, test_case_id: int
+    ) -> dict | None:
+        """Get the columns of a test case needed to execute it (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            Dictionary of test case settings, or None if not found
+        """
+        result = await session.execute(_execution_settings_select(test_case_id))
+        row = result.mappings().first()
+        return dict(row) if row is not None else None
+
+    async def get_execution_items_async(
+        self, session: AsyncSession, test_case_id: int
+    ) -> list[dict]:
+        """Get enabled scripts and components in execution order (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            List of dictionaries with ``type``, ``order``, ``id``, ``name``,
+            ``parameters`` and ``description`` keys
+        """
+        result = await session.execute(_execution_items_select(test_case_id))
+        return [dict(row) for row in result.mappings()]
+
+    async def update_status_async(
+        self, session: AsyncSession, test_case_id: int, status: TestCaseStatus
+    ) -> bool:
+        """Set the status of a test case with a single UPDATE statement (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            status: New test case status
+
+        Returns:
+            True if a row was updated, False if the test case does not exist
+        """
+        result = await session.execute(_status_update(test_case_id, status))
+        return result.rowcount > 0
+
 
 class TestCaseScriptRepository(BaseRepository[TestCaseScript]):
     """Repository for TestCaseScript association model.
@@ -481,13 +917,14 @@ class TestCaseScriptRepository(BaseRepository[TestCaseScript]):
         super().__init__(TestCaseScript)
 
     def get_by_test_case(
-        self, session: Session, test_case_id: int
+        self, session: Session, test_case_id: int, enabled_only: bool = True
     ) -> list[TestCaseScript]:
         """Get script associations for a test case.
 
         Args:
             session: Database session
             test_case_id: Test case ID
+            enabled_only: Whether to return only enabled associations
 
         Returns:
             List of TestCaseScript instances ordered by execution_order
@@ -500,12 +937,61 @@ class TestCaseScriptRepository(BaseRepository[TestCaseScript]):
         stmt = (
             select(TestCaseScript)
             .where(TestCaseScript.test_case_id == test_case_id)
-            .where(TestCaseScript.is_enabled)
             .options(joinedload(TestCaseScript.script))
             .order_by(TestCaseScript.execution_order)
         )
+        if enabled_only:
+            stmt = stmt.where(TestCaseScript.is_enabled.is_(True))
         return list(session.execute(stmt).scalars().all())
 
+    @staticmethod
+    def _copy_insert(source_test_case_id: int, target_test_case_id: int) -> Insert:
+        """Build the INSERT ... SELECT copying associations between test cases.
+
+        Args:
+            source_test_case_id: Test case to copy associations from
+            target_test_case_id: Test case to copy associations to
+
+        Returns:
+            INSERT statement
+        """
+        columns = (
+            TestCaseScript.script_id,
+            TestCaseScript.execution_order,
+            TestCaseScript.is_enabled,
+            TestCaseScript.script_parameters,
+            TestCaseScript.description,
+        )
+        rows = select(literal(target_test_case_id, Integer), *columns).where(
+            TestCaseScript.test_case_id == source_test_case_id
+        )
+        return insert(TestCaseScript).from_select(
+            ["test_case_id", *(column.key for column in columns)], rows
+        )
+
+    def copy_to_test_case(
+        self, session: Session, source_test_case_id: int, target_test_case_id: int
+    ) -> int:
+        """Copy all script associations of one test case to another.
+
+        Uses a single ``INSERT ... SELECT`` so rows, including their JSON
+        parameter overrides, are copied inside the database without being
+        loaded and re-serialized in Python.
+
+        Args:
+            session: Database session
+            source_test_case_id: Test case to copy associations from
+            target_test_case_id: Test case to copy associations to
+
+        Returns:
+            Number of associations copied
+
+        Example:
+            >>> copied = repo.copy_to_test_case(session, 1, 2)
+        """
+        stmt = self._copy_insert(source_test_case_id, target_test_case_id)
+        return session.execute(stmt).rowcount
+
     def get_by_script(self, session: Session, script_id: int) -> list[TestCaseScript]:
         """Get test case associations for a script.
 
@@ -531,13 +1017,14 @@ class TestCaseScriptRepository(BaseRepository[TestCaseScript]):
     # Async methods
 
     async def get_by_test_case_async(
-        self, session: AsyncSession, test_case_id: int
+        self, session: AsyncSession, test_case_id: int, enabled_only: bool = True
     ) -> list[TestCaseScript]:
         """Get script associations for a test case (async).
 
         Args:
             session: Async database session
             test_case_id: Test case ID
+            enabled_only: Whether to return only enabled associations
 
         Returns:
             List of TestCaseScript instances
@@ -545,10 +1032,11 @@ class TestCaseScriptRepository(BaseRepository[TestCaseScript]):
         stmt = (
             select(TestCaseScript)
             .where(TestCaseScript.test_case_id == test_case_id)
-            .where(TestCaseScript.is_enabled)
             .options(joinedload(TestCaseScript.script))
             .order_by(TestCaseScript.execution_order)
         )
+        if enabled_only:
+            stmt = stmt.where(TestCaseScript.is_enabled.is_(True))
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
@@ -572,6 +1060,26 @@ class TestCaseScriptRepository(BaseRepository[TestCaseScript]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def copy_to_test_case_async(
+        self,
+        session: AsyncSession,
+        source_test_case_id: int,
+        target_test_case_id: int,
+    ) -> int:
+        """Copy all script associations of one test case to another (async).
+
+        Args:
+            session: Async database session
+            source_test_case_id: Test case to copy associations from
+            target_test_case_id: Test case to copy associations to
+
+        Returns:
+            Number of associations copied
+        """
+        stmt = self._copy_insert(source_test_case_id, target_test_case_id)
+        result = await session.execute(stmt)
+        return result.rowcount
+
 
 class TestCaseComponentRepository(BaseRepository[TestCaseComponent]):
     """Repository for TestCaseComponent association model.
@@ -588,13 +1096,14 @@ class TestCaseComponentRepository(BaseRepository[TestCaseComponent]):
         super().__init__(TestCaseComponent)
 
     def get_by_test_case(
-        self, session: Session, test_case_id: int
+        self, session: Session, test_case_id: int, enabled_only: bool = True
     ) -> list[TestCaseComponent]:
         """Get component associations for a test case.
 
         Args:
             session: Database session
             test_case_id: Test case ID
+            enabled_only: Whether to return only enabled associations
 
         Returns:
             List of TestCaseComponent instances ordered by execution_order
@@ -607,12 +1116,61 @@ class TestCaseComponentRepository(BaseRepository[TestCaseComponent]):
         stmt = (
             select(TestCaseComponent)
             .where(TestCaseComponent.test_case_id == test_case_id)
-            .where(TestCaseComponent.is_enabled)
             .options(joinedload(TestCaseComponent.component))
             .order_by(TestCaseComponent.execution_order)
         )
+        if enabled_only:
+            stmt = stmt.where(TestCaseComponent.is_enabled.is_(True))
         return list(session.execute(stmt).scalars().all())
 
+    @staticmethod
+    def _copy_insert(source_test_case_id: int, target_test_case_id: int) -> Insert:
+        """Build the INSERT ... SELECT copying associations between test cases.
+
+        Args:
+            source_test_case_id: Test case to copy associations from
+            target_test_case_id: Test case to copy associations to
+
+        Returns:
+            INSERT statement
+        """
+        columns = (
+            TestCaseComponent.component_id,
+            TestCaseComponent.execution_order,
+            TestCaseComponent.is_enabled,
+            TestCaseComponent.component_parameters,
+            TestCaseComponent.description,
+        )
+        rows = select(literal(target_test_case_id, Integer), *columns).where(
+            TestCaseComponent.test_case_id == source_test_case_id
+        )
+        return insert(TestCaseComponent).from_select(
+            ["test_case_id", *(column.key for column in columns)], rows
+        )
+
+    def copy_to_test_case(
+        self, session: Session, source_test_case_id: int, target_test_case_id: int
+    ) -> int:
+        """Copy all component associations of one test case to another.
+
+        Uses a single ``INSERT ... SELECT`` so rows, including their JSON
+        parameter overrides, are copied inside the database without being
+        loaded and re-serialized in Python.
+
+        Args:
+            session: Database session
+            source_test_case_id: Test case to copy associations from
+            target_test_case_id: Test case to copy associations to
+
+        Returns:
+            Number of associations copied
+
+        Example:
+            >>> copied = repo.copy_to_test_case(session, 1, 2)
+        """
+        stmt = self._copy_insert(source_test_case_id, target_test_case_id)
+        return session.execute(stmt).rowcount
+
     def get_by_component(
         self, session: Session, component_id: int
     ) -> list[TestCaseComponent]:
@@ -640,13 +1198,14 @@ class TestCaseComponentRepository(BaseRepository[TestCaseComponent]):
     # Async methods
 
     async def get_by_test_case_async(
-        self, session: AsyncSession, test_case_id: int
+        self, session: AsyncSession, test_case_id: int, enabled_only: bool = True
     ) -> list[TestCaseComponent]:
         """Get component associations for a test case (async).
 
         Args:
             session: Async database session
             test_case_id: Test case ID
+            enabled_only: Whether to return only enabled associations
 
         Returns:
             List of TestCaseComponent instances
@@ -654,10 +1213,11 @@ class TestCaseComponentRepository(BaseRepository[TestCaseComponent]):
         stmt = (
             select(TestCaseComponent)
             .where(TestCaseComponent.test_case_id == test_case_id)
-            .where(TestCaseComponent.is_enabled)
             .options(joinedload(TestCaseComponent.component))
             .order_by(TestCaseComponent.execution_order)
         )
+        if enabled_only:
+            stmt = stmt.where(TestCaseComponent.is_enabled.is_(True))
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
@@ -680,3 +1240,30 @@ class TestCaseComponentRepository(BaseRepository[TestCaseComponent]):
         )
         result = await session.execute(stmt)
         return list(result.scalars().all())
+
+    async def copy_to_test_case_async(
+        self,
+        session: AsyncSession,
+        source_test_case_id: int,
+        target_test_case_id: int,
+    ) -> int:
+        """Copy all component associations of one test case to another (async).
+
+        Args:
+            session: Async database session
+            source_test_case_id: Test case to copy associations from
+            target_test_case_id: Test case to copy associations to
+
+        Returns:
+            Number of associations copied
+        """
+        stmt = self._copy_insert(source_test_case_id, target_test_case_id)
+        result = await session.execute(stmt)
+        return result.rowcount
+
+
+# Repositories are stateless, so services share these instances instead of
+# constructing their own on every instantiation.
+test_case_repository = TestCaseRepository()
+test_case_script_repository = TestCaseScriptRepository()
+test_case_component_repository = TestCaseComponentRepository()
@@ -3,14 +3,144 @@
 This module provides data access methods for TestExecution and ExecutionResult models.
 """
 
-from sqlalchemy import select
+from typing import Any
+
+from sqlalchemy import DateTime, Float, Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, joinedload, load_only
+from sqlalchemy.sql.functions import FunctionElement
 
 from morado.models.test_execution import ExecutionResult, ExecutionStatus, TestExecution
 from morado.repositories.base import BaseRepository
 
 
+class _StatementTime(FunctionElement):
+    """SQL expression for the time the current statement started.
+
+    PostgreSQL evaluates now() and CURRENT_TIMESTAMP to the start of the
+    transaction, so stamps written inside one transaction would all be equal.
+    """
+
+    type = DateTime(timezone=True)
+    name = "statement_time"
+    inherit_cache = True
+
+
+@compiles(_StatementTime)
+def _compile_statement_time(element: _StatementTime, compiler: Any, **kw: Any) -> str:
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(_StatementTime, "postgresql")
+def _compile_statement_time_postgresql(
+    element: _StatementTime, compiler: Any, **kw: Any
+) -> str:
+    return "statement_timestamp()"
+
+
+class _SecondsSince(FunctionElement):
+    """SQL expression for the seconds elapsed since a timestamp column."""
+
+    type = Float()
+    name = "seconds_since"
+    inherit_cache = True
+
+
+@compiles(_SecondsSince)
+def _compile_seconds_since(element: _SecondsSince, compiler: Any, **kw: Any) -> str:
+    start = compiler.process(element.clauses, **kw)
+    now = compiler.process(_StatementTime(), **kw)
+    return f"EXTRACT(EPOCH FROM ({now} - {start}))"
+
+
+@compiles(_SecondsSince, "sqlite")
+def _compile_seconds_since_sqlite(
+    element: _SecondsSince, compiler: Any, **kw: Any
+) -> str:
+    start = compiler.process(element.clauses, **kw)
+    return f"(julianday('now') - julianday({start})) * 86400.0"
+
+
+# Result columns used by execution summaries; request, response, log and
+# screenshot payloads are left unloaded
+_RESULT_SUMMARY_COLUMNS = (
+    ExecutionResult.id,
+    ExecutionResult.script_id,
+    ExecutionResult.component_id,
+    ExecutionResult.status,
+    ExecutionResult.duration,
+    ExecutionResult.error_message,
+)
+
+
+def _result_summaries_select(execution_id: int) -> Select[tuple[ExecutionResult]]:
+    """Build the SELECT of the summary columns of an execution's results.
+
+    Args:
+        execution_id: Execution ID
+
+    Returns:
+        SELECT statement for the results in insertion order
+    """
+    return (
+        select(ExecutionResult)
+        .where(ExecutionResult.execution_id == execution_id)
+        .order_by(ExecutionResult.id)
+        .options(load_only(*_RESULT_SUMMARY_COLUMNS))
+    )
+
+
+def _filtered_select(
+    test_case_id: int | None,
+    test_suite_id: int | None,
+    status: ExecutionStatus | None,
+    environment: str | None,
+) -> Select[tuple[TestExecution]]:
+    """Build a test execution SELECT with one WHERE clause per given filter.
+
+    Args:
+        test_case_id: Filter by test case ID
+        test_suite_id: Filter by test suite ID
+        status: Filter by status
+        environment: Filter by environment
+
+    Returns:
+        SELECT statement for matching executions, newest first
+    """
+    stmt = select(TestExecution)
+
+    if test_case_id is not None:
+        stmt = stmt.where(TestExecution.test_case_id == test_case_id)
+    if test_suite_id is not None:
+        stmt = stmt.where(TestExecution.test_suite_id == test_suite_id)
+    if status is not None:
+        stmt = stmt.where(TestExecution.status == status)
+    if environment is not None:
+        stmt = stmt.where(TestExecution.environment == environment)
+
+    return stmt.order_by(TestExecution.start_time.desc())
+
+
+def _status_select(uuid: str) -> Select:
+    """Build the SELECT of the status columns of a test execution.
+
+    Args:
+        uuid: Execution UUID
+
+    Returns:
+        SELECT statement returning at most one row
+    """
+    return select(
+        TestExecution.id,
+        TestExecution.uuid,
+        TestExecution.status,
+        TestExecution.start_time,
+        TestExecution.end_time,
+        TestExecution.duration,
+    ).where(TestExecution.uuid == uuid)
+
+
 class TestExecutionRepository(BaseRepository[TestExecution]):
     """Repository for TestExecution model.
 
@@ -51,6 +181,117 @@ class TestExecutionRepository(BaseRepository[TestExecution]):
         )
         return session.execute(stmt).unique().scalar_one_or_none()
 
+    def list_filtered(
+        self,
+        session: Session,
+        *,
+        test_case_id: int | None = None,
+        test_suite_id: int | None = None,
+        status: ExecutionStatus | None = None,
+        environment: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TestExecution]:
+        """Get executions matching all of the given filters.
+
+        Every filter that is set becomes a WHERE predicate of a single query,
+        so filters can be freely combined.
+
+        Args:
+            session: Database session
+            test_case_id: Filter by test case ID
+            test_suite_id: Filter by test suite ID
+            status: Filter by status
+            environment: Filter by environment
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of TestExecution instances ordered by start_time desc
+
+        Example:
+            >>> executions = repo.list_filtered(
+            ...     session, test_case_id=1, status=ExecutionStatus.FAILED
+            ... )
+        """
+        stmt = _filtered_select(test_case_id, test_suite_id, status, environment)
+        stmt = stmt.offset(skip).limit(limit)
+        return list(session.execute(stmt).scalars().all())
+
+    def get_status_by_uuid(self, session: Session, uuid: str) -> dict | None:
+        """Get the status and timing columns of an execution.
+
+        Only scalar status columns are selected and returned as a dictionary,
+        so parameters and error payloads are never loaded.
+
+        Args:
+            session: Database session
+            uuid: Execution UUID
+
+        Returns:
+            Dictionary with id, uuid, status, start_time, end_time and
+            duration, or None if not found
+
+        Example:
+            >>> status = repo.get_status_by_uuid(session, "550e8400-...")
+            >>> print(status["status"])
+        """
+        row = session.execute(_status_select(uuid)).mappings().first()
+        return dict(row) if row is not None else None
+
+    def mark_started(self, session: Session, execution_id: int) -> TestExecution | None:
+        """Mark an execution as running, stamped with the database clock.
+
+        Args:
+            session: Database session
+            execution_id: Execution ID
+
+        Returns:
+            Updated TestExecution instance or None if not found
+
+        Example:
+            >>> execution = repo.mark_started(session, 1)
+        """
+        return self.update_by_id(
+            session,
+            execution_id,
+            status=ExecutionStatus.RUNNING,
+            start_time=_StatementTime(),
+        )
+
+    def mark_completed(
+        self,
+        session: Session,
+        execution_id: int,
+        status: ExecutionStatus,
+        **kwargs: Any,
+    ) -> TestExecution | None:
+        """Mark an execution as finished, stamped with the database clock.
+
+        ``end_time`` and ``duration`` are computed in the UPDATE statement
+        itself; duration stays NULL if the execution was never started.
+
+        Args:
+            session: Database session
+            execution_id: Execution ID
+            status: Final status
+            **kwargs: Additional fields to update, e.g. ``error_message``
+
+        Returns:
+            Updated TestExecution instance or None if not found
+
+        Example:
+            >>> execution = repo.mark_completed(session, 1, ExecutionStatus.PASSED)
+        """
+        return self.update_by_id(
+            session,
+            execution_id,
+            **kwargs,
+            status=status,
+            end_time=_StatementTime(),
+            duration=_SecondsSince(TestExecution.start_time),
+        )
+
     def get_by_test_case(
         self, session: Session, test_case_id: int, skip: int = 0, limit: int = 100
     ) -> list[TestExecution]:
@@ -177,6 +418,99 @@ class TestExecutionRepository(BaseRepository[TestExecution]):
         result = await session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def list_filtered_async(
+        self,
+        session: AsyncSession,
+        *,
+        test_case_id: int | None = None,
+        test_suite_id: int | None = None,
+        status: ExecutionStatus | None = None,
+        environment: str | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TestExecution]:
+        """Get executions matching all of the given filters (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Filter by test case ID
+            test_suite_id: Filter by test suite ID
+            status: Filter by status
+            environment: Filter by environment
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of TestExecution instances ordered by start_time desc
+        """
+        stmt = _filtered_select(test_case_id, test_suite_id, status, environment)
+        stmt = stmt.offset(skip).limit(limit)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_status_by_uuid_async(
+        self, session: AsyncSession, uuid: str
+    ) -> dict | None:
+        """Get the status and timing columns of an execution (async).
+
+        Args:
+            session: Async database session
+            uuid: Execution UUID
+
+        Returns:
+            Dictionary with id, uuid, status, start_time, end_time and
+            duration, or None if not found
+        """
+        result = await session.execute(_status_select(uuid))
+        row = result.mappings().first()
+        return dict(row) if row is not None else None
+
+    async def mark_started_async(
+        self, session: AsyncSession, execution_id: int
+    ) -> TestExecution | None:
+        """Mark an execution as running, stamped with the database clock (async).
+
+        Args:
+            session: Async database session
+            execution_id: Execution ID
+
+        Returns:
+            Updated TestExecution instance or None if not found
+        """
+        return await self.update_by_id_async(
+            session,
+            execution_id,
+            status=ExecutionStatus.RUNNING,
+            start_time=_StatementTime(),
+        )
+
+    async def mark_completed_async(
+        self,
+        session: AsyncSession,
+        execution_id: int,
+        status: ExecutionStatus,
+        **kwargs: Any,
+    ) -> TestExecution | None:
+        """Mark an execution as finished, stamped with the database clock (async).
+
+        Args:
+            session: Async database session
+            execution_id: Execution ID
+            status: Final status
+            **kwargs: Additional fields to update, e.g. ``error_message``
+
+        Returns:
+            Updated TestExecution instance or None if not found
+        """
+        return await self.update_by_id_async(
+            session,
+            execution_id,
+            **kwargs,
+            status=status,
+            end_time=_StatementTime(),
+            duration=_SecondsSince(TestExecution.start_time),
+        )
+
     async def get_by_test_case_async(
         self, session: AsyncSession, test_case_id: int, skip: int = 0, limit: int = 100
     ) -> list[TestExecution]:
@@ -316,6 +650,27 @@ class ExecutionResultRepository(BaseRepository[ExecutionResult]):
         )
         return list(session.execute(stmt).scalars().all())
 
+    def get_summaries_by_execution(
+        self, session: Session, execution_id: int
+    ) -> list[ExecutionResult]:
+        """Get the results of an execution with only their summary columns.
+
+        Only the id, script, component, status, duration and error message
+        are loaded; other columns are deferred.
+
+        Args:
+            session: Database session
+            execution_id: Execution ID
+
+        Returns:
+            List of partially loaded ExecutionResult instances
+
+        Example:
+            >>> results = repo.get_summaries_by_execution(session, 1)
+        """
+        stmt = _result_summaries_select(execution_id)
+        return list(session.execute(stmt).scalars().all())
+
     def get_by_script(
         self, session: Session, script_id: int, skip: int = 0, limit: int = 100
     ) -> list[ExecutionResult]:
@@ -390,6 +745,22 @@ class ExecutionResultRepository(BaseRepository[ExecutionResult]):
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
+    async def get_summaries_by_execution_async(
+        self, session: AsyncSession, execution_id: int
+    ) -> list[ExecutionResult]:
+        """Get the results of an execution with only their summary columns (async).
+
+        Args:
+            session: Async database session
+            execution_id: Execution ID
+
+        Returns:
+            List of partially loaded ExecutionResult instances
+        """
+        stmt = _result_summaries_select(execution_id)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
     async def get_by_script_async(
         self, session: AsyncSession, script_id: int, skip: int = 0, limit: int = 100
     ) -> list[ExecutionResult]:
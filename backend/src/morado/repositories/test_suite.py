@@ -3,10 +3,11 @@
 This module provides data access methods for TestSuite and TestSuiteCase models.
 """
 
-from sqlalchemy import select
+from sqlalchemy import Insert, Integer, insert, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
+from morado.models.test_case import TestCase
 from morado.models.test_suite import TestSuite, TestSuiteCase
 from morado.repositories.base import BaseRepository
 
@@ -275,13 +276,18 @@ class TestSuiteCaseRepository(BaseRepository[TestSuiteCase]):
         super().__init__(TestSuiteCase)
 
     def get_by_test_suite(
-        self, session: Session, test_suite_id: int
+        self, session: Session, test_suite_id: int, enabled_only: bool = True
     ) -> list[TestSuiteCase]:
         """Get test case associations for a test suite.
 
+        Ordering and the enabled filter are applied by the database. The
+        test case of each association is joined in the same query with only
+        its name loaded.
+
         Args:
             session: Database session
             test_suite_id: Test suite ID
+            enabled_only: Whether to return only enabled associations
 
         Returns:
             List of TestSuiteCase instances ordered by execution_order
@@ -294,12 +300,60 @@ class TestSuiteCaseRepository(BaseRepository[TestSuiteCase]):
         stmt = (
             select(TestSuiteCase)
             .where(TestSuiteCase.test_suite_id == test_suite_id)
-            .where(TestSuiteCase.is_enabled)
-            .options(joinedload(TestSuiteCase.test_case))
+            .options(joinedload(TestSuiteCase.test_case).load_only(TestCase.name))
             .order_by(TestSuiteCase.execution_order)
         )
+        if enabled_only:
+            stmt = stmt.where(TestSuiteCase.is_enabled.is_(True))
         return list(session.execute(stmt).scalars().all())
 
+    @staticmethod
+    def _copy_insert(source_suite_id: int, target_suite_id: int) -> Insert:
+        """Build the INSERT ... SELECT copying associations between test suites.
+
+        Args:
+            source_suite_id: Test suite to copy associations from
+            target_suite_id: Test suite to copy associations to
+
+        Returns:
+            INSERT statement
+        """
+        columns = (
+            TestSuiteCase.test_case_id,
+            TestSuiteCase.execution_order,
+            TestSuiteCase.is_enabled,
+            TestSuiteCase.case_parameters,
+            TestSuiteCase.description,
+        )
+        rows = select(literal(target_suite_id, Integer), *columns).where(
+            TestSuiteCase.test_suite_id == source_suite_id
+        )
+        return insert(TestSuiteCase).from_select(
+            ["test_suite_id", *(column.key for column in columns)], rows
+        )
+
+    def copy_to_test_suite(
+        self, session: Session, source_suite_id: int, target_suite_id: int
+    ) -> int:
+        """Copy all test case associations of one test suite to another.
+
+        Uses a single ``INSERT ... SELECT`` so rows are copied inside the
+        database instead of being loaded and re-inserted one by one.
+
+        Args:
+            session: Database session
+            source_suite_id: Test suite to copy associations from
+            target_suite_id: Test suite to copy associations to
+
+        Returns:
+            Number of associations copied
+
+        Example:
+            >>> copied = repo.copy_to_test_suite(session, 1, 2)
+        """
+        stmt = self._copy_insert(source_suite_id, target_suite_id)
+        return session.execute(stmt).rowcount
+
     def get_by_test_case(
         self, session: Session, test_case_id: int
     ) -> list[TestSuiteCase]:
@@ -327,13 +381,14 @@ class TestSuiteCaseRepository(BaseRepository[TestSuiteCase]):
     # Async methods
 
     async def get_by_test_suite_async(
-        self, session: AsyncSession, test_suite_id: int
+        self, session: AsyncSession, test_suite_id: int, enabled_only: bool = True
     ) -> list[TestSuiteCase]:
         """Get test case associations for a test suite (async).
 
         Args:
             session: Async database session
             test_suite_id: Test suite ID
+            enabled_only: Whether to return only enabled associations
 
         Returns:
             List of TestSuiteCase instances
@@ -341,10 +396,11 @@ class TestSuiteCaseRepository(BaseRepository[TestSuiteCase]):
         stmt = (
             select(TestSuiteCase)
             .where(TestSuiteCase.test_suite_id == test_suite_id)
-            .where(TestSuiteCase.is_enabled)
-            .options(joinedload(TestSuiteCase.test_case))
+            .options(joinedload(TestSuiteCase.test_case).load_only(TestCase.name))
             .order_by(TestSuiteCase.execution_order)
         )
+        if enabled_only:
+            stmt = stmt.where(TestSuiteCase.is_enabled.is_(True))
         result = await session.execute(stmt)
         return list(result.scalars().all())
 
@@ -367,3 +423,20 @@ class TestSuiteCaseRepository(BaseRepository[TestSuiteCase]):
         )
         result = await session.execute(stmt)
         return list(result.scalars().all())
+
+    async def copy_to_test_suite_async(
+        self, session: AsyncSession, source_suite_id: int, target_suite_id: int
+    ) -> int:
+        """Copy all test case associations of one test suite to another (async).
+
+        Args:
+            session: Async database session
+            source_suite_id: Test suite to copy associations from
+            target_suite_id: Test suite to copy associations to
+
+        Returns:
+            Number of associations copied
+        """
+        stmt = self._copy_insert(source_suite_id, target_suite_id)
+        result = await session.execute(stmt)
+        return result.rowcount
@@ -27,12 +27,14 @@ from morado.services.execution_engine import (
 )
 from morado.services.report import ReportService
 from morado.services.script import TestScriptService
-from morado.services.test_case import TestCaseService
+from morado.services.test_case import AsyncTestCaseService, TestCaseService
 from morado.services.test_execution import TestExecutionService
 from morado.services.test_suite import TestSuiteService
 
 __all__ = [
     "ApiDefinitionService",
+    # Layer 4: Test Cases (async)
+    "AsyncTestCaseService",
     "BodyService",
     "ComponentExecutionContext",
     # Execution Context
@@ -14,7 +14,9 @@ parameter flow and variable propagation across layers.
 """
 
 import asyncio
+import heapq
 from enum import Enum
+from operator import itemgetter
 from typing import Any
 
 from morado.services.execution_context import (
@@ -454,23 +456,19 @@ class ExecutionEngine:
                 test_case, runtime_params=runtime_params, env_config=env_config
             )
 
-            # Collect all execution items (scripts and components)
-            items = []
-
-            # Add scripts
-            if hasattr(test_case, "test_case_scripts"):
-                for case_script in test_case.test_case_scripts:
-                    items.append((case_script.execution_order, "script", case_script))
-
-            # Add components
-            if hasattr(test_case, "test_case_components"):
-                for case_component in test_case.test_case_components:
-                    items.append(
-                        (case_component.execution_order, "component", case_component)
-                    )
-
-            # Sort by execution order
-            items.sort(key=lambda x: x[0])
+            # Collect scripts and components; both relationships are loaded
+            # ordered by execution_order
+            script_items = [
+                (case_script.execution_order, "script", case_script)
+                for case_script in getattr(test_case, "test_case_scripts", ())
+            ]
+            component_items = [
+                (case_component.execution_order, "component", case_component)
+                for case_component in getattr(test_case, "test_case_components", ())
+            ]
+
+            # Merge the two ordered lists in one pass; scripts go first on ties
+            items = heapq.merge(script_items, component_items, key=itemgetter(0))
 
             # Execute items in order
             for _order, item_type, item in items:
@@ -1,12 +1,21 @@
 """Service layer for Layer 4: Test Case management.
 
 This module provides business logic for managing test cases.
+
+The batch paths (bulk add, clone) assume the engine configured in
+``morado.core.database``: a sized compiled-statement cache
+(``database_query_cache_size``) and, on psycopg2, ``executemany_mode=
+"values_plus_batch"`` so executemany INSERTs are sent as multi-row batches.
 """
 
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 from typing import Any
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from morado.common.utils.uuid import generate_uuid4
 from morado.models.test_case import (
     TestCase,
     TestCaseComponent,
@@ -15,10 +24,144 @@ from morado.models.test_case import (
     TestCaseStatus,
 )
 from morado.repositories.test_case import (
-    TestCaseComponentRepository,
-    TestCaseRepository,
-    TestCaseScriptRepository,
+    LoaderStrategy,
+    test_case_component_repository,
+    test_case_repository,
+    test_case_script_repository,
+)
+from morado.services.unit_of_work import (
+    commit,
+    commit_async,
+    transaction,
+    transaction_async,
+)
+
+# session.info key of the per-session test case lookup cache
+_CACHE_KEY = "test_case_cache"
+
+# Columns the update methods may write; anything else passed is ignored
+_TEST_CASE_UPDATABLE_COLUMNS = frozenset(
+    {
+        "name",
+        "description",
+        "priority",
+        "status",
+        "category",
+        "tags",
+        "preconditions",
+        "postconditions",
+        "execution_order",
+        "timeout",
+        "retry_count",
+        "continue_on_failure",
+        "test_data",
+        "environment",
+        "version",
+        "is_automated",
+    }
 )
+_TEST_CASE_SCRIPT_UPDATABLE_COLUMNS = frozenset(
+    {"execution_order", "is_enabled", "script_parameters", "description"}
+)
+_TEST_CASE_COMPONENT_UPDATABLE_COLUMNS = frozenset(
+    {"execution_order", "is_enabled", "component_parameters", "description"}
+)
+
+
+def _pick(kwargs: dict[str, Any], allowed: frozenset[str]) -> dict[str, Any]:
+    """Keep only the allowed fields of an update payload.
+
+    Args:
+        kwargs: Requested field values
+        allowed: Names of the fields that may be written
+
+    Returns:
+        Field values restricted to ``allowed``
+    """
+    return {field: value for field, value in kwargs.items() if field in allowed}
+
+
+def _script_rows(
+    test_case_id: int, items: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Build INSERT rows for script associations with defaults filled in.
+
+    Args:
+        test_case_id: Test case ID
+        items: Script entries as passed to add_scripts_to_test_case()
+
+    Returns:
+        One row per item, all sharing the same keys
+    """
+    return [
+        {
+            "execution_order": 0,
+            "is_enabled": True,
+            "script_parameters": None,
+            "description": None,
+            **item,
+            "test_case_id": test_case_id,
+        }
+        for item in items
+    ]
+
+
+def _component_rows(
+    test_case_id: int, items: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Build INSERT rows for component associations with defaults filled in.
+
+    Args:
+        test_case_id: Test case ID
+        items: Component entries as passed to add_components_to_test_case()
+
+    Returns:
+        One row per item, all sharing the same keys
+    """
+    return [
+        {
+            "execution_order": 0,
+            "is_enabled": True,
+            "component_parameters": None,
+            "description": None,
+            **item,
+            "test_case_id": test_case_id,
+        }
+        for item in items
+    ]
+
+
+def _clone_values(source: TestCase, new_name: str) -> dict[str, Any]:
+    """Build the field values of a draft copy of a test case.
+
+    The copy gets a fresh UUID, since the source's must stay unique.
+
+    Args:
+        source: Test case to clone
+        new_name: Name for the cloned test case
+
+    Returns:
+        Field values for the new test case
+    """
+    return {
+        "uuid": generate_uuid4(),
+        "name": new_name,
+        "description": f"Cloned from: {source.name}",
+        "priority": source.priority,
+        "status": TestCaseStatus.DRAFT,
+        "category": source.category,
+        "tags": source.tags,
+        "preconditions": source.preconditions,
+        "postconditions": source.postconditions,
+        "execution_order": source.execution_order,
+        "timeout": source.timeout,
+        "retry_count": source.retry_count,
+        "continue_on_failure": source.continue_on_failure,
+        "test_data": source.test_data,
+        "environment": source.environment,
+        "is_automated": source.is_automated,
+        "created_by": source.created_by,
+    }
 
 
 class TestCaseService:
@@ -38,9 +181,66 @@ class TestCaseService:
 
     def __init__(self):
         """Initialize TestCase service."""
-        self.repository = TestCaseRepository()
-        self.script_repository = TestCaseScriptRepository()
-        self.component_repository = TestCaseComponentRepository()
+        self.repository = test_case_repository
+        self.script_repository = test_case_script_repository
+        self.component_repository = test_case_component_repository
+
+    @staticmethod
+    def _cache(session: Session) -> dict[tuple, TestCase]:
+        """Get the test case lookup cache bound to a session.
+
+        The cache lives in ``session.info`` so its lifetime is that of the
+        session, i.e. one request. Only found test cases are cached.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Mapping of lookup key to TestCase instance
+        """
+        return session.info.setdefault(_CACHE_KEY, {})
+
+    @staticmethod
+    def _commit(session: Session) -> None:
+        """Drop cached lookups of the session and commit.
+
+        Every mutating method commits through here so cached test cases
+        never outlive a write made by this service. Inside transaction()
+        the changes are only flushed and the outermost block commits.
+
+        Args:
+            session: Database session
+        """
+        session.info.pop(_CACHE_KEY, None)
+        commit(session)
+
+    @contextmanager
+    def transaction(self, session: Session) -> Iterator[Session]:
+        """Run several service calls as one transaction.
+
+        Mutating methods called inside the block do not commit on their
+        own. The outermost block commits once when it exits normally and
+        rolls everything back if it raises, so composed operations are
+        atomic. Blocks may be nested; a failing inner block only rolls back
+        its own changes.
+
+        Args:
+            session: Database session
+
+        Yields:
+            The given session
+
+        Example:
+            >>> with service.transaction(session):
+            ...     clone = service.clone_test_case(session, 1, "Copy")
+            ...     service.activate_test_case(session, clone.id)
+        """
+        try:
+            with transaction(session):
+                yield session
+        except Exception:
+            session.info.pop(_CACHE_KEY, None)
+            raise
 
     def create_test_case(  # noqa: PLR0913
         self,
@@ -109,7 +309,7 @@ class TestCaseService:
             **kwargs,
         )
 
-        session.commit()
+        self._commit(session)
         return test_case
 
     def get_test_case(
@@ -119,6 +319,7 @@ class TestCaseService:
         load_scripts: bool = False,
         load_components: bool = False,
         load_all: bool = False,
+        loader_strategy: LoaderStrategy = "selectin",
     ) -> TestCase | None:
         """Get test case by ID.
 
@@ -128,18 +329,42 @@ class TestCaseService:
             load_scripts: Whether to load associated scripts
             load_components: Whether to load associated components
             load_all: Whether to load all relations
+            loader_strategy: Eager loading strategy used with load_all
+                (selectin/joined)
 
         Returns:
             TestCase instance or None if not found
+
+        Note:
+            Without any load flag no relationship is loaded, and accessing
+            one on the returned instance raises instead of lazy loading.
         """
+        cache = self._cache(session)
+        key = (
+            "id",
+            test_case_id,
+            load_scripts,
+            load_components,
+            load_all,
+            loader_strategy,
+        )
+        if key in cache:
+            return cache[key]
+
         if load_all:
-            return self.repository.get_with_relations(session, test_case_id)
+            test_case = self.repository.get_with_relations(
+                session, test_case_id, loader_strategy=loader_strategy
+            )
         elif load_scripts:
-            return self.repository.get_with_scripts(session, test_case_id)
+            test_case = self.repository.get_with_scripts(session, test_case_id)
         elif load_components:
-            return self.repository.get_with_components(session, test_case_id)
+            test_case = self.repository.get_with_components(session, test_case_id)
         else:
-            return self.repository.get_by_id(session, test_case_id)
+            test_case = self.repository.get_without_relations(session, test_case_id)
+
+        if test_case is not None:
+            cache[key] = test_case
+        return test_case
 
     def get_test_case_by_uuid(self, session: Session, uuid: str) -> TestCase | None:
         """Get test case by UUID.
@@ -151,7 +376,15 @@ class TestCaseService:
         Returns:
             TestCase instance or None if not found
         """
-        return self.repository.get_by_uuid(session, uuid)
+        cache = self._cache(session)
+        key = ("uuid", uuid)
+        if key in cache:
+            return cache[key]
+
+        test_case = self.repository.get_by_uuid(session, uuid)
+        if test_case is not None:
+            cache[key] = test_case
+        return test_case
 
     def list_test_cases(
         self,
@@ -167,6 +400,8 @@ class TestCaseService:
     ) -> list[TestCase]:
         """List test cases with optional filtering.
 
+        All given filters are combined into a single query.
+
         Args:
             session: Database session
             status: Filter by status
@@ -181,20 +416,55 @@ class TestCaseService:
         Returns:
             List of TestCase instances
         """
-        if automated_only:
-            return self.repository.get_automated_cases(session, skip, limit)
-        elif status:
-            return self.repository.get_by_status(session, status, skip, limit)
-        elif priority:
-            return self.repository.get_by_priority(session, priority, skip, limit)
-        elif category:
-            return self.repository.get_by_category(session, category, skip, limit)
-        elif environment:
-            return self.repository.get_by_environment(session, environment, skip, limit)
-        elif tags:
-            return self.repository.get_by_tags(session, tags, skip, limit)
-        else:
-            return self.repository.get_all(session, skip, limit)
+        return self.repository.get_filtered(
+            session,
+            status=status,
+            priority=priority,
+            category=category,
+            environment=environment,
+            automated_only=automated_only,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+        )
+
+    def iter_test_cases(
+        self,
+        session: Session,
+        status: TestCaseStatus | None = None,
+        priority: TestCasePriority | None = None,
+        category: str | None = None,
+        environment: str | None = None,
+        automated_only: bool = False,
+        tags: list[str] | None = None,
+    ) -> Iterator[TestCase]:
+        """Stream test cases with optional filtering.
+
+        Unlike list_test_cases(), results are not paginated or materialized;
+        instances are loaded chunk by chunk through a server-side cursor,
+        which suits single-pass consumers such as exports.
+
+        Args:
+            session: Database session
+            status: Filter by status
+            priority: Filter by priority
+            category: Filter by category
+            environment: Filter by environment
+            automated_only: Whether to return only automated test cases
+            tags: Filter by tags
+
+        Returns:
+            Iterator over TestCase instances
+        """
+        return self.repository.iter_filtered(
+            session,
+            status=status,
+            priority=priority,
+            category=category,
+            environment=environment,
+            automated_only=automated_only,
+            tags=tags,
+        )
 
     def search_test_cases(
         self, session: Session, name: str, skip: int = 0, limit: int = 100
@@ -220,17 +490,19 @@ class TestCaseService:
         Args:
             session: Database session
             test_case_id: Test case ID
-            **kwargs: Fields to update
+            **kwargs: Fields to update; fields outside the updatable set are ignored
 
         Returns:
             Updated TestCase instance or None if not found
         """
-        test_case = self.repository.get_by_id(session, test_case_id)
-        if not test_case:
+        values = _pick(kwargs, _TEST_CASE_UPDATABLE_COLUMNS)
+        updated_test_case = self.repository.update_by_id(
+            session, test_case_id, **values
+        )
+        if updated_test_case is None:
             return None
 
-        updated_test_case = self.repository.update(session, test_case, **kwargs)
-        session.commit()
+        self._commit(session)
         return updated_test_case
 
     def delete_test_case(self, session: Session, test_case_id: int) -> bool:
@@ -242,10 +514,14 @@ class TestCaseService:
 
         Returns:
             True if deleted, False if not found
+
+        Note:
+            Associations, suite memberships and executions are removed by
+            the database's ``ON DELETE CASCADE`` rules.
         """
-        result = self.repository.delete_by_id(session, test_case_id)
+        result = self.repository.delete_by_id_without_load(session, test_case_id)
         if result:
-            session.commit()
+            self._commit(session)
         return result
 
     def add_script_to_test_case(
@@ -272,7 +548,7 @@ class TestCaseService:
         Returns:
             Created TestCaseScript instance
         """
-        test_case_script = self.script_repository.create(
+        test_case_script = self.script_repository.create_returning(
             session,
             test_case_id=test_case_id,
             script_id=script_id,
@@ -282,7 +558,7 @@ class TestCaseService:
             description=description,
         )
 
-        session.commit()
+        self._commit(session)
         return test_case_script
 
     def add_component_to_test_case(
@@ -309,7 +585,7 @@ class TestCaseService:
         Returns:
             Created TestCaseComponent instance
         """
-        test_case_component = self.component_repository.create(
+        test_case_component = self.component_repository.create_returning(
             session,
             test_case_id=test_case_id,
             component_id=component_id,
@@ -319,36 +595,84 @@ class TestCaseService:
             description=description,
         )
 
-        session.commit()
+        self._commit(session)
         return test_case_component
 
+    def add_scripts_to_test_case(
+        self, session: Session, test_case_id: int, items: list[dict[str, Any]]
+    ) -> list[TestCaseScript]:
+        """Add multiple scripts to test case in one batched INSERT.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+            items: Script entries, each with ``script_id`` and optionally
+                ``execution_order``, ``is_enabled``, ``script_parameters``
+                and ``description``
+
+        Returns:
+            Created TestCaseScript instances in the same order as ``items``
+        """
+        rows = _script_rows(test_case_id, items)
+        test_case_scripts = self.script_repository.create_many(session, rows)
+
+        self._commit(session)
+        return test_case_scripts
+
+    def add_components_to_test_case(
+        self, session: Session, test_case_id: int, items: list[dict[str, Any]]
+    ) -> list[TestCaseComponent]:
+        """Add multiple components to test case in one batched INSERT.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+            items: Component entries, each with ``component_id`` and optionally
+                ``execution_order``, ``is_enabled``, ``component_parameters``
+                and ``description``
+
+        Returns:
+            Created TestCaseComponent instances in the same order as ``items``
+        """
+        rows = _component_rows(test_case_id, items)
+        test_case_components = self.component_repository.create_many(session, rows)
+
+        self._commit(session)
+        return test_case_components
+
     def get_test_case_scripts(
-        self, session: Session, test_case_id: int
+        self, session: Session, test_case_id: int, enabled_only: bool = True
     ) -> list[TestCaseScript]:
         """Get scripts associated with test case.
 
         Args:
             session: Database session
             test_case_id: Test case ID
+            enabled_only: Whether to return only enabled scripts
 
         Returns:
             List of TestCaseScript instances ordered by execution_order
         """
-        return self.script_repository.get_by_test_case(session, test_case_id)
+        return self.script_repository.get_by_test_case(
+            session, test_case_id, enabled_only=enabled_only
+        )
 
     def get_test_case_components(
-        self, session: Session, test_case_id: int
+        self, session: Session, test_case_id: int, enabled_only: bool = True
     ) -> list[TestCaseComponent]:
         """Get components associated with test case.
 
         Args:
             session: Database session
             test_case_id: Test case ID
+            enabled_only: Whether to return only enabled components
 
         Returns:
             List of TestCaseComponent instances ordered by execution_order
         """
-        return self.component_repository.get_by_test_case(session, test_case_id)
+        return self.component_repository.get_by_test_case(
+            session, test_case_id, enabled_only=enabled_only
+        )
 
     def update_test_case_script(
         self, session: Session, test_case_script_id: int, **kwargs: Any
@@ -358,19 +682,19 @@ class TestCaseService:
         Args:
             session: Database session
             test_case_script_id: TestCaseScript ID
-            **kwargs: Fields to update
+            **kwargs: Fields to update; fields outside the updatable set are ignored
 
         Returns:
             Updated TestCaseScript instance or None if not found
         """
-        test_case_script = self.script_repository.get_by_id(
-            session, test_case_script_id
+        values = _pick(kwargs, _TEST_CASE_SCRIPT_UPDATABLE_COLUMNS)
+        updated = self.script_repository.update_by_id(
+            session, test_case_script_id, **values
         )
-        if not test_case_script:
+        if updated is None:
             return None
 
-        updated = self.script_repository.update(session, test_case_script, **kwargs)
-        session.commit()
+        self._commit(session)
         return updated
 
     def update_test_case_component(
@@ -381,21 +705,19 @@ class TestCaseService:
         Args:
             session: Database session
             test_case_component_id: TestCaseComponent ID
-            **kwargs: Fields to update
+            **kwargs: Fields to update; fields outside the updatable set are ignored
 
         Returns:
             Updated TestCaseComponent instance or None if not found
         """
-        test_case_component = self.component_repository.get_by_id(
-            session, test_case_component_id
+        values = _pick(kwargs, _TEST_CASE_COMPONENT_UPDATABLE_COLUMNS)
+        updated = self.component_repository.update_by_id(
+            session, test_case_component_id, **values
         )
-        if not test_case_component:
+        if updated is None:
             return None
 
-        updated = self.component_repository.update(
-            session, test_case_component, **kwargs
-        )
-        session.commit()
+        self._commit(session)
         return updated
 
     def remove_script_from_test_case(
@@ -410,9 +732,11 @@ class TestCaseService:
         Returns:
             True if removed, False if not found
         """
-        result = self.script_repository.delete_by_id(session, test_case_script_id)
+        result = self.script_repository.delete_by_id_without_load(
+            session, test_case_script_id
+        )
         if result:
-            session.commit()
+            self._commit(session)
         return result
 
     def remove_component_from_test_case(
@@ -427,9 +751,11 @@ class TestCaseService:
         Returns:
             True if removed, False if not found
         """
-        result = self.component_repository.delete_by_id(session, test_case_component_id)
+        result = self.component_repository.delete_by_id_without_load(
+            session, test_case_component_id
+        )
         if result:
-            session.commit()
+            self._commit(session)
         return result
 
     def activate_test_case(
@@ -444,9 +770,7 @@ class TestCaseService:
         Returns:
             Updated TestCase instance or None if not found
         """
-        return self.update_test_case(
-            session, test_case_id, status=TestCaseStatus.ACTIVE
-        )
+        return self._set_status(session, test_case_id, TestCaseStatus.ACTIVE)
 
     def archive_test_case(self, session: Session, test_case_id: int) -> TestCase | None:
         """Archive test case.
@@ -458,9 +782,7 @@ class TestCaseService:
         Returns:
             Updated TestCase instance or None if not found
         """
-        return self.update_test_case(
-            session, test_case_id, status=TestCaseStatus.ARCHIVED
-        )
+        return self._set_status(session, test_case_id, TestCaseStatus.ARCHIVED)
 
     def deprecate_test_case(
         self, session: Session, test_case_id: int
@@ -474,9 +796,30 @@ class TestCaseService:
         Returns:
             Updated TestCase instance or None if not found
         """
-        return self.update_test_case(
-            session, test_case_id, status=TestCaseStatus.DEPRECATED
-        )
+        return self._set_status(session, test_case_id, TestCaseStatus.DEPRECATED)
+
+    def _set_status(
+        self, session: Session, test_case_id: int, status: TestCaseStatus
+    ) -> TestCase | None:
+        """Transition a test case to a new status.
+
+        Emits a single UPDATE by primary key instead of loading the test case
+        first. The instance is only fetched afterwards, from the identity map
+        when possible.
+
+        Args:
+            session: Database session
+            test_case_id: Test case ID
+            status: New status
+
+        Returns:
+            Updated TestCase instance or None if not found
+        """
+        if not self.repository.update_status(session, test_case_id, status):
+            return None
+
+        self._commit(session)
+        return self.repository.get_by_id(session, test_case_id)
 
     def get_test_case_execution_plan(
         self, session: Session, test_case_id: int
@@ -493,62 +836,14 @@ class TestCaseService:
         Returns:
             Dictionary with complete execution plan or None if not found
         """
-        test_case = self.repository.get_with_relations(session, test_case_id)
-        if not test_case:
+        test_case = self.repository.get_execution_settings(session, test_case_id)
+        if test_case is None:
             return None
 
-        # Build execution plan
-        execution_items = []
-
-        # Add scripts
-        for tcs in test_case.test_case_scripts:
-            if tcs.is_enabled:
-                execution_items.append(
-                    {
-                        "type": "script",
-                        "order": tcs.execution_order,
-                        "id": tcs.script_id,
-                        "name": tcs.script.name,
-                        "parameters": tcs.script_parameters,
-                        "description": tcs.description,
-                    }
-                )
-
-        # Add components
-        for tcc in test_case.test_case_components:
-            if tcc.is_enabled:
-                execution_items.append(
-                    {
-                        "type": "component",
-                        "order": tcc.execution_order,
-                        "id": tcc.component_id,
-                        "name": tcc.component.name,
-                        "parameters": tcc.component_parameters,
-                        "description": tcc.description,
-                    }
-                )
-
-        # Sort by execution order
-        execution_items.sort(key=lambda x: x["order"])
-
-        return {
-            "test_case": {
-                "id": test_case.id,
-                "uuid": test_case.uuid,
-                "name": test_case.name,
-                "description": test_case.description,
-                "priority": test_case.priority,
-                "status": test_case.status,
-                "category": test_case.category,
-                "execution_order": test_case.execution_order,
-                "timeout": test_case.timeout,
-                "retry_count": test_case.retry_count,
-                "continue_on_failure": test_case.continue_on_failure,
-                "test_data": test_case.test_data,
-                "environment": test_case.environment,
-            },
-            "execution_items": execution_items,
-        }
+        # Enabled scripts and components, ordered by the database
+        execution_items = self.repository.get_execution_items(session, test_case_id)
+
+        return {"test_case": test_case, "execution_items": execution_items}
 
     def clone_test_case(
         self, session: Session, test_case_id: int, new_name: str
@@ -563,54 +858,676 @@ class TestCaseService:
         Returns:
             Cloned TestCase instance or None if source not found
         """
-        source = self.repository.get_with_relations(session, test_case_id)
+        source = self.repository.get_by_id(session, test_case_id)
         if not source:
             return None
 
         # Create new test case
-        cloned = self.repository.create(
+        cloned = self.repository.create(session, **_clone_values(source, new_name))
+
+        # Copy scripts and components inside the database
+        self.script_repository.copy_to_test_case(session, source.id, cloned.id)
+        self.component_repository.copy_to_test_case(session, source.id, cloned.id)
+
+        self._commit(session)
+        return cloned
+
+
+class AsyncTestCaseService:
+    """Asynchronous variant of TestCaseService.
+
+    Mirrors TestCaseService on an AsyncSession so async handlers can await
+    database I/O instead of blocking the event loop. Both services share the
+    same repositories, SQL builders and payload helpers.
+
+    Example:
+        >>> service = AsyncTestCaseService()
+        >>> test_case = await service.get_test_case(session, 1, load_all=True)
+    """
+
+    def __init__(self):
+        """Initialize async TestCase service."""
+        self.repository = test_case_repository
+        self.script_repository = test_case_script_repository
+        self.component_repository = test_case_component_repository
+
+    @staticmethod
+    def _cache(session: AsyncSession) -> dict[tuple, TestCase]:
+        """Get the test case lookup cache bound to a session.
+
+        Args:
+            session: Async database session
+
+        Returns:
+            Mapping of lookup key to TestCase instance
+        """
+        return session.info.setdefault(_CACHE_KEY, {})
+
+    @staticmethod
+    async def _commit(session: AsyncSession) -> None:
+        """Drop cached lookups of the session and commit.
+
+        Args:
+            session: Async database session
+        """
+        session.info.pop(_CACHE_KEY, None)
+        await commit_async(session)
+
+    @asynccontextmanager
+    async def transaction(self, session: AsyncSession) -> AsyncIterator[AsyncSession]:
+        """Run several service calls as one transaction (async).
+
+        See TestCaseService.transaction().
+
+        Args:
+            session: Async database session
+
+        Yields:
+            The given session
+
+        Example:
+            >>> async with service.transaction(session):
+            ...     clone = await service.clone_test_case(session, 1, "Copy")
+            ...     await service.activate_test_case(session, clone.id)
+        """
+        try:
+            async with transaction_async(session):
+                yield session
+        except Exception:
+            session.info.pop(_CACHE_KEY, None)
+            raise
+
+    async def create_test_case(  # noqa: PLR0913
+        self,
+        session: AsyncSession,
+        name: str,
+        *,
+        description: str | None = None,
+        priority: TestCasePriority = TestCasePriority.MEDIUM,
+        status: TestCaseStatus = TestCaseStatus.DRAFT,
+        category: str | None = None,
+        tags: list[str] | None = None,
+        preconditions: str | None = None,
+        postconditions: str | None = None,
+        execution_order: str = "sequential",
+        timeout: int = 300,  # noqa: ASYNC109 - test case field, not an I/O timeout
+        retry_count: int = 0,
+        continue_on_failure: bool = False,
+        test_data: dict | None = None,
+        environment: str = "test",
+        is_automated: bool = True,
+        created_by: int | None = None,
+        **kwargs: Any,
+    ) -> TestCase:
+        """Create a new test case (async).
+
+        Args:
+            session: Async database session
+            name: Test case name
+            description: Test case description
+            priority: Priority level (low/medium/high/critical)
+            status: Status (draft/active/deprecated/archived)
+            category: Category
+            tags: Tags for categorization
+            preconditions: Preconditions
+            postconditions: Postconditions
+            execution_order: Execution order (sequential/parallel)
+            timeout: Timeout in seconds
+            retry_count: Number of retries
+            continue_on_failure: Whether to continue on failure
+            test_data: Test data
+            environment: Execution environment
+            is_automated: Whether test is automated
+            created_by: Creator user ID
+            **kwargs: Additional fields
+
+        Returns:
+            Created TestCase instance
+        """
+        test_case = await self.repository.create_async(
             session,
-            name=new_name,
-            description=f"Cloned from: {source.name}",
-            priority=source.priority,
-            status=TestCaseStatus.DRAFT,
-            category=source.category,
-            tags=source.tags,
-            preconditions=source.preconditions,
-            postconditions=source.postconditions,
-            execution_order=source.execution_order,
-            timeout=source.timeout,
-            retry_count=source.retry_count,
-            continue_on_failure=source.continue_on_failure,
-            test_data=source.test_data,
-            environment=source.environment,
-            is_automated=source.is_automated,
-            created_by=source.created_by,
-        )
-
-        # Clone scripts
-        for tcs in source.test_case_scripts:
-            self.script_repository.create(
-                session,
-                test_case_id=cloned.id,
-                script_id=tcs.script_id,
-                execution_order=tcs.execution_order,
-                is_enabled=tcs.is_enabled,
-                script_parameters=tcs.script_parameters,
-                description=tcs.description,
-            )
+            name=name,
+            description=description,
+            priority=priority,
+            status=status,
+            category=category,
+            tags=tags,
+            preconditions=preconditions,
+            postconditions=postconditions,
+            execution_order=execution_order,
+            timeout=timeout,
+            retry_count=retry_count,
+            continue_on_failure=continue_on_failure,
+            test_data=test_data,
+            environment=environment,
+            is_automated=is_automated,
+            created_by=created_by,
+            **kwargs,
+        )
+
+        await self._commit(session)
+        return test_case
+
+    async def get_test_case(
+        self,
+        session: AsyncSession,
+        test_case_id: int,
+        load_scripts: bool = False,
+        load_components: bool = False,
+        load_all: bool = False,
+        loader_strategy: LoaderStrategy = "selectin",
+    ) -> TestCase | None:
+        """Get test case by ID (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            load_scripts: Whether to load associated scripts
+            load_components: Whether to load associated components
+            load_all: Whether to load all relations
+            loader_strategy: Eager loading strategy used with load_all
+                (selectin/joined)
+
+        Returns:
+            TestCase instance or None if not found
+        """
+        cache = self._cache(session)
+        key = (
+            "id",
+            test_case_id,
+            load_scripts,
+            load_components,
+            load_all,
+            loader_strategy,
+        )
+        if key in cache:
+            return cache[key]
 
-        # Clone components
-        for tcc in source.test_case_components:
-            self.component_repository.create(
-                session,
-                test_case_id=cloned.id,
-                component_id=tcc.component_id,
-                execution_order=tcc.execution_order,
-                is_enabled=tcc.is_enabled,
-                component_parameters=tcc.component_parameters,
-                description=tcc.description,
+        if load_all:
+            test_case = await self.repository.get_with_relations_async(
+                session, test_case_id, loader_strategy=loader_strategy
             )
+        elif load_scripts:
+            test_case = await self.repository.get_with_scripts_async(
+                session, test_case_id
+            )
+        elif load_components:
+            test_case = await self.repository.get_with_components_async(
+                session, test_case_id
+            )
+        else:
+            test_case = await self.repository.get_without_relations_async(
+                session, test_case_id
+            )
+
+        if test_case is not None:
+            cache[key] = test_case
+        return test_case
+
+    async def get_test_case_by_uuid(
+        self, session: AsyncSession, uuid: str
+    ) -> TestCase | None:
+        """Get test case by UUID (async).
+
+        Args:
+            session: Async database session
+            uuid: Test case UUID
+
+        Returns:
+            TestCase instance or None if not found
+        """
+        cache = self._cache(session)
+        key = ("uuid", uuid)
+        if key in cache:
+            return cache[key]
+
+        test_case = await self.repository.get_by_uuid_async(session, uuid)
+        if test_case is not None:
+            cache[key] = test_case
+        return test_case
+
+    async def list_test_cases(
+        self,
+        session: AsyncSession,
+        status: TestCaseStatus | None = None,
+        priority: TestCasePriority | None = None,
+        category: str | None = None,
+        environment: str | None = None,
+        automated_only: bool = False,
+        tags: list[str] | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> list[TestCase]:
+        """List test cases with optional filtering (async).
+
+        Args:
+            session: Async database session
+            status: Filter by status
+            priority: Filter by priority
+            category: Filter by category
+            environment: Filter by environment
+            automated_only: Whether to return only automated test cases
+            tags: Filter by tags
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of TestCase instances
+        """
+        return await self.repository.get_filtered_async(
+            session,
+            status=status,
+            priority=priority,
+            category=category,
+            environment=environment,
+            automated_only=automated_only,
+            tags=tags,
+            skip=skip,
+            limit=limit,
+        )
+
+    async def search_test_cases(
+        self, session: AsyncSession, name: str, skip: int = 0, limit: int = 100
+    ) -> list[TestCase]:
+        """Search test cases by name (async).
+
+        Args:
+            session: Async database session
+            name: Name to search for
+            skip: Number of records to skip
+            limit: Maximum number of records to return
+
+        Returns:
+            List of TestCase instances
+        """
+        return await self.repository.search_by_name_async(session, name, skip, limit)
+
+    async def update_test_case(
+        self, session: AsyncSession, test_case_id: int, **kwargs: Any
+    ) -> TestCase | None:
+        """Update test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            **kwargs: Fields to update; fields outside the updatable set are ignored
+
+        Returns:
+            Updated TestCase instance or None if not found
+        """
+        values = _pick(kwargs, _TEST_CASE_UPDATABLE_COLUMNS)
+        updated_test_case = await self.repository.update_by_id_async(
+            session, test_case_id, **values
+        )
+        if updated_test_case is None:
+            return None
+
+        await self._commit(session)
+        return updated_test_case
+
+    async def delete_test_case(self, session: AsyncSession, test_case_id: int) -> bool:
+        """Delete test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            True if deleted, False if not found
+        """
+        result = await self.repository.delete_by_id_without_load_async(
+            session, test_case_id
+        )
+        if result:
+            await self._commit(session)
+        return result
+
+    async def add_script_to_test_case(
+        self,
+        session: AsyncSession,
+        test_case_id: int,
+        script_id: int,
+        execution_order: int = 0,
+        is_enabled: bool = True,
+        script_parameters: dict | None = None,
+        description: str | None = None,
+    ) -> TestCaseScript:
+        """Add script to test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            script_id: Script ID
+            execution_order: Execution order
+            is_enabled: Whether script is enabled
+            script_parameters: Script parameter overrides
+            description: Description
+
+        Returns:
+            Created TestCaseScript instance
+        """
+        test_case_script = await self.script_repository.create_returning_async(
+            session,
+            test_case_id=test_case_id,
+            script_id=script_id,
+            execution_order=execution_order,
+            is_enabled=is_enabled,
+            script_parameters=script_parameters,
+            description=description,
+        )
+
+        await self._commit(session)
+        return test_case_script
+
+    async def add_component_to_test_case(
+        self,
+        session: AsyncSession,
+        test_case_id: int,
+        component_id: int,
+        execution_order: int = 0,
+        is_enabled: bool = True,
+        component_parameters: dict | None = None,
+        description: str | None = None,
+    ) -> TestCaseComponent:
+        """Add component to test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            component_id: Component ID
+            execution_order: Execution order
+            is_enabled: Whether component is enabled
+            component_parameters: Component parameter overrides
+            description: Description
+
+        Returns:
+            Created TestCaseComponent instance
+        """
+        test_case_component = await self.component_repository.create_returning_async(
+            session,
+            test_case_id=test_case_id,
+            component_id=component_id,
+            execution_order=execution_order,
+            is_enabled=is_enabled,
+            component_parameters=component_parameters,
+            description=description,
+        )
+
+        await self._commit(session)
+        return test_case_component
+
+    async def add_scripts_to_test_case(
+        self, session: AsyncSession, test_case_id: int, items: list[dict[str, Any]]
+    ) -> list[TestCaseScript]:
+        """Add multiple scripts to test case in one batched INSERT (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            items: Script entries, see TestCaseService.add_scripts_to_test_case()
+
+        Returns:
+            Created TestCaseScript instances in the same order as ``items``
+        """
+        test_case_scripts = await self.script_repository.create_many_async(
+            session, _script_rows(test_case_id, items)
+        )
+
+        await self._commit(session)
+        return test_case_scripts
+
+    async def add_components_to_test_case(
+        self, session: AsyncSession, test_case_id: int, items: list[dict[str, Any]]
+    ) -> list[TestCaseComponent]:
+        """Add multiple components to test case in one batched INSERT (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            items: Component entries, see
+                TestCaseService.add_components_to_test_case()
+
+        Returns:
+            Created TestCaseComponent instances in the same order as ``items``
+        """
+        test_case_components = await self.component_repository.create_many_async(
+            session, _component_rows(test_case_id, items)
+        )
+
+        await self._commit(session)
+        return test_case_components
+
+    async def get_test_case_scripts(
+        self, session: AsyncSession, test_case_id: int, enabled_only: bool = True
+    ) -> list[TestCaseScript]:
+        """Get scripts associated with test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            enabled_only: Whether to return only enabled scripts
+
+        Returns:
+            List of TestCaseScript instances ordered by execution_order
+        """
+        return await self.script_repository.get_by_test_case_async(
+            session, test_case_id, enabled_only=enabled_only
+        )
+
+    async def get_test_case_components(
+        self, session: AsyncSession, test_case_id: int, enabled_only: bool = True
+    ) -> list[TestCaseComponent]:
+        """Get components associated with test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            enabled_only: Whether to return only enabled components
+
+        Returns:
+            List of TestCaseComponent instances ordered by execution_order
+        """
+        return await self.component_repository.get_by_test_case_async(
+            session, test_case_id, enabled_only=enabled_only
+        )
+
+    async def update_test_case_script(
+        self, session: AsyncSession, test_case_script_id: int, **kwargs: Any
+    ) -> TestCaseScript | None:
+        """Update test case-script association (async).
+
+        Args:
+            session: Async database session
+            test_case_script_id: TestCaseScript ID
+            **kwargs: Fields to update; fields outside the updatable set are ignored
+
+        Returns:
+            Updated TestCaseScript instance or None if not found
+        """
+        values = _pick(kwargs, _TEST_CASE_SCRIPT_UPDATABLE_COLUMNS)
+        updated = await self.script_repository.update_by_id_async(
+            session, test_case_script_id, **values
+        )
+        if updated is None:
+            return None
+
+        await self._commit(session)
+        return updated
+
+    async def update_test_case_component(
+        self, session: AsyncSession, test_case_component_id: int, **kwargs: Any
+    ) -> TestCaseComponent | None:
+        """Update test case-component association (async).
+
+        Args:
+            session: Async database session
+            test_case_component_id: TestCaseComponent ID
+            **kwargs: Fields to update; fields outside the updatable set are ignored
+
+        Returns:
+            Updated TestCaseComponent instance or None if not found
+        """
+        values = _pick(kwargs, _TEST_CASE_COMPONENT_UPDATABLE_COLUMNS)
+        updated = await self.component_repository.update_by_id_async(
+            session, test_case_component_id, **values
+        )
+        if updated is None:
+            return None
+
+        await self._commit(session)
+        return updated
+
+    async def remove_script_from_test_case(
+        self, session: AsyncSession, test_case_script_id: int
+    ) -> bool:
+        """Remove script from test case (async).
+
+        Args:
+            session: Async database session
+            test_case_script_id: TestCaseScript ID
+
+        Returns:
+            True if removed, False if not found
+        """
+        result = await self.script_repository.delete_by_id_without_load_async(
+            session, test_case_script_id
+        )
+        if result:
+            await self._commit(session)
+        return result
+
+    async def remove_component_from_test_case(
+        self, session: AsyncSession, test_case_component_id: int
+    ) -> bool:
+        """Remove component from test case (async).
+
+        Args:
+            session: Async database session
+            test_case_component_id: TestCaseComponent ID
+
+        Returns:
+            True if removed, False if not found
+        """
+        result = await self.component_repository.delete_by_id_without_load_async(
+            session, test_case_component_id
+        )
+        if result:
+            await self._commit(session)
+        return result
+
+    async def activate_test_case(
+        self, session: AsyncSession, test_case_id: int
+    ) -> TestCase | None:
+        """Activate test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            Updated TestCase instance or None if not found
+        """
+        return await self._set_status(session, test_case_id, TestCaseStatus.ACTIVE)
+
+    async def archive_test_case(
+        self, session: AsyncSession, test_case_id: int
+    ) -> TestCase | None:
+        """Archive test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            Updated TestCase instance or None if not found
+        """
+        return await self._set_status(session, test_case_id, TestCaseStatus.ARCHIVED)
+
+    async def deprecate_test_case(
+        self, session: AsyncSession, test_case_id: int
+    ) -> TestCase | None:
+        """Deprecate test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            Updated TestCase instance or None if not found
+        """
+        return await self._set_status(session, test_case_id, TestCaseStatus.DEPRECATED)
+
+    async def _set_status(
+        self, session: AsyncSession, test_case_id: int, status: TestCaseStatus
+    ) -> TestCase | None:
+        """Transition a test case to a new status (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+            status: New status
+
+        Returns:
+            Updated TestCase instance or None if not found
+        """
+        if not await self.repository.update_status_async(session, test_case_id, status):
+            return None
+
+        await self._commit(session)
+        return await self.repository.get_by_id_async(session, test_case_id)
+
+    async def get_test_case_execution_plan(
+        self, session: AsyncSession, test_case_id: int
+    ) -> dict[str, Any] | None:
+        """Get complete test case execution plan (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID
+
+        Returns:
+            Dictionary with complete execution plan or None if not found
+        """
+        test_case = await self.repository.get_execution_settings_async(
+            session, test_case_id
+        )
+        if test_case is None:
+            return None
+
+        execution_items = await self.repository.get_execution_items_async(
+            session, test_case_id
+        )
+
+        return {"test_case": test_case, "execution_items": execution_items}
+
+    async def clone_test_case(
+        self, session: AsyncSession, test_case_id: int, new_name: str
+    ) -> TestCase | None:
+        """Clone a test case (async).
+
+        Args:
+            session: Async database session
+            test_case_id: Test case ID to clone
+            new_name: Name for the cloned test case
+
+        Returns:
+            Cloned TestCase instance or None if source not found
+        """
+        source = await self.repository.get_by_id_async(session, test_case_id)
+        if not source:
+            return None
+
+        cloned = await self.repository.create_async(
+            session, **_clone_values(source, new_name)
+        )
+
+        # Copy scripts and components inside the database
+        await self.script_repository.copy_to_test_case_async(
+            session, source.id, cloned.id
+        )
+        await self.component_repository.copy_to_test_case_async(
+            session, source.id, cloned.id
+        )
 
-        session.commit()
+        await self._commit(session)
         return cloned
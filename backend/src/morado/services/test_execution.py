@@ -3,13 +3,96 @@
 This module provides business logic for managing test execution and results.
 """
 
-from datetime import datetime
-from typing import Any
+from collections.abc import Iterator
+from contextlib import contextmanager
+from operator import attrgetter
+from typing import Any, TypedDict, cast
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from morado.models.test_execution import ExecutionResult, ExecutionStatus, TestExecution
-from morado.repositories.test_execution import TestExecutionRepository
+from morado.repositories.test_execution import (
+    ExecutionResultRepository,
+    TestExecutionRepository,
+)
+from morado.services.unit_of_work import commit, transaction
+
+# Column defaults of add_execution_result(); every batched row carries all keys
+_EXECUTION_RESULT_DEFAULTS: dict[str, Any] = {
+    "script_id": None,
+    "component_id": None,
+    "status": ExecutionStatus.PENDING,
+    "request_data": None,
+    "response_data": None,
+    "assertions": None,
+    "error_message": None,
+    "stack_trace": None,
+    "logs": None,
+    "screenshots": None,
+}
+
+# Statistics keys of get_execution_summary() and the columns they come from
+_STATISTICS_KEYS = ("total", "passed", "failed", "error", "skipped")
+_get_statistics = attrgetter(
+    "total_count", "passed_count", "failed_count", "error_count", "skipped_count"
+)
+
+# Per-result fields reported by get_execution_summary()
+_RESULT_SUMMARY_KEYS = (
+    "id",
+    "script_id",
+    "component_id",
+    "status",
+    "duration",
+    "error_message",
+)
+_get_result_summary = attrgetter(*_RESULT_SUMMARY_KEYS)
+
+# Mapped column names of ExecutionResult that update_execution_result() sets
+_EXECUTION_RESULT_COLUMNS = frozenset(inspect(ExecutionResult).column_attrs.keys())
+
+
+class ExecutionInfo(TypedDict):
+    """Execution block of an execution summary."""
+
+    id: int
+    uuid: str
+    status: ExecutionStatus
+    start_time: str | None
+    end_time: str | None
+    duration: float | None
+    environment: str
+    executor: str | None
+
+
+class ExecutionStatistics(TypedDict):
+    """Result counts of an execution summary."""
+
+    total: int
+    passed: int
+    failed: int
+    error: int
+    skipped: int
+
+
+class ExecutionResultSummary(TypedDict):
+    """One result entry of an execution summary."""
+
+    id: int
+    script_id: int | None
+    component_id: int | None
+    status: ExecutionStatus
+    duration: float | None
+    error_message: str | None
+
+
+class ExecutionSummary(TypedDict):
+    """Payload returned by TestExecutionService.get_execution_summary()."""
+
+    execution: ExecutionInfo
+    statistics: ExecutionStatistics
+    results: list[ExecutionResultSummary]
 
 
 class TestExecutionService:
@@ -29,6 +112,29 @@ class TestExecutionService:
     def __init__(self):
         """Initialize TestExecution service."""
         self.repository = TestExecutionRepository()
+        self.result_repository = ExecutionResultRepository()
+
+    @contextmanager
+    def transaction(self, session: Session) -> Iterator[Session]:
+        """Run several service calls as one transaction.
+
+        Mutating methods called inside the block only flush; the outermost
+        block commits once on success and rolls back if it raises. Nested
+        blocks run in a SAVEPOINT, see unit_of_work.transaction().
+
+        Args:
+            session: Database session
+
+        Yields:
+            The given session
+
+        Example:
+            >>> with service.transaction(session):
+            ...     service.complete_execution(session, 1, ExecutionStatus.PASSED)
+            ...     service.update_execution_stats(session, 1, passed_count=10)
+        """
+        with transaction(session):
+            yield session
 
     def create_execution(
         self,
@@ -74,7 +180,7 @@ class TestExecutionService:
             **kwargs,
         )
 
-        session.commit()
+        commit(session)
         return execution
 
     def get_execution(
@@ -109,6 +215,24 @@ class TestExecutionService:
         """
         return self.repository.get_by_uuid(session, uuid)
 
+    def get_execution_status_by_uuid(
+        self, session: Session, uuid: str
+    ) -> dict[str, Any] | None:
+        """Get the status and timing of an execution by UUID.
+
+        Lighter than get_execution_by_uuid() for status polling: no
+        TestExecution instance is loaded.
+
+        Args:
+            session: Database session
+            uuid: Execution UUID
+
+        Returns:
+            Dictionary with id, uuid, status, start_time, end_time and
+            duration, or None if not found
+        """
+        return self.repository.get_status_by_uuid(session, uuid)
+
     def list_executions(
         self,
         session: Session,
@@ -131,21 +255,18 @@ class TestExecutionService:
             limit: Maximum number of records to return
 
         Returns:
-            List of TestExecution instances
+            List of TestExecution instances matching all given filters,
+            newest first
         """
-        if test_case_id:
-            return self.repository.get_by_test_case(session, test_case_id, skip, limit)
-        elif test_suite_id:
-            return self.repository.get_by_test_suite(
-                session, test_suite_id, skip, limit
-            )
-        elif status:
-            return self.repository.get_by_status(session, status, skip, limit)
-        else:
-            filters = {}
-            if environment:
-                filters["environment"] = environment
-            return self.repository.get_all(session, skip, limit, filters)
+        return self.repository.list_filtered(
+            session,
+            test_case_id=test_case_id,
+            test_suite_id=test_suite_id,
+            status=status,
+            environment=environment,
+            skip=skip,
+            limit=limit,
+        )
 
     def start_execution(
         self, session: Session, execution_id: int
@@ -159,18 +280,11 @@ class TestExecutionService:
         Returns:
             Updated TestExecution instance or None if not found
         """
-        execution = self.repository.get_by_id(session, execution_id)
-        if not execution:
+        updated = self.repository.mark_started(session, execution_id)
+        if not updated:
             return None
 
-        updated = self.repository.update(
-            session,
-            execution,
-            status=ExecutionStatus.RUNNING,
-            start_time=datetime.now(),
-        )
-
-        session.commit()
+        commit(session)
         return updated
 
     def complete_execution(
@@ -193,27 +307,17 @@ class TestExecutionService:
         Returns:
             Updated TestExecution instance or None if not found
         """
-        execution = self.repository.get_by_id(session, execution_id)
-        if not execution:
-            return None
-
-        end_time = datetime.now()
-        duration = None
-
-        if execution.start_time:
-            duration = (end_time - execution.start_time).total_seconds()
-
-        updated = self.repository.update(
+        updated = self.repository.mark_completed(
             session,
-            execution,
-            status=status,
-            end_time=end_time,
-            duration=duration,
+            execution_id,
+            status,
             error_message=error_message,
             stack_trace=stack_trace,
         )
+        if not updated:
+            return None
 
-        session.commit()
+        commit(session)
         return updated
 
     def cancel_execution(
@@ -271,7 +375,7 @@ class TestExecutionService:
             updates["skipped_count"] = skipped_count
 
         updated = self.repository.update(session, execution, **updates)
-        session.commit()
+        commit(session)
         return updated
 
     def add_execution_result(  # noqa: PLR0913
@@ -308,35 +412,63 @@ class TestExecutionService:
         Returns:
             Created ExecutionResult instance
         """
-        result = ExecutionResult(
-            execution_id=execution_id,
-            script_id=script_id,
-            component_id=component_id,
-            status=status,
-            request_data=request_data,
-            response_data=response_data,
-            assertions=assertions,
-            error_message=error_message,
-            stack_trace=stack_trace,
-            logs=logs,
-            screenshots=screenshots,
-        )
+        return self.add_execution_results(
+            session,
+            execution_id,
+            [
+                {
+                    "script_id": script_id,
+                    "component_id": component_id,
+                    "status": status,
+                    "request_data": request_data,
+                    "response_data": response_data,
+                    "assertions": assertions,
+                    "error_message": error_message,
+                    "stack_trace": stack_trace,
+                    "logs": logs,
+                    "screenshots": screenshots,
+                }
+            ],
+        )[0]
 
-        session.add(result)
-        session.commit()
-        session.refresh(result)
+    def add_execution_results(
+        self, session: Session, execution_id: int, items: list[dict[str, Any]]
+    ) -> list[ExecutionResult]:
+        """Add multiple execution results in one batched INSERT.
 
-        return result
+        Args:
+            session: Database session
+            execution_id: Execution ID
+            items: Result entries with any of the add_execution_result()
+                fields; missing fields take the same defaults
+
+        Returns:
+            Created ExecutionResult instances in the same order as ``items``
+        """
+        rows = [
+            {**_EXECUTION_RESULT_DEFAULTS, **item, "execution_id": execution_id}
+            for item in items
+        ]
+        results = self.result_repository.create_many(session, rows)
+
+        commit(session)
+        return results
 
     def update_execution_result(
-        self, session: Session, result_id: int, **kwargs: Any
+        self,
+        session: Session,
+        result_id: int,
+        refresh: bool = False,
+        **kwargs: Any,
     ) -> ExecutionResult | None:
         """Update execution result.
 
         Args:
             session: Database session
             result_id: ExecutionResult ID
-            **kwargs: Fields to update
+            refresh: Reload the row after committing, e.g. to pick up
+                server-generated values such as ``updated_at``
+            **kwargs: Fields to update; unknown fields are ignored
 
         Returns:
             Updated ExecutionResult instance or None if not found
@@ -345,14 +477,41 @@ class TestExecutionService:
         if not result:
             return None
 
-        for key, value in kwargs.items():
-            if hasattr(result, key):
-                setattr(result, key, value)
+        for key in kwargs.keys() & _EXECUTION_RESULT_COLUMNS:
+            setattr(result, key, kwargs[key])
 
-        session.commit()
-        session.refresh(result)
+        commit(session)
+        if refresh:
+            session.refresh(result)
         return result
 
+    def bulk_update_execution_results(
+        self, session: Session, items: list[dict[str, Any]]
+    ) -> None:
+        """Update multiple execution results with one batched UPDATE.
+
+        Each item holds the ExecutionResult ``id`` and the fields to set on
+        it. Results already loaded in the session are updated in place.
+
+        Args:
+            session: Database session
+            items: Result IDs and field values to update
+
+        Example:
+            >>> service.bulk_update_execution_results(
+            ...     session,
+            ...     [
+            ...         {"id": 1, "status": ExecutionStatus.PASSED},
+            ...         {"id": 2, "status": ExecutionStatus.FAILED, "error_message": "timeout"},
+            ...     ]
+            ... )
+        """
+        if not items:
+            return
+
+        self.result_repository.update_many(session, items)
+        commit(session)
+
     def get_execution_results(
         self, session: Session, execution_id: int
     ) -> list[ExecutionResult]:
@@ -363,17 +522,14 @@ class TestExecutionService:
             execution_id: Execution ID
 
         Returns:
-            List of ExecutionResult instances
+            List of ExecutionResult instances ordered by start_time, empty if
+            the execution does not exist
         """
-        execution = self.repository.get_with_results(session, execution_id)
-        if not execution:
-            return []
-
-        return execution.execution_results
+        return self.result_repository.get_by_execution(session, execution_id)
 
     def get_execution_summary(
         self, session: Session, execution_id: int
-    ) -> dict[str, Any] | None:
+    ) -> ExecutionSummary | None:
         """Get execution summary.
 
         Args:
@@ -383,10 +539,14 @@ class TestExecutionService:
         Returns:
             Dictionary with execution summary or None if not found
         """
-        execution = self.repository.get_with_results(session, execution_id)
+        execution = self.repository.get_by_id(session, execution_id)
         if not execution:
             return None
 
+        results = self.result_repository.get_summaries_by_execution(
+            session, execution_id
+        )
+
         return {
             "execution": {
                 "id": execution.id,
@@ -402,24 +562,23 @@ class TestExecutionService:
                 "environment": execution.environment,
                 "executor": execution.executor,
             },
-            "statistics": {
-                "total": execution.total_count,
-                "passed": execution.passed_count,
-                "failed": execution.failed_count,
-                "error": execution.error_count,
-                "skipped": execution.skipped_count,
-            },
-            "results": [
-                {
-                    "id": result.id,
-                    "script_id": result.script_id,
-                    "component_id": result.component_id,
-                    "status": result.status,
-                    "duration": result.duration,
-                    "error_message": result.error_message,
-                }
-                for result in execution.execution_results
-            ],
+            "statistics": cast(
+                ExecutionStatistics,
+                dict(zip(_STATISTICS_KEYS, _get_statistics(execution), strict=True)),
+            ),
+            "results": cast(
+                list[ExecutionResultSummary],
+                [
+                    dict(
+                        zip(
+                            _RESULT_SUMMARY_KEYS,
+                            _get_result_summary(result),
+                            strict=True,
+                        )
+                    )
+                    for result in results
+                ],
+            ),
         }
 
     def get_recent_executions(
@@ -438,11 +597,8 @@ class TestExecutionService:
             limit: Maximum number of records to return
 
         Returns:
-            List of recent TestExecution instances
+            List of recent TestExecution instances, newest first
         """
-        if test_case_id:
-            return self.repository.get_by_test_case(session, test_case_id, 0, limit)
-        elif test_suite_id:
-            return self.repository.get_by_test_suite(session, test_suite_id, 0, limit)
-        else:
-            return self.repository.get_all(session, 0, limit)
+        return self.repository.list_filtered(
+            session, test_case_id=test_case_id, test_suite_id=test_suite_id, limit=limit
+        )
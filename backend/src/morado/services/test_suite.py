@@ -3,12 +3,30 @@
 This module provides business logic for managing test suites.
 """
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 
 from morado.models.test_suite import TestSuite, TestSuiteCase
-from morado.repositories.test_suite import TestSuiteRepository
+from morado.repositories.test_suite import TestSuiteCaseRepository, TestSuiteRepository
+from morado.services.unit_of_work import commit, transaction
+
+# session.info key of the per-session test suite lookup cache
+_CACHE_KEY = "test_suite_cache"
+
+# Column defaults of add_test_case_to_suite(); every batched row carries all keys
+_SUITE_CASE_DEFAULTS: dict[str, Any] = {
+    "execution_order": 0,
+    "is_enabled": True,
+    "case_parameters": None,
+    "description": None,
+}
+
+# Mapped column names of TestSuiteCase that update_suite_test_case() sets
+_SUITE_CASE_COLUMNS = frozenset(inspect(TestSuiteCase).column_attrs.keys())
 
 
 class TestSuiteService:
@@ -29,6 +47,58 @@ class TestSuiteService:
     def __init__(self):
         """Initialize TestSuite service."""
         self.repository = TestSuiteRepository()
+        self.case_repository = TestSuiteCaseRepository()
+
+    @staticmethod
+    def _cache(session: Session) -> dict[tuple, TestSuite]:
+        """Get the test suite lookup cache bound to a session.
+
+        The cache lives in ``session.info`` so its lifetime is that of the
+        session, i.e. one request. Only found test suites are cached.
+
+        Args:
+            session: Database session
+
+        Returns:
+            Mapping of lookup key to TestSuite instance
+        """
+        return session.info.setdefault(_CACHE_KEY, {})
+
+    @staticmethod
+    def _commit(session: Session) -> None:
+        """Drop cached lookups of the session and commit.
+
+        Args:
+            session: Database session
+        """
+        session.info.pop(_CACHE_KEY, None)
+        commit(session)
+
+    @contextmanager
+    def transaction(self, session: Session) -> Iterator[Session]:
+        """Run several service calls as one transaction.
+
+        Mutating methods called inside the block only flush; the outermost
+        block commits once on success and rolls back if it raises. Nested
+        blocks run in a SAVEPOINT, see unit_of_work.transaction().
+
+        Args:
+            session: Database session
+
+        Yields:
+            The given session
+
+        Example:
+            >>> with service.transaction(session):
+            ...     service.add_test_case_to_suite(session, 1, test_case_id=1)
+            ...     service.add_test_case_to_suite(session, 1, test_case_id=2)
+        """
+        try:
+            with transaction(session):
+                yield session
+        except Exception:
+            session.info.pop(_CACHE_KEY, None)
+            raise
 
     def create_test_suite(  # noqa: PLR0913
         self,
@@ -82,7 +152,7 @@ class TestSuiteService:
             **kwargs,
         )
 
-        session.commit()
+        self._commit(session)
         return suite
 
     def get_test_suite(
@@ -103,7 +173,15 @@ class TestSuiteService:
         """
         # Note: Repository doesn't have get_with_test_cases yet
         # For now, just get the suite and let relationships load lazily
-        return self.repository.get_by_id(session, suite_id)
+        cache = self._cache(session)
+        key = ("id", suite_id)
+        if key in cache:
+            return cache[key]
+
+        suite = self.repository.get_by_id(session, suite_id)
+        if suite is not None:
+            cache[key] = suite
+        return suite
 
     def get_test_suite_by_uuid(self, session: Session, uuid: str) -> TestSuite | None:
         """Get test suite by UUID.
@@ -115,7 +193,15 @@ class TestSuiteService:
         Returns:
             TestSuite instance or None if not found
         """
-        return self.repository.get_by_uuid(session, uuid)
+        cache = self._cache(session)
+        key = ("uuid", uuid)
+        if key in cache:
+            return cache[key]
+
+        suite = self.repository.get_by_uuid(session, uuid)
+        if suite is not None:
+            cache[key] = suite
+        return suite
 
     def list_test_suites(
         self,
@@ -167,7 +253,7 @@ class TestSuiteService:
             return None
 
         updated_suite = self.repository.update(session, suite, **kwargs)
-        session.commit()
+        self._commit(session)
         return updated_suite
 
     def delete_test_suite(self, session: Session, suite_id: int) -> bool:
@@ -182,7 +268,7 @@ class TestSuiteService:
         """
         result = self.repository.delete_by_id(session, suite_id)
         if result:
-            session.commit()
+            self._commit(session)
         return result
 
     def add_test_case_to_suite(
@@ -194,9 +280,13 @@ class TestSuiteService:
         is_enabled: bool = True,
         case_parameters: dict | None = None,
         description: str | None = None,
+        refresh: bool = False,
     ) -> TestSuiteCase:
         """Add test case to suite.
 
+        Server-generated columns such as ``created_at`` are fetched with the
+        INSERT itself; ``refresh`` reloads the whole row afterwards.
+
         Args:
             session: Database session
             suite_id: Suite ID
@@ -205,6 +295,7 @@ class TestSuiteService:
             is_enabled: Whether test case is enabled
             case_parameters: Test case parameter overrides
             description: Description
+            refresh: Reload the row after committing
 
         Returns:
             Created TestSuiteCase instance
@@ -220,11 +311,46 @@ class TestSuiteService:
         )
 
         session.add(suite_case)
-        session.commit()
-        session.refresh(suite_case)
+        self._commit(session)
+        if refresh:
+            session.refresh(suite_case)
 
         return suite_case
 
+    def add_test_cases_to_suite(
+        self, session: Session, suite_id: int, items: list[dict[str, Any]]
+    ) -> list[TestSuiteCase]:
+        """Add multiple test cases to a suite in one batched INSERT.
+
+        Args:
+            session: Database session
+            suite_id: Suite ID
+            items: Entries with ``test_case_id`` and any of the other
+                add_test_case_to_suite() fields; missing fields take the
+                same defaults
+
+        Returns:
+            Created TestSuiteCase instances in the same order as ``items``
+
+        Example:
+            >>> service.add_test_cases_to_suite(
+            ...     session,
+            ...     1,
+            ...     [
+            ...         {"test_case_id": 1, "execution_order": 1},
+            ...         {"test_case_id": 2, "execution_order": 2, "is_enabled": False},
+            ...     ]
+            ... )
+        """
+        rows = [
+            {**_SUITE_CASE_DEFAULTS, **item, "test_suite_id": suite_id}
+            for item in items
+        ]
+        suite_cases = self.case_repository.create_many(session, rows)
+
+        self._commit(session)
+        return suite_cases
+
     def get_suite_test_cases(
         self, session: Session, suite_id: int
     ) -> list[TestSuiteCase]:
@@ -237,11 +363,9 @@ class TestSuiteService:
         Returns:
             List of TestSuiteCase instances ordered by execution_order
         """
-        suite = self.repository.get_by_id(session, suite_id)
-        if not suite:
-            return []
-
-        return sorted(suite.test_suite_cases, key=lambda x: x.execution_order)
+        return self.case_repository.get_by_test_suite(
+            session, suite_id, enabled_only=False
+        )
 
     def update_suite_test_case(
         self, session: Session, suite_case_id: int, **kwargs: Any
@@ -251,7 +375,7 @@ class TestSuiteService:
         Args:
             session: Database session
             suite_case_id: TestSuiteCase ID
-            **kwargs: Fields to update
+            **kwargs: Fields to update; unknown fields are ignored
 
         Returns:
             Updated TestSuiteCase instance or None if not found
@@ -260,11 +384,10 @@ class TestSuiteService:
         if not suite_case:
             return None
 
-        for key, value in kwargs.items():
-            if hasattr(suite_case, key):
-                setattr(suite_case, key, value)
+        for key in kwargs.keys() & _SUITE_CASE_COLUMNS:
+            setattr(suite_case, key, kwargs[key])
 
-        session.commit()
+        self._commit(session)
         session.refresh(suite_case)
         return suite_case
 
@@ -283,7 +406,7 @@ class TestSuiteService:
             return False
 
         session.delete(suite_case)
-        session.commit()
+        self._commit(session)
         return True
 
     def enable_scheduling(
@@ -334,19 +457,17 @@ class TestSuiteService:
         if not suite:
             return None
 
-        # Get test cases in execution order
-        test_cases = []
-        for tsc in sorted(suite.test_suite_cases, key=lambda x: x.execution_order):
-            if tsc.is_enabled:
-                test_cases.append(
-                    {
-                        "order": tsc.execution_order,
-                        "test_case_id": tsc.test_case_id,
-                        "test_case_name": tsc.test_case.name,
-                        "parameters": tsc.case_parameters,
-                        "description": tsc.description,
-                    }
-                )
+        # Enabled test cases, filtered and ordered by the database
+        test_cases = [
+            {
+                "order": tsc.execution_order,
+                "test_case_id": tsc.test_case_id,
+                "test_case_name": tsc.test_case.name,
+                "parameters": tsc.case_parameters,
+                "description": tsc.description,
+            }
+            for tsc in self.case_repository.get_by_test_suite(session, suite_id)
+        ]
 
         return {
             "suite": {
@@ -396,17 +517,8 @@ class TestSuiteService:
             created_by=source.created_by,
         )
 
-        # Clone test case associations
-        for tsc in source.test_suite_cases:
-            suite_case = TestSuiteCase(
-                test_suite_id=cloned.id,
-                test_case_id=tsc.test_case_id,
-                execution_order=tsc.execution_order,
-                is_enabled=tsc.is_enabled,
-                case_parameters=tsc.case_parameters,
-                description=tsc.description,
-            )
-            session.add(suite_case)
-
-        session.commit()
+        # Copy test case associations inside the database
+        self.case_repository.copy_to_test_suite(session, source.id, cloned.id)
+
+        self._commit(session)
         return cloned
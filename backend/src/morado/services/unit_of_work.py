@@ -0,0 +1,111 @@
+"""Transaction scoping shared by the service layer.
+
+Service methods commit their own changes by default. Callers that compose
+several service calls can wrap them in :func:`transaction` so that the
+individual commits turn into flushes and the whole block commits once:
+
+    >>> with transaction(session):
+    ...     execution_service.complete_execution(session, 1, ExecutionStatus.PASSED)
+    ...     execution_service.update_execution_stats(session, 1, passed_count=10)
+"""
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# session.info key of the nesting depth of transaction() blocks
+_DEPTH_KEY = "service_transaction_depth"
+
+
+def commit(session: Session) -> None:
+    """Commit the session, or only flush it inside a transaction() block.
+
+    Args:
+        session: Database session
+    """
+    if session.info.get(_DEPTH_KEY):
+        session.flush()
+    else:
+        session.commit()
+
+
+async def commit_async(session: AsyncSession) -> None:
+    """Commit the session, or only flush it inside a transaction block (async).
+
+    Args:
+        session: Async database session
+    """
+    if session.info.get(_DEPTH_KEY):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+@contextmanager
+def transaction(session: Session) -> Iterator[Session]:
+    """Run several service calls as one transaction.
+
+    Service methods called inside the block do not commit on their own. The
+    outermost block commits once when it exits normally and rolls everything
+    back if it raises. Blocks may be nested: an inner block runs in a
+    SAVEPOINT, so if it raises only its own changes are rolled back and the
+    outer block can catch the error and carry on.
+
+    Args:
+        session: Database session
+
+    Yields:
+        The given session
+    """
+    depth = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
+    try:
+        if depth:
+            with session.begin_nested():
+                yield session
+        else:
+            yield session
+            session.commit()
+    except Exception:
+        if depth == 0:
+            session.rollback()
+        raise
+    finally:
+        if depth == 0:
+            session.info.pop(_DEPTH_KEY, None)
+        else:
+            session.info[_DEPTH_KEY] = depth
+
+
+@asynccontextmanager
+async def transaction_async(session: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Run several service calls as one transaction (async).
+
+    See :func:`transaction`; nested blocks likewise run in a SAVEPOINT.
+
+    Args:
+        session: Async database session
+
+    Yields:
+        The given session
+    """
+    depth = session.info.get(_DEPTH_KEY, 0)
+    session.info[_DEPTH_KEY] = depth + 1
+    try:
+        if depth:
+            async with session.begin_nested():
+                yield session
+        else:
+            yield session
+            await session.commit()
+    except Exception:
+        if depth == 0:
+            await session.rollback()
+        raise
+    finally:
+        if depth == 0:
+            session.info.pop(_DEPTH_KEY, None)
+        else:
+            session.info[_DEPTH_KEY] = depth
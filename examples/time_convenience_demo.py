@@ -3,7 +3,7 @@
 这个脚本展示了如何使用 TimeUtil 类的新增便捷方法来进行时间计算。
 """
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from morado.common.utils import TimeUtil
 
 
@@ -128,6 +128,10 @@ def demo_practical_use_cases():
     end_time = TimeUtil.now_utc()
     print(f"开始时间: {start_time}")
     print(f"结束时间: {end_time}")
+    # 批量计算每天的时间点，只读取一次当前时间
+    daily_points = TimeUtil.add_to_now_batch(timedelta(days=-d) for d in range(7, 0, -1))
+    for point in daily_points:
+        print(f"  {point}")
     
     # 场景 3: 计划任务
     print("\n场景 3: 计划 2 小时后执行的任务")
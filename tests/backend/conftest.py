@@ -4,40 +4,93 @@ import sys
 from pathlib import Path
 
 import pytest
+import pytest_asyncio
 
 # Add backend/src to Python path
 backend_src = Path(__file__).parent.parent.parent / "backend" / "src"
 sys.path.insert(0, str(backend_src))
 
+from morado.core.database import enable_sqlite_foreign_keys
 from morado.models.base import Base
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 
 
-@pytest.fixture
+def _emit_begin(engine: Engine) -> None:
+    """Let SQLAlchemy emit BEGIN itself on a SQLite engine.
+
+    The SAVEPOINTs of the test sessions then nest inside the per-test
+    transaction instead of committing.
+    """
+
+    @event.listens_for(engine, "connect")
+    def disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
+@pytest.fixture(scope="session")
 def engine():
-    """Create an in-memory SQLite engine for testing."""
+    """Create an in-memory SQLite engine shared by all tests.
+
+    The schema is created once; each test runs in a transaction that the
+    connection fixture rolls back. The database lives in the test process,
+    so pytest-xdist workers (``-n auto --dist=loadfile``) each get their own
+    and need no per-worker database URL or migration run.
+    """
     engine = create_engine(
         "sqlite:///:memory:",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
-    Base.metadata.create_all(engine)
+
+    _emit_begin(engine)
+    enable_sqlite_foreign_keys(engine)
+
+    # The in-memory database starts empty and the schema is built straight
+    # from the models (no migrations to replay), so skip the existence checks
+    Base.metadata.create_all(engine, checkfirst=False)
     yield engine
-    Base.metadata.drop_all(engine)
     engine.dispose()
 
 
 @pytest.fixture
-def session(engine):
+def connection(engine):
+    """Open a connection whose transaction is rolled back after the test."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def session_maker():
+    """Create the session factory shared by all tests.
+
+    Sessions are bound to the test's connection when created and join its
+    transaction; commits inside a test only release a SAVEPOINT. Like the
+    application's factory, sessions do not expire objects on commit.
+    """
+    return sessionmaker(
+        join_transaction_mode="create_savepoint", expire_on_commit=False
+    )
+
+
+@pytest.fixture
+def session(session_maker, connection):
     """Create a new database session for a test."""
-    session_local = sessionmaker(bind=engine)
-    session = session_local()
+    session = session_maker(bind=connection)
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
 
 
@@ -45,3 +98,50 @@ def session(engine):
 def db_session(session):
     """Alias for session fixture for compatibility."""
     return session
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_engine():
+    """Create an in-memory aiosqlite engine for the async code paths.
+
+    Like the sync engine, its schema is created once and each test runs in
+    a transaction that is rolled back. The engine lives on the session's
+    event loop, so tests using it must be marked with
+    ``@pytest.mark.asyncio(loop_scope="session")``.
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+    _emit_begin(engine.sync_engine)
+    enable_sqlite_foreign_keys(engine.sync_engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all, checkfirst=False)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_connection(async_engine):
+    """Open an async connection whose transaction is rolled back after the test."""
+    async with async_engine.connect() as connection:
+        transaction = await connection.begin()
+        try:
+            yield connection
+        finally:
+            await transaction.rollback()
+
+
+@pytest.fixture(scope="session")
+def async_session_maker():
+    """Create the async session factory shared by all tests.
+
+    Configured like session_maker.
+    """
+    return async_sessionmaker(
+        join_transaction_mode="create_savepoint", expire_on_commit=False
+    )
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def async_session(async_session_maker, async_connection):
+    """Create a new async database session for a test."""
+    async with async_session_maker(bind=async_connection) as session:
+        yield session
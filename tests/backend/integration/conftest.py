@@ -1,38 +1,37 @@
-"""Pytest configuration for integration tests."""
+"""Pytest configuration for integration tests.
+
+The engine and the per-test ``connection`` come from tests/backend/conftest.py.
+The Litestar app is built once per session and its test clients are started
+once per module.
+"""
+
+from functools import partial
+from types import SimpleNamespace
 
 import pytest
+import pytest_asyncio
 from litestar import Litestar
-from litestar.testing import TestClient
+from litestar.testing import AsyncTestClient, TestClient
 from morado.api.v1.api_definition import ApiDefinitionController
 from morado.api.v1.body import BodyController
 from morado.api.v1.component import TestComponentController
 from morado.api.v1.header import HeaderController
 from morado.api.v1.script import TestScriptController
 from morado.api.v1.test_case import TestCaseController
-from morado.models.base import Base
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
-from sqlalchemy.pool import StaticPool
-
-
-@pytest.fixture
-def engine():
-    """Create an in-memory SQLite engine for testing."""
-    engine = create_engine(
-        "sqlite:///:memory:",
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
-    )
-    Base.metadata.create_all(engine)
-    yield engine
-    Base.metadata.drop_all(engine)
-    engine.dispose()
+from morado.common.utils import uuid4
+from morado.models.api_component import HeaderScope
+from morado.repositories.api_component import (
+    ApiDefinitionRepository,
+    BodyRepository,
+    HeaderRepository,
+)
+from sqlalchemy.orm import Session
 
 
 @pytest.fixture
-def session_factory(engine):
-    """Create a session factory."""
-    return sessionmaker(bind=engine)
+def session_factory(session_maker, connection):
+    """Create sessions bound to the test's connection."""
+    return partial(session_maker, bind=connection)
 
 
 @pytest.fixture
@@ -42,26 +41,87 @@ def db_session(session_factory):
     try:
         yield session
     finally:
-        session.rollback()
         session.close()
 
 
-def provide_db_session(session_factory) -> Session:
-    """Provide database session for dependency injection."""
-    session = session_factory()
-    try:
-        return session
-    finally:
-        session.close()
+@pytest.fixture(scope="module")
+def shared_header_id(engine, session_maker):
+    """Create a header shared by the tests of a module and return its ID.
+
+    Tests that only need some header to reference can use it instead of
+    creating their own. It is committed outside the per-test transactions,
+    so every test of the module sees it, and is deleted after the module.
+    """
+    repository = HeaderRepository()
+    with session_maker(bind=engine) as session:
+        header = repository.create(
+            session,
+            uuid=uuid4(),
+            name="Shared Header",
+            headers={"Content-Type": "application/json"},
+            scope=HeaderScope.GLOBAL,
+        )
+        session.commit()
+        header_id = header.id
+    yield header_id
+    with session_maker(bind=engine) as session:
+        repository.delete_by_id(session, header_id)
+        session.commit()
 
 
 @pytest.fixture
-def app(session_factory):
-    """Create a Litestar app for testing."""
+def seed(db_session):
+    """Insert test data straight into the database, bypassing the API.
+
+    Seeding through the API costs one request per row. The returned function
+    inserts each kind of component with one batched INSERT, in the order
+    headers, bodies, API definitions, and commits once. Rows get a UUID
+    unless they carry one.
+
+    Example:
+        >>> ids = seed(headers=[{"name": "H", "headers": {}}])
+        >>> header_id = ids["headers"][0]
+    """
+
+    def seed(headers=(), bodies=(), api_definitions=()):
+        ids = {}
+        for key, repository, rows in (
+            ("headers", HeaderRepository(), headers),
+            ("bodies", BodyRepository(), bodies),
+            ("api_definitions", ApiDefinitionRepository(), api_definitions),
+        ):
+            created = repository.create_many(
+                db_session, [{"uuid": uuid4(), **row} for row in rows]
+            )
+            ids[key] = [instance.id for instance in created]
+        db_session.commit()
+        return ids
+
+    return seed
+
+
+@pytest.fixture(scope="session")
+def session_provider():
+    """Hold the session factory of the test that is currently running.
+
+    The app and its clients are shared across tests, while each test has its
+    own connection; the client fixtures swap the factory in.
+    """
+    return SimpleNamespace(session_factory=None)
+
+
+@pytest.fixture(scope="session")
+def app(session_provider):
+    """Create a Litestar app for testing.
+
+    Building the app resolves the route tree and signature models of every
+    handler, so it is done once and the database is swapped underneath it
+    through ``session_provider``.
+    """
 
     def session_dependency() -> Session:
         """Dependency that provides database session."""
-        session = session_factory()
+        session = session_provider.session_factory()
         try:
             yield session
         finally:
@@ -83,8 +143,45 @@ def app(session_factory):
     return app
 
 
-@pytest.fixture
-def client(app):
-    """Create a test client."""
+@pytest.fixture(scope="module")
+def module_client(app):
+    """Start the app once for all tests of a module."""
     with TestClient(app=app) as client:
         yield client
+
+
+@pytest.fixture
+def client(module_client, session_provider, session_factory):
+    """Create a test client whose requests use the test's connection."""
+    session_provider.session_factory = session_factory
+    try:
+        yield module_client
+    finally:
+        session_provider.session_factory = None
+        module_client.cookies.clear()
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def module_aclient(app):
+    """Start the app once for all async tests of a module.
+
+    The client lives on the module's event loop, so tests using it must be
+    marked with ``@pytest.mark.asyncio(loop_scope="module")``.
+    """
+    async with AsyncTestClient(app=app) as client:
+        yield client
+
+
+@pytest.fixture
+def aclient(module_aclient, session_provider, session_factory):
+    """Create an async test client whose requests use the test's connection.
+
+    Requests run on the event loop instead of a portal thread, so
+    independent requests can be sent concurrently with asyncio.gather().
+    """
+    session_provider.session_factory = session_factory
+    try:
+        yield module_aclient
+    finally:
+        session_provider.session_factory = None
+        module_aclient.cookies.clear()
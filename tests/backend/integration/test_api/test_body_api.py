@@ -1,10 +1,13 @@
 """Integration tests for Body API endpoints."""
 
+import asyncio
+
+import pytest
 from litestar.status_codes import (
     HTTP_200_OK,
     HTTP_201_CREATED,
-    HTTP_404_NOT_FOUND,
 )
+from morado.models.api_component import BodyType, HeaderScope
 
 
 class TestBodyAPI:
@@ -118,27 +121,6 @@ class TestBodyAPI:
         assert len(data["items"]) >= 1
         assert any("User" in item["name"] for item in data["items"])
 
-    def test_get_body_by_id(self, client):
-        """Test getting a body by ID."""
-        # Create a body
-        create_response = client.post(
-            "/bodies/",
-            json={
-                "name": "Test Body",
-                "body_type": "request",
-                "example_data": {"test": "data"},
-                "scope": "global",
-            },
-        )
-        body_id = create_response.json()["id"]
-
-        # Get by ID
-        response = client.get(f"/bodies/{body_id}")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["id"] == body_id
-        assert data["name"] == "Test Body"
-
     def test_get_body_by_uuid(self, client):
         """Test getting a body by UUID."""
         # Create a body
@@ -160,100 +142,50 @@ class TestBodyAPI:
         assert data["uuid"] == uuid
         assert data["name"] == "Test Body"
 
-    def test_get_nonexistent_body(self, client):
-        """Test getting a body that doesn't exist."""
-        response = client.get("/bodies/99999")
-        assert response.status_code == HTTP_404_NOT_FOUND
-
-    def test_update_body(self, client):
-        """Test updating a body."""
-        # Create a body
-        create_response = client.post(
-            "/bodies/",
-            json={
-                "name": "Original Body",
-                "body_type": "request",
-                "example_data": {"original": "data"},
-                "scope": "global",
-            },
-        )
-        body_id = create_response.json()["id"]
-
-        # Update the body
-        response = client.patch(
-            f"/bodies/{body_id}",
-            json={
-                "name": "Updated Body",
-                "example_data": {"updated": "data"},
-            },
-        )
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["name"] == "Updated Body"
-        assert data["example_data"] == {"updated": "data"}
-
-    def test_delete_body(self, client):
-        """Test deleting a body."""
-        # Create a body
-        create_response = client.post(
-            "/bodies/",
-            json={
-                "name": "To Delete",
-                "body_type": "request",
-                "example_data": {"delete": "me"},
-                "scope": "global",
-            },
-        )
-        body_id = create_response.json()["id"]
-
-        # Delete the body
-        response = client.delete(f"/bodies/{body_id}")
-        assert response.status_code == HTTP_200_OK
-
-        # Verify it's deleted
-        get_response = client.get(f"/bodies/{body_id}")
-        assert get_response.status_code == HTTP_404_NOT_FOUND
-
-    def test_body_reusability(self, client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_body_reusability(self, aclient, seed):
         """Test that bodies can be reused across multiple API definitions."""
-        # Create a reusable body
-        body_response = client.post(
-            "/bodies/",
-            json={
-                "name": "Shared Response Body",
-                "body_type": "response",
-                "example_data": {"status": "success", "data": {}},
-                "scope": "global",
-            },
+        # Seed a reusable body and a header for the API definitions
+        ids = seed(
+            headers=[
+                {
+                    "name": "Test Header",
+                    "headers": {"Content-Type": "application/json"},
+                    "scope": HeaderScope.GLOBAL,
+                }
+            ],
+            bodies=[
+                {
+                    "name": "Shared Response Body",
+                    "body_type": BodyType.RESPONSE,
+                    "example_data": {"status": "success", "data": {}},
+                    "scope": HeaderScope.GLOBAL,
+                }
+            ],
         )
-        body_id = body_response.json()["id"]
-
-        # Create a header for the API definitions
-        header_response = client.post(
-            "/headers/",
-            json={
-                "name": "Test Header",
-                "headers": {"Content-Type": "application/json"},
-                "scope": "global",
-            },
-        )
-        header_id = header_response.json()["id"]
-
-        # Create multiple API definitions using the same body
-        for i in range(3):
-            api_response = client.post(
-                "/api-definitions/",
-                json={
-                    "name": f"API {i}",
-                    "method": "GET",
-                    "path": f"/api/endpoint{i}",
-                    "header_id": header_id,
-                    "response_body_id": body_id,
-                },
+        body_id = ids["bodies"][0]
+        header_id = ids["headers"][0]
+
+        # Create multiple API definitions using the same body concurrently
+        api_responses = await asyncio.gather(
+            *(
+                aclient.post(
+                    "/api-definitions/",
+                    json={
+                        "name": f"API {i}",
+                        "method": "GET",
+                        "path": f"/api/endpoint{i}",
+                        "header_id": header_id,
+                        "response_body_id": body_id,
+                    },
+                )
+                for i in range(3)
             )
+        )
+        for api_response in api_responses:
             assert api_response.status_code == HTTP_201_CREATED
             assert api_response.json()["response_body_id"] == body_id
 
         # Verify the body is still accessible
-        get_response = client.get(f"/bodies/{body_id}")
+        get_response = await aclient.get(f"/bodies/{body_id}")
         assert get_response.status_code == HTTP_200_OK
@@ -0,0 +1,133 @@
+"""Integration tests for the CRUD endpoints shared by all API components.
+
+Headers, bodies and API definitions expose the same create/get/update/delete
+endpoints, so each scenario runs once per resource.
+"""
+
+import pytest
+from litestar.status_codes import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_404_NOT_FOUND,
+)
+from morado.models.api_component import HeaderScope
+
+RESOURCES = ["headers", "bodies", "api-definitions"]
+
+
+def _header_payloads(seed):
+    """Return the create and update payloads of a header."""
+    return (
+        {
+            "name": "Original Name",
+            "headers": {"X-Original": "value"},
+            "scope": "global",
+        },
+        {"name": "Updated Name", "headers": {"X-Updated": "new_value"}},
+    )
+
+
+def _body_payloads(seed):
+    """Return the create and update payloads of a body."""
+    return (
+        {
+            "name": "Original Body",
+            "body_type": "request",
+            "example_data": {"original": "data"},
+            "scope": "global",
+        },
+        {"name": "Updated Body", "example_data": {"updated": "data"}},
+    )
+
+
+def _api_definition_payloads(seed):
+    """Return the create and update payloads of an API definition."""
+    header_id = seed(
+        headers=[
+            {
+                "name": "Test Header",
+                "headers": {"Content-Type": "application/json"},
+                "scope": HeaderScope.GLOBAL,
+            }
+        ]
+    )["headers"][0]
+    return (
+        {
+            "name": "Original API",
+            "method": "GET",
+            "path": "/api/original",
+            "header_id": header_id,
+        },
+        {"name": "Updated API", "path": "/api/updated"},
+    )
+
+
+@pytest.fixture(
+    params=[
+        ("headers", _header_payloads),
+        ("bodies", _body_payloads),
+        ("api-definitions", _api_definition_payloads),
+    ],
+    ids=RESOURCES,
+)
+def resource_payloads(request, seed):
+    """Return a resource path with its create and update payloads."""
+    resource, payloads = request.param
+    return (resource, *payloads(seed))
+
+
+class TestCrudEndpoints:
+    """Test the CRUD endpoints of every API component."""
+
+    def test_crud_roundtrip(self, client, resource_payloads):
+        """Test creating, getting, updating and deleting a resource."""
+        resource, create_payload, update_payload = resource_payloads
+
+        # Create
+        create_response = client.post(f"/{resource}/", json=create_payload)
+        assert create_response.status_code == HTTP_201_CREATED
+        resource_id = create_response.json()["id"]
+        resource_path = f"/{resource}/{resource_id}"
+
+        # Get by ID
+        response = client.get(resource_path)
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        assert data["id"] == resource_id
+        assert data["name"] == create_payload["name"]
+
+        # Update
+        response = client.patch(resource_path, json=update_payload)
+        assert response.status_code == HTTP_200_OK
+        data = response.json()
+        for field, value in update_payload.items():
+            assert data[field] == value
+
+        # Delete
+        response = client.delete(resource_path)
+        assert response.status_code == HTTP_200_OK
+
+        # Verify it's deleted
+        get_response = client.get(resource_path)
+        assert get_response.status_code == HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("resource", RESOURCES)
+    def test_get_nonexistent_resource(self, client, resource):
+        """Test getting a resource that doesn't exist."""
+        response = client.get(f"/{resource}/99999")
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("resource", RESOURCES)
+    def test_update_nonexistent_resource(self, client, resource):
+        """Test updating a resource that doesn't exist."""
+        response = client.patch(
+            f"/{resource}/99999",
+            json={"name": "Updated Name"},
+        )
+        assert response.status_code == HTTP_404_NOT_FOUND
+
+    @pytest.mark.parametrize("resource", RESOURCES)
+    def test_delete_nonexistent_resource(self, client, resource):
+        """Test deleting a resource that doesn't exist."""
+        response = client.delete(f"/{resource}/99999")
+        assert response.status_code == HTTP_404_NOT_FOUND
@@ -1,11 +1,81 @@
 """Integration tests for API error responses."""
 
+import pytest
 from litestar.status_codes import (
+    HTTP_200_OK,
     HTTP_400_BAD_REQUEST,
     HTTP_404_NOT_FOUND,
     HTTP_422_UNPROCESSABLE_ENTITY,
 )
 
+INVALID_REQUEST = {HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY}
+
+# Requests that must fail (or at least not crash), with the accepted status
+# codes: (method, url, request kwargs, expected status codes). Requests the
+# framework rejects before any handler runs are in test_framework_contracts.py.
+ERROR_CASES = [
+    pytest.param(
+        "POST",
+        "/headers/",
+        # Missing required 'headers' field
+        {"json": {"name": "Test Header"}},
+        INVALID_REQUEST,
+        id="missing_required_fields",
+    ),
+    pytest.param(
+        "GET",
+        "/headers/uuid/invalid-uuid-format",
+        {},
+        {HTTP_404_NOT_FOUND, *INVALID_REQUEST},
+        id="invalid_uuid_format",
+    ),
+    pytest.param(
+        # 'name' parameter is required
+        "GET",
+        "/headers/search",
+        {},
+        INVALID_REQUEST,
+        id="search_without_required_parameter",
+    ),
+    pytest.param(
+        # Might return 400 or just empty results, but should not crash
+        "GET",
+        "/headers/?scope=invalid_scope_value",
+        {},
+        {HTTP_200_OK, *INVALID_REQUEST},
+        id="invalid_filter_values",
+    ),
+    pytest.param(
+        # More than the max limit
+        "GET",
+        "/headers/?limit=1000",
+        {},
+        INVALID_REQUEST,
+        id="pagination_limits",
+    ),
+    pytest.param(
+        "POST",
+        "/api-definitions/",
+        # Missing required header_id
+        {"json": {"name": "Invalid API", "method": "GET", "path": "/api/test"}},
+        INVALID_REQUEST,
+        id="create_api_definition_without_header",
+    ),
+    pytest.param(
+        "POST",
+        "/scripts/",
+        {
+            "json": {
+                "name": "Invalid Script",
+                "api_definition_id": 99999,  # Non-existent
+                "script_type": "main",
+            }
+        },
+        {HTTP_404_NOT_FOUND, *INVALID_REQUEST},
+        id="create_script_with_invalid_api_definition",
+    ),
+]
+
 
 class TestErrorResponses:
     """Test API error response formats and handling."""
@@ -33,102 +103,11 @@ class TestErrorResponses:
         # Litestar returns validation errors in a specific format
         assert "detail" in data or "extra" in data
 
-    def test_missing_required_fields(self, client):
-        """Test error when required fields are missing."""
-        response = client.post(
-            "/headers/",
-            json={
-                "name": "Test Header",
-                # Missing required 'headers' field
-            },
-        )
-        assert response.status_code in [HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_invalid_json_format(self, client):
-        """Test error handling for invalid JSON."""
-        response = client.post(
-            "/headers/",
-            content="invalid json{",
-            headers={"Content-Type": "application/json"},
-        )
-        assert response.status_code in [HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_invalid_query_parameters(self, client):
-        """Test error handling for invalid query parameters."""
-        # Try to list with invalid skip value
-        response = client.get("/headers/?skip=-1")
-        assert response.status_code in [HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_update_nonexistent_resource(self, client):
-        """Test updating a resource that doesn't exist."""
-        response = client.patch(
-            "/headers/99999",
-            json={"name": "Updated Name"},
-        )
-        assert response.status_code == HTTP_404_NOT_FOUND
-
-    def test_delete_nonexistent_resource(self, client):
-        """Test deleting a resource that doesn't exist."""
-        response = client.delete("/headers/99999")
-        assert response.status_code == HTTP_404_NOT_FOUND
-
-    def test_invalid_uuid_format(self, client):
-        """Test error handling for invalid UUID format."""
-        response = client.get("/headers/uuid/invalid-uuid-format")
-        # Should return 404 or validation error
-        assert response.status_code in [HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_invalid_method_on_endpoint(self, client):
-        """Test using wrong HTTP method on endpoint."""
-        # Try to POST to a GET-only endpoint
-        response = client.post("/headers/1")
-        # Should return 405 Method Not Allowed
-        assert response.status_code == 405
-
-    def test_search_without_required_parameter(self, client):
-        """Test search endpoint without required parameter."""
-        response = client.get("/headers/search")
-        # Should fail because 'name' parameter is required
-        assert response.status_code in [HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_invalid_filter_values(self, client):
-        """Test filtering with invalid values."""
-        response = client.get("/headers/?scope=invalid_scope_value")
-        # Depending on implementation, might return 400 or just empty results
-        # At minimum, should not crash
-        assert response.status_code in [200, HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_pagination_limits(self, client):
-        """Test pagination with out-of-range limits."""
-        # Try to request more than max limit
-        response = client.get("/headers/?limit=1000")
-        assert response.status_code in [HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_create_api_definition_without_header(self, client):
-        """Test creating API definition without required header."""
-        response = client.post(
-            "/api-definitions/",
-            json={
-                "name": "Invalid API",
-                "method": "GET",
-                "path": "/api/test",
-                # Missing required header_id
-            },
-        )
-        assert response.status_code in [HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
-
-    def test_create_script_with_invalid_api_definition(self, client):
-        """Test creating script with non-existent API definition."""
-        response = client.post(
-            "/scripts/",
-            json={
-                "name": "Invalid Script",
-                "api_definition_id": 99999,  # Non-existent
-                "script_type": "main",
-            },
-        )
-        # Should fail validation
-        assert response.status_code in [HTTP_404_NOT_FOUND, HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY]
+    @pytest.mark.parametrize(("method", "url", "kwargs", "expected"), ERROR_CASES)
+    def test_error_cases(self, client, method, url, kwargs, expected):
+        """Test that invalid requests are rejected with the expected status."""
+        response = client.request(method, url, **kwargs)
+        assert response.status_code in expected
 
     def test_error_response_consistency(self, client):
         """Test that all error responses follow consistent format."""
@@ -85,10 +85,10 @@ class TestFourLayerIntegration:
             },
         )
         assert script_response.status_code == HTTP_201_CREATED
-        script_id = script_response.json()["id"]
+        script_data = script_response.json()
+        script_id = script_data["id"]
 
         # Verify script references the API definition
-        script_data = script_response.json()
         assert script_data["api_definition_id"] == api_def_id
 
         # Layer 3: Create Component using the Script
@@ -161,10 +161,10 @@ class TestFourLayerIntegration:
             },
         )
         assert api_def_response.status_code == HTTP_201_CREATED
-        api_def_id = api_def_response.json()["id"]
+        api_def_data = api_def_response.json()
+        api_def_id = api_def_data["id"]
 
         # Verify inline body is stored
-        api_def_data = api_def_response.json()
         assert api_def_data["inline_response_body"] is not None
         assert api_def_data["response_body_id"] is None
 
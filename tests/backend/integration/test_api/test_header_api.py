@@ -1,9 +1,11 @@
 """Integration tests for Header API endpoints."""
 
+import asyncio
+
+import pytest
 from litestar.status_codes import (
     HTTP_200_OK,
     HTTP_201_CREATED,
-    HTTP_404_NOT_FOUND,
 )
 
 
@@ -113,26 +115,6 @@ class TestHeaderAPI:
         assert len(data["items"]) >= 1
         assert any("Auth" in item["name"] for item in data["items"])
 
-    def test_get_header_by_id(self, client):
-        """Test getting a header by ID."""
-        # Create a header
-        create_response = client.post(
-            "/headers/",
-            json={
-                "name": "Test Header",
-                "headers": {"X-Test": "value"},
-                "scope": "global",
-            },
-        )
-        header_id = create_response.json()["id"]
-
-        # Get by ID
-        response = client.get(f"/headers/{header_id}")
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["id"] == header_id
-        assert data["name"] == "Test Header"
-
     def test_get_header_by_uuid(self, client):
         """Test getting a header by UUID."""
         # Create a header
@@ -153,58 +135,6 @@ class TestHeaderAPI:
         assert data["uuid"] == uuid
         assert data["name"] == "Test Header"
 
-    def test_get_nonexistent_header(self, client):
-        """Test getting a header that doesn't exist."""
-        response = client.get("/headers/99999")
-        assert response.status_code == HTTP_404_NOT_FOUND
-
-    def test_update_header(self, client):
-        """Test updating a header."""
-        # Create a header
-        create_response = client.post(
-            "/headers/",
-            json={
-                "name": "Original Name",
-                "headers": {"X-Original": "value"},
-                "scope": "global",
-            },
-        )
-        header_id = create_response.json()["id"]
-
-        # Update the header
-        response = client.patch(
-            f"/headers/{header_id}",
-            json={
-                "name": "Updated Name",
-                "headers": {"X-Updated": "new_value"},
-            },
-        )
-        assert response.status_code == HTTP_200_OK
-        data = response.json()
-        assert data["name"] == "Updated Name"
-        assert data["headers"] == {"X-Updated": "new_value"}
-
-    def test_delete_header(self, client):
-        """Test deleting a header."""
-        # Create a header
-        create_response = client.post(
-            "/headers/",
-            json={
-                "name": "To Delete",
-                "headers": {"X-Delete": "value"},
-                "scope": "global",
-            },
-        )
-        header_id = create_response.json()["id"]
-
-        # Delete the header
-        response = client.delete(f"/headers/{header_id}")
-        assert response.status_code == HTTP_200_OK
-
-        # Verify it's deleted
-        get_response = client.get(f"/headers/{header_id}")
-        assert get_response.status_code == HTTP_404_NOT_FOUND
-
     def test_activate_header(self, client):
         """Test activating a header."""
         # Create a header
@@ -245,10 +175,11 @@ class TestHeaderAPI:
         data = response.json()
         assert data["is_active"] is False
 
-    def test_header_reusability(self, client):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_header_reusability(self, aclient):
         """Test that headers can be reused across multiple API definitions."""
         # Create a reusable header
-        header_response = client.post(
+        header_response = await aclient.post(
             "/headers/",
             json={
                 "name": "Shared Auth Header",
@@ -258,20 +189,25 @@ class TestHeaderAPI:
         )
         header_id = header_response.json()["id"]
 
-        # Create multiple API definitions using the same header
-        for i in range(3):
-            api_response = client.post(
-                "/api-definitions/",
-                json={
-                    "name": f"API {i}",
-                    "method": "GET",
-                    "path": f"/api/endpoint{i}",
-                    "header_id": header_id,
-                },
+        # Create multiple API definitions using the same header concurrently
+        api_responses = await asyncio.gather(
+            *(
+                aclient.post(
+                    "/api-definitions/",
+                    json={
+                        "name": f"API {i}",
+                        "method": "GET",
+                        "path": f"/api/endpoint{i}",
+                        "header_id": header_id,
+                    },
+                )
+                for i in range(3)
             )
+        )
+        for api_response in api_responses:
             assert api_response.status_code == HTTP_201_CREATED
             assert api_response.json()["header_id"] == header_id
 
         # Verify the header is still accessible
-        get_response = client.get(f"/headers/{header_id}")
+        get_response = await aclient.get(f"/headers/{header_id}")
         assert get_response.status_code == HTTP_200_OK
@@ -0,0 +1,70 @@
+"""Unit tests for requests that Litestar rejects before a handler runs.
+
+Malformed bodies, out-of-range query parameters and unsupported methods are
+turned away by the framework before the handler is called, so these tests
+run against an app whose session dependency provides no database at all.
+"""
+
+import pytest
+from litestar import Litestar
+from litestar.status_codes import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_405_METHOD_NOT_ALLOWED,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+from litestar.testing import TestClient
+from morado.api.v1.header import HeaderController
+
+INVALID_REQUEST = {HTTP_400_BAD_REQUEST, HTTP_422_UNPROCESSABLE_ENTITY}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client for an app without a database."""
+
+    def session_dependency() -> None:
+        """Dependency that provides no database session."""
+        return None
+
+    app = Litestar(
+        route_handlers=[HeaderController],
+        dependencies={"db_session": session_dependency},
+    )
+    with TestClient(app=app) as client:
+        yield client
+
+
+@pytest.mark.parametrize(
+    ("method", "url", "kwargs", "expected"),
+    [
+        pytest.param(
+            "POST",
+            "/headers/",
+            {
+                "content": "invalid json{",
+                "headers": {"Content-Type": "application/json"},
+            },
+            INVALID_REQUEST,
+            id="invalid_json_format",
+        ),
+        pytest.param(
+            "GET",
+            "/headers/?skip=-1",
+            {},
+            INVALID_REQUEST,
+            id="invalid_query_parameters",
+        ),
+        pytest.param(
+            # POST to a GET-only endpoint
+            "POST",
+            "/headers/1",
+            {},
+            {HTTP_405_METHOD_NOT_ALLOWED},
+            id="invalid_method_on_endpoint",
+        ),
+    ],
+)
+def test_rejected_before_handler(client, method, url, kwargs, expected):
+    """Test that invalid requests are rejected by the framework."""
+    response = client.request(method, url, **kwargs)
+    assert response.status_code in expected
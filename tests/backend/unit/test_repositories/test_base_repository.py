@@ -71,6 +71,32 @@ class TestBaseRepositoryCreate:
         assert item1.id != item2.id
         assert item1.uuid != item2.uuid
 
+    def test_create_returning(self, session, test_repo):
+        """Test creating a record with a single INSERT ... RETURNING."""
+        item = test_repo.create_returning(session, uuid="test-uuid", name="Test Item")
+
+        assert item.id is not None
+        assert item.value == 0
+        assert test_repo.get_by_id(session, item.id) is item
+
+    def test_create_many(self, session, test_repo):
+        """Test creating records with a single batched insert."""
+        items = test_repo.create_many(
+            session,
+            [
+                {"uuid": "uuid-1", "name": "Item 1", "value": 1},
+                {"uuid": "uuid-2", "name": "Item 2", "value": 2},
+            ],
+        )
+
+        assert [item.uuid for item in items] == ["uuid-1", "uuid-2"]
+        assert all(item.id is not None for item in items)
+        assert test_repo.count(session) == 2
+
+    def test_create_many_empty(self, session, test_repo):
+        """Test creating no records."""
+        assert test_repo.create_many(session, []) == []
+
 
 class TestBaseRepositoryRead:
     """Test read operations."""
@@ -168,6 +194,21 @@ class TestBaseRepositoryUpdate:
         assert updated.name == original_name
         assert not hasattr(updated, "nonexistent_field")
 
+    def test_update_by_id(self, session, test_repo, sample_data):
+        """Test updating a record by ID without loading it first."""
+        item_id = sample_data[0].id
+        updated = test_repo.update_by_id(
+            session, item_id, value=42, nonexistent_field="value"
+        )
+
+        assert updated.id == item_id
+        assert updated.value == 42
+        assert updated.name == "Item 1"  # Unchanged
+
+    def test_update_by_id_not_exists(self, session, test_repo):
+        """Test updating a record by ID when it doesn't exist."""
+        assert test_repo.update_by_id(session, 999, value=42) is None
+
 
 class TestBaseRepositoryDelete:
     """Test delete operations."""
@@ -200,6 +241,17 @@ class TestBaseRepositoryDelete:
 
         assert result is False
 
+    def test_delete_by_id_without_load(self, session, test_repo, sample_data):
+        """Test deleting a record by ID with a single DELETE statement."""
+        item_id = sample_data[0].id
+
+        result = test_repo.delete_by_id_without_load(session, item_id)
+        session.commit()
+
+        assert result is True
+        assert test_repo.get_by_id(session, item_id) is None
+        assert test_repo.delete_by_id_without_load(session, item_id) is False
+
 
 class TestBaseRepositoryTransactions:
     """Test transaction handling."""
@@ -233,3 +285,112 @@ class TestBaseRepositoryTransactions:
 
         restored_item = test_repo.get_by_id(session, item_id)
         assert restored_item is not None
+
+
+@pytest.fixture
+async def async_sample_data(async_session):
+    """Create sample test data through an async session."""
+    items = [
+        TestModel(uuid="uuid-1", name="Item 1", value=10, is_active=True),
+        TestModel(uuid="uuid-2", name="Item 2", value=20, is_active=True),
+        TestModel(uuid="uuid-3", name="Item 3", value=30, is_active=False),
+    ]
+    async_session.add_all(items)
+    await async_session.commit()
+    return items
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestBaseRepositoryAsync:
+    """Test the async counterparts of the CRUD operations."""
+
+    async def test_create(self, async_session, test_repo):
+        """Test creating records one at a time and in a batch."""
+        item = await test_repo.create_async(
+            async_session, uuid="uuid-a", name="Item A", value=100
+        )
+        returned = await test_repo.create_returning_async(
+            async_session, uuid="uuid-b", name="Item B"
+        )
+        batch = await test_repo.create_many_async(
+            async_session,
+            [
+                {"uuid": "uuid-c", "name": "Item C", "value": 1},
+                {"uuid": "uuid-d", "name": "Item D", "value": 2},
+            ],
+        )
+
+        assert item.id is not None
+        assert item.is_active is True
+        assert returned.value == 0
+        assert await test_repo.get_by_id_async(async_session, returned.id) is returned
+        assert [i.uuid for i in batch] == ["uuid-c", "uuid-d"]
+        assert await test_repo.count_async(async_session) == 4
+        assert await test_repo.create_many_async(async_session, []) == []
+
+    async def test_read(self, async_session, test_repo, async_sample_data):
+        """Test getting records by ID, UUID, filters and page."""
+        item = await test_repo.get_by_id_async(async_session, async_sample_data[0].id)
+        assert item.name == "Item 1"
+        assert await test_repo.get_by_id_async(async_session, 999) is None
+
+        item = await test_repo.get_by_uuid_async(async_session, "uuid-2")
+        assert item.name == "Item 2"
+        assert await test_repo.get_by_uuid_async(async_session, "missing") is None
+
+        items = await test_repo.get_all_async(async_session)
+        assert [i.name for i in items] == ["Item 1", "Item 2", "Item 3"]
+        items = await test_repo.get_all_async(
+            async_session, filters={"is_active": True}
+        )
+        assert len(items) == 2
+        items = await test_repo.get_all_async(async_session, skip=1, limit=1)
+        assert [i.name for i in items] == ["Item 2"]
+
+        assert await test_repo.count_async(async_session) == 3
+        assert (
+            await test_repo.count_async(async_session, filters={"is_active": True}) == 2
+        )
+
+    async def test_update(self, async_session, test_repo, async_sample_data):
+        """Test updating records by instance, by ID and in a batch."""
+        first, second, third = async_sample_data
+
+        updated = await test_repo.update_async(
+            async_session, first, name="Updated Name", nonexistent_field="value"
+        )
+        assert updated.name == "Updated Name"
+        assert updated.value == 10
+        assert not hasattr(updated, "nonexistent_field")
+
+        updated = await test_repo.update_by_id_async(
+            async_session, second.id, value=42, nonexistent_field="value"
+        )
+        assert updated.value == 42
+        assert updated.name == "Item 2"
+        assert await test_repo.update_by_id_async(async_session, 999, value=1) is None
+
+        await test_repo.update_many_async(
+            async_session,
+            [{"id": first.id, "value": 1}, {"id": third.id, "value": 3}],
+        )
+        assert [first.value, third.value] == [1, 3]
+
+    async def test_delete(self, async_session, test_repo, async_sample_data):
+        """Test deleting records by instance and by ID."""
+        first, second, third = async_sample_data
+
+        await test_repo.delete_async(async_session, first)
+        assert await test_repo.delete_by_id_async(async_session, second.id) is True
+        assert await test_repo.delete_by_id_async(async_session, 999) is False
+        assert (
+            await test_repo.delete_by_id_without_load_async(async_session, third.id)
+            is True
+        )
+        assert (
+            await test_repo.delete_by_id_without_load_async(async_session, third.id)
+            is False
+        )
+        await async_session.commit()
+
+        assert await test_repo.count_async(async_session) == 0
@@ -19,6 +19,8 @@ from morado.repositories.test_case import (
     TestCaseRepository,
     TestCaseScriptRepository,
 )
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @pytest.fixture
@@ -266,6 +268,65 @@ class TestTestCaseRepositoryBasic:
         # In a real PostgreSQL database, this would return 2 results
         assert isinstance(results, list)
 
+    def test_get_filtered_combines_filters(
+        self, session, test_case_repo, sample_test_cases
+    ):
+        """Test combining several filters in one query."""
+        results = test_case_repo.get_filtered(
+            session,
+            status=TestCaseStatus.ACTIVE,
+            priority=TestCasePriority.MEDIUM,
+            category="Authentication",
+        )
+
+        assert [tc.name for tc in results] == ["User Registration Test"]
+
+    def test_get_filtered_automated_only(
+        self, session, test_case_repo, sample_test_cases
+    ):
+        """Test that automated_only defaults to active test cases."""
+        results = test_case_repo.get_filtered(session, automated_only=True)
+
+        assert len(results) == 2
+        assert all(tc.is_automated for tc in results)
+        assert all(tc.status == TestCaseStatus.ACTIVE for tc in results)
+
+    def test_get_filtered_no_filters(self, session, test_case_repo, sample_test_cases):
+        """Test that no filters returns all test cases."""
+        assert len(test_case_repo.get_filtered(session)) == 3
+
+    def test_iter_filtered(self, session, test_case_repo, sample_test_cases):
+        """Test streaming test cases in chunks."""
+        results = test_case_repo.iter_filtered(
+            session, status=TestCaseStatus.ACTIVE, yield_per=1
+        )
+
+        assert not isinstance(results, list)
+        assert sorted(tc.uuid for tc in results) == ["tc-1", "tc-2"]
+
+    def test_update_status(self, session, test_case_repo, sample_test_cases):
+        """Test setting test case status with a single UPDATE."""
+        tc_id = sample_test_cases[2].id
+
+        assert test_case_repo.update_status(session, tc_id, TestCaseStatus.ACTIVE)
+        session.expire_all()
+
+        assert test_case_repo.get_by_id(session, tc_id).status == TestCaseStatus.ACTIVE
+
+    def test_update_status_syncs_loaded_instance(
+        self, session, test_case_repo, sample_test_cases
+    ):
+        """Test that a test case already in the session sees the new status."""
+        test_case = sample_test_cases[2]
+
+        test_case_repo.update_status(session, test_case.id, TestCaseStatus.ACTIVE)
+
+        assert test_case.status == TestCaseStatus.ACTIVE
+
+    def test_update_status_not_found(self, session, test_case_repo):
+        """Test setting status of a nonexistent test case."""
+        assert not test_case_repo.update_status(session, 999, TestCaseStatus.ACTIVE)
+
 
 class TestTestCaseRelationships:
     """Test test case relationships with scripts and components."""
@@ -299,6 +360,83 @@ class TestTestCaseRelationships:
         # This test case has no components
         assert len(test_case.test_case_components) == 0
 
+    def test_get_with_relations_joined(
+        self, session, test_case_repo, sample_test_cases
+    ):
+        """Test loading all relations with the joined strategy."""
+        tc_id = sample_test_cases[1].id
+        session.expire_all()
+        test_case = test_case_repo.get_with_relations(
+            session, tc_id, loader_strategy="joined"
+        )
+
+        assert len(test_case.test_case_scripts) == 0
+        assert len(test_case.test_case_components) == 1
+
+    def test_get_with_relations_raises_on_unloaded(
+        self, session, test_case_repo, sample_test_cases
+    ):
+        """Test that relations outside the loaded set raise instead of lazy loading."""
+        tc_id = sample_test_cases[0].id
+        session.expire_all()
+        test_case = test_case_repo.get_with_relations(session, tc_id)
+
+        with pytest.raises(InvalidRequestError):
+            _ = test_case.executions
+
+    def test_get_without_relations(self, session, test_case_repo, sample_test_cases):
+        """Test that no relation of a plainly loaded test case lazy loads."""
+        tc_id = sample_test_cases[0].id
+        session.expunge_all()
+        test_case = test_case_repo.get_without_relations(session, tc_id)
+
+        assert test_case.name == "User Login Test"
+        with pytest.raises(InvalidRequestError):
+            _ = test_case.test_case_scripts
+        with pytest.raises(InvalidRequestError):
+            _ = test_case.creator
+
+    def test_get_execution_settings(self, session, test_case_repo, sample_test_cases):
+        """Test getting execution settings as a plain dictionary."""
+        settings = test_case_repo.get_execution_settings(
+            session, sample_test_cases[0].id
+        )
+
+        assert settings["uuid"] == "tc-1"
+        assert settings["priority"] == TestCasePriority.HIGH
+        assert settings["timeout"] == 300
+        assert "tags" not in settings
+
+    def test_get_execution_settings_not_found(self, session, test_case_repo):
+        """Test getting execution settings of a nonexistent test case."""
+        assert test_case_repo.get_execution_settings(session, 999) is None
+
+    def test_get_execution_items(
+        self, session, test_case_repo, sample_test_cases, sample_components
+    ):
+        """Test getting scripts and components merged in execution order."""
+        tc_id = sample_test_cases[0].id
+        session.add(
+            TestCaseComponent(
+                test_case_id=tc_id,
+                component_id=sample_components[0].id,
+                execution_order=1,
+                component_parameters={"base_url": "http://test"},
+            )
+        )
+        session.commit()
+
+        items = test_case_repo.get_execution_items(session, tc_id)
+
+        assert [(item["type"], item["order"]) for item in items] == [
+            ("script", 1),
+            ("component", 1),
+            ("script", 2),
+        ]
+        assert items[0]["name"] == "Login Script"
+        assert items[1]["name"] == "Auth Component"
+        assert items[1]["parameters"] == {"base_url": "http://test"}
+
 
 class TestTestCaseScriptRepository:
     """Test TestCaseScriptRepository operations."""
@@ -355,6 +493,47 @@ class TestTestCaseScriptRepository:
         # Should only get enabled associations
         assert all(a.is_enabled for a in associations)
 
+    def test_disabled_associations_included(
+        self, session, test_case_script_repo, sample_test_cases, sample_scripts
+    ):
+        """Test that disabled associations are returned when requested."""
+        tc_id = sample_test_cases[0].id
+        test_case_script_repo.create(
+            session,
+            test_case_id=tc_id,
+            script_id=sample_scripts[1].id,
+            execution_order=3,
+            is_enabled=False,
+        )
+        session.commit()
+
+        associations = test_case_script_repo.get_by_test_case(
+            session, tc_id, enabled_only=False
+        )
+
+        assert [a.execution_order for a in associations] == [1, 2, 3]
+        assert associations[-1].is_enabled is False
+
+    def test_copy_to_test_case(
+        self, session, test_case_script_repo, sample_test_cases
+    ):
+        """Test copying script associations with INSERT ... SELECT."""
+        source_id = sample_test_cases[0].id
+        target_id = sample_test_cases[2].id
+        session.execute(
+            TestCaseScript.__table__.update()
+            .where(TestCaseScript.test_case_id == source_id)
+            .values(script_parameters={"username": "admin"})
+        )
+
+        copied = test_case_script_repo.copy_to_test_case(session, source_id, target_id)
+        session.commit()
+
+        associations = test_case_script_repo.get_by_test_case(session, target_id)
+        assert copied == 2
+        assert [a.execution_order for a in associations] == [1, 2]
+        assert associations[0].script_parameters == {"username": "admin"}
+
     def test_parameter_override_field_not_in_model(
         self, session, test_case_script_repo, sample_test_cases, sample_scripts
     ):
@@ -395,6 +574,22 @@ class TestTestCaseComponentRepository:
         assert len(associations) == 1
         assert associations[0].component.name == "Auth Component"
 
+    def test_copy_to_test_case(
+        self, session, test_case_component_repo, sample_test_cases
+    ):
+        """Test copying component associations with INSERT ... SELECT."""
+        source_id = sample_test_cases[1].id
+        target_id = sample_test_cases[2].id
+
+        copied = test_case_component_repo.copy_to_test_case(
+            session, source_id, target_id
+        )
+        session.commit()
+
+        associations = test_case_component_repo.get_by_test_case(session, target_id)
+        assert copied == 1
+        assert associations[0].component.name == "Auth Component"
+
     def test_get_by_component(
         self, session, test_case_component_repo, sample_test_cases, sample_components
     ):
@@ -488,3 +683,214 @@ class TestTestCaseTransactions:
 
         associations = test_case_script_repo.get_by_test_case(session, tc_id)
         assert len(associations) == 0
+
+
+@pytest.fixture
+async def async_sample_test_cases(async_session: AsyncSession):
+    """Create sample test cases with script and component associations (async)."""
+    header = Header(uuid="header-1", name="Test Header", headers={})
+    async_session.add(header)
+    await async_session.flush()
+    api_def = ApiDefinition(
+        uuid="api-1",
+        name="Test API",
+        method=HttpMethod.GET,
+        path="/test",
+        header_id=header.id,
+    )
+    async_session.add(api_def)
+    await async_session.flush()
+
+    script = TestScript(
+        uuid="script-1",
+        name="Login Script",
+        script_type=ScriptType.SETUP,
+        api_definition_id=api_def.id,
+    )
+    component = TestComponent(
+        uuid="comp-1", name="Auth Component", component_type=ComponentType.SIMPLE
+    )
+    test_cases = [
+        TestCase(
+            uuid="tc-1",
+            name="User Login Test",
+            status=TestCaseStatus.ACTIVE,
+            priority=TestCasePriority.HIGH,
+            category="Authentication",
+            is_automated=True,
+        ),
+        TestCase(
+            uuid="tc-2",
+            name="User Registration Test",
+            status=TestCaseStatus.ACTIVE,
+            priority=TestCasePriority.MEDIUM,
+            category="Authentication",
+            is_automated=True,
+        ),
+        TestCase(
+            uuid="tc-3",
+            name="Draft Test Case",
+            status=TestCaseStatus.DRAFT,
+            priority=TestCasePriority.LOW,
+            category="Other",
+            is_automated=False,
+        ),
+    ]
+    async_session.add_all([script, component, *test_cases])
+    await async_session.flush()
+
+    async_session.add_all(
+        [
+            TestCaseScript(
+                test_case_id=test_cases[0].id, script_id=script.id, execution_order=1
+            ),
+            TestCaseComponent(
+                test_case_id=test_cases[0].id,
+                component_id=component.id,
+                execution_order=2,
+            ),
+        ]
+    )
+    await async_session.commit()
+    return test_cases, script, component
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestTestCaseRepositoryAsync:
+    """Test the async counterparts of the test case queries."""
+
+    async def test_filters(
+        self, async_session, test_case_repo, async_sample_test_cases
+    ):
+        """Test filtering test cases by status, priority, name and automation."""
+        by_status = await test_case_repo.get_by_status_async(
+            async_session, TestCaseStatus.ACTIVE
+        )
+        by_priority = await test_case_repo.get_by_priority_async(
+            async_session, TestCasePriority.HIGH
+        )
+        by_name = await test_case_repo.search_by_name_async(async_session, "Draft")
+        automated = await test_case_repo.get_automated_cases_async(async_session)
+        filtered = await test_case_repo.get_filtered_async(
+            async_session, category="Authentication", priority=TestCasePriority.MEDIUM
+        )
+
+        assert sorted(tc.uuid for tc in by_status) == ["tc-1", "tc-2"]
+        assert [tc.uuid for tc in by_priority] == ["tc-1"]
+        assert [tc.uuid for tc in by_name] == ["tc-3"]
+        assert len(automated) == 2
+        assert [tc.uuid for tc in filtered] == ["tc-2"]
+
+    async def test_get_with_relations(
+        self, async_session, test_case_repo, async_sample_test_cases
+    ):
+        """Test eagerly loading scripts and components."""
+        tc_id = async_sample_test_cases[0][0].id
+        async_session.expunge_all()
+
+        with_scripts = await test_case_repo.get_with_scripts_async(async_session, tc_id)
+        assert with_scripts.test_case_scripts[0].script.name == "Login Script"
+        async_session.expunge_all()
+
+        with_components = await test_case_repo.get_with_components_async(
+            async_session, tc_id
+        )
+        component = with_components.test_case_components[0].component
+        assert component.name == "Auth Component"
+        async_session.expunge_all()
+
+        for strategy in ("selectin", "joined"):
+            test_case = await test_case_repo.get_with_relations_async(
+                async_session, tc_id, loader_strategy=strategy
+            )
+            assert len(test_case.test_case_scripts) == 1
+            assert len(test_case.test_case_components) == 1
+            async_session.expunge_all()
+
+    async def test_get_without_relations(
+        self, async_session, test_case_repo, async_sample_test_cases
+    ):
+        """Test that no relation of a plainly loaded test case lazy loads."""
+        tc_id = async_sample_test_cases[0][0].id
+        async_session.expunge_all()
+
+        test_case = await test_case_repo.get_without_relations_async(
+            async_session, tc_id
+        )
+
+        assert test_case.name == "User Login Test"
+        with pytest.raises(InvalidRequestError):
+            _ = test_case.test_case_scripts
+
+    async def test_execution_settings_and_items(
+        self, async_session, test_case_repo, async_sample_test_cases
+    ):
+        """Test reading execution settings and items as dictionaries."""
+        tc_id = async_sample_test_cases[0][0].id
+
+        settings = await test_case_repo.get_execution_settings_async(
+            async_session, tc_id
+        )
+        items = await test_case_repo.get_execution_items_async(async_session, tc_id)
+
+        assert settings["name"] == "User Login Test"
+        assert (
+            await test_case_repo.get_execution_settings_async(async_session, 999)
+            is None
+        )
+        assert [item["name"] for item in items] == ["Login Script", "Auth Component"]
+
+    async def test_update_status(
+        self, async_session, test_case_repo, async_sample_test_cases
+    ):
+        """Test setting test case status with a single UPDATE."""
+        test_case = async_sample_test_cases[0][2]
+
+        assert await test_case_repo.update_status_async(
+            async_session, test_case.id, TestCaseStatus.ACTIVE
+        )
+        assert test_case.status == TestCaseStatus.ACTIVE
+        assert not await test_case_repo.update_status_async(
+            async_session, 999, TestCaseStatus.ACTIVE
+        )
+
+    async def test_associations(
+        self,
+        async_session,
+        test_case_script_repo,
+        test_case_component_repo,
+        async_sample_test_cases,
+    ):
+        """Test looking up and copying script and component associations."""
+        (source, _, target), script, component = async_sample_test_cases
+
+        by_test_case = await test_case_script_repo.get_by_test_case_async(
+            async_session, source.id
+        )
+        by_script = await test_case_script_repo.get_by_script_async(
+            async_session, script.id
+        )
+        by_component = await test_case_component_repo.get_by_component_async(
+            async_session, component.id
+        )
+
+        assert [tcs.script.name for tcs in by_test_case] == ["Login Script"]
+        assert [tcs.test_case_id for tcs in by_script] == [source.id]
+        assert [tcc.test_case_id for tcc in by_component] == [source.id]
+
+        assert (
+            await test_case_script_repo.copy_to_test_case_async(
+                async_session, source.id, target.id
+            )
+            == 1
+        )
+        assert (
+            await test_case_component_repo.copy_to_test_case_async(
+                async_session, source.id, target.id
+            )
+            == 1
+        )
+        copied = await test_case_component_repo.get_by_test_case_async(
+            async_session, target.id
+        )
+        assert [tcc.component_id for tcc in copied] == [component.id]
@@ -4,11 +4,16 @@ Tests business logic for TestCase management including script and component refe
 """
 
 import pytest
+from morado.models.api_component import ApiDefinition, HttpMethod
+from morado.models.component import ComponentType, TestComponent
+from morado.models.script import ScriptType, TestScript
 from morado.models.test_case import TestCasePriority, TestCaseStatus
 from morado.services.api_component import ApiDefinitionService
 from morado.services.component import TestComponentService
 from morado.services.script import TestScriptService
-from morado.services.test_case import TestCaseService
+from morado.services.test_case import AsyncTestCaseService, TestCaseService
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 
@@ -274,20 +279,141 @@ class TestTestCaseService:
         assert updated.name == "Updated Name"
         assert updated.priority == TestCasePriority.HIGH
 
-    def test_delete_test_case(
+    def test_update_test_case_ignores_non_updatable_fields(
         self, service: TestCaseService, db_session: Session
     ):
-        """Test deleting test case."""
+        """Test that identity fields cannot be changed through update."""
+        test_case = service.create_test_case(
+            db_session,
+            uuid="tc-fixed",
+            name="Original Name"
+        )
+
+        updated = service.update_test_case(
+            db_session,
+            test_case.id,
+            uuid="tc-changed",
+            name="Updated Name"
+        )
+
+        assert updated is not None
+        assert updated.uuid == "tc-fixed"
+        assert updated.name == "Updated Name"
+
+    def test_delete_test_case(
+        self,
+        service: TestCaseService,
+        sample_script,
+        sample_component,
+        db_session: Session
+    ):
+        """Test deleting test case together with its associations."""
         test_case = service.create_test_case(
             db_session,
             name="To Delete"
         )
+        service.add_script_to_test_case(
+            db_session, test_case_id=test_case.id, script_id=sample_script.id
+        )
+        service.add_component_to_test_case(
+            db_session, test_case_id=test_case.id, component_id=sample_component.id
+        )
 
         result = service.delete_test_case(db_session, test_case.id)
         assert result is True
 
         retrieved = service.get_test_case(db_session, test_case.id)
         assert retrieved is None
+        assert service.script_repository.get_by_test_case(
+            db_session, test_case.id, enabled_only=False
+        ) == []
+        assert service.component_repository.get_by_test_case(
+            db_session, test_case.id, enabled_only=False
+        ) == []
+
+    def test_get_test_case_by_uuid_is_cached(
+        self, service: TestCaseService, db_session: Session
+    ):
+        """Test that repeated lookups in a session are served from the cache."""
+        test_case = service.create_test_case(
+            db_session,
+            uuid="tc-cached",
+            name="Cached"
+        )
+
+        first = service.get_test_case_by_uuid(db_session, "tc-cached")
+        assert first is test_case
+        assert db_session.info["test_case_cache"][("uuid", "tc-cached")] is first
+
+        service.update_test_case(db_session, test_case.id, name="Renamed")
+        assert "test_case_cache" not in db_session.info
+
+        second = service.get_test_case_by_uuid(db_session, "tc-cached")
+        assert second.name == "Renamed"
+
+    def test_transaction_commits_once(
+        self, service: TestCaseService, db_session: Session
+    ):
+        """Test that service calls inside a transaction share one commit."""
+        commits = []
+        event.listen(db_session, "after_commit", commits.append)
+
+        with service.transaction(db_session):
+            test_case = service.create_test_case(
+                db_session,
+                uuid="tc-tx",
+                name="In Transaction"
+            )
+            service.update_test_case(db_session, test_case.id, name="Renamed")
+            assert commits == []
+
+        assert len(commits) == 1
+        assert service.get_test_case_by_uuid(db_session, "tc-tx").name == "Renamed"
+
+    def test_transaction_rolls_back_on_error(
+        self, service: TestCaseService, db_session: Session
+    ):
+        """Test that a failing transaction discards all of its changes."""
+
+        def create_and_fail():
+            with service.transaction(db_session):
+                service.create_test_case(
+                    db_session,
+                    uuid="tc-tx-fail",
+                    name="Rolled Back"
+                )
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            create_and_fail()
+
+        assert service.get_test_case_by_uuid(db_session, "tc-tx-fail") is None
+
+    def test_nested_transaction_rolls_back_inner_block(
+        self, service: TestCaseService, db_session: Session
+    ):
+        """Test that a failing inner block only discards its own changes."""
+
+        def create_and_fail():
+            with service.transaction(db_session):
+                service.create_test_case(
+                    db_session,
+                    uuid="tc-tx-inner",
+                    name="Rolled Back"
+                )
+                raise RuntimeError
+
+        with service.transaction(db_session):
+            service.create_test_case(
+                db_session,
+                uuid="tc-tx-outer",
+                name="Committed"
+            )
+            with pytest.raises(RuntimeError):
+                create_and_fail()
+
+        assert service.get_test_case_by_uuid(db_session, "tc-tx-outer") is not None
+        assert service.get_test_case_by_uuid(db_session, "tc-tx-inner") is None
 
     def test_add_script_to_test_case(
         self,
@@ -615,6 +741,22 @@ class TestTestCaseService:
         assert len(cloned.test_case_scripts) == 1
         assert len(cloned.test_case_components) == 1
 
+    def test_clone_test_case_gets_new_uuid(
+        self, service: TestCaseService, db_session: Session
+    ):
+        """Test that a clone gets its own UUID."""
+        original = service.create_test_case(
+            db_session,
+            uuid="tc-original",
+            name="Original Test Case"
+        )
+
+        cloned = service.clone_test_case(db_session, original.id, "Cloned")
+
+        assert cloned is not None
+        assert cloned.uuid
+        assert cloned.uuid != original.uuid
+
     def test_test_case_with_mixed_scripts_and_components(
         self,
         service: TestCaseService,
@@ -680,3 +822,429 @@ class TestTestCaseService:
         assert plan['execution_items'][1]['name'] == "Main Component"
         assert plan['execution_items'][2]['type'] == 'script'
         assert plan['execution_items'][2]['name'] == "Teardown Script"
+
+
+@pytest.mark.asyncio(loop_scope="session")
+class TestAsyncTestCaseService:
+    """Test AsyncTestCaseService business logic.
+
+    Mirrors TestTestCaseService so the sync and async services stay in step.
+    """
+
+    @pytest.fixture
+    def service(self):
+        """Create AsyncTestCaseService instance."""
+        return AsyncTestCaseService()
+
+    @pytest.fixture
+    async def sample_script(self, async_session: AsyncSession):
+        """Create a sample script for testing."""
+        api_def = ApiDefinition(
+            uuid="api-async",
+            name="Test API",
+            method=HttpMethod.GET,
+            path="/api/test"
+        )
+        async_session.add(api_def)
+        await async_session.flush()
+
+        script = TestScript(
+            uuid="script-async",
+            name="Test Script",
+            script_type=ScriptType.MAIN,
+            api_definition_id=api_def.id
+        )
+        async_session.add(script)
+        await async_session.commit()
+        return script
+
+    @pytest.fixture
+    async def sample_component(self, async_session: AsyncSession):
+        """Create a sample component for testing."""
+        component = TestComponent(
+            uuid="comp-async",
+            name="Test Component",
+            component_type=ComponentType.SIMPLE
+        )
+        async_session.add(component)
+        await async_session.commit()
+        return component
+
+    @pytest.fixture
+    async def sample_test_case(
+        self,
+        service: AsyncTestCaseService,
+        sample_script,
+        sample_component,
+        async_session: AsyncSession
+    ):
+        """Create a test case running the sample script, then the component."""
+        test_case = await service.create_test_case(
+            async_session,
+            uuid="tc-async",
+            name="Async Test Case",
+            priority=TestCasePriority.HIGH,
+            test_data={"env": "test"}
+        )
+        await service.add_script_to_test_case(
+            async_session,
+            test_case_id=test_case.id,
+            script_id=sample_script.id,
+            execution_order=1
+        )
+        await service.add_component_to_test_case(
+            async_session,
+            test_case_id=test_case.id,
+            component_id=sample_component.id,
+            execution_order=2
+        )
+        return test_case
+
+    async def test_create_test_case(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test successful test case creation."""
+        test_case = await service.create_test_case(
+            async_session,
+            uuid="tc-async-create",
+            name="User Registration Flow",
+            priority=TestCasePriority.HIGH
+        )
+
+        assert test_case.id is not None
+        assert test_case.priority == TestCasePriority.HIGH
+        assert test_case.status == TestCaseStatus.DRAFT
+        assert test_case.is_automated is True
+
+    @pytest.mark.parametrize("loader_strategy", ["selectin", "joined"])
+    async def test_get_test_case_load_all(
+        self,
+        service: AsyncTestCaseService,
+        sample_test_case,
+        async_session: AsyncSession,
+        loader_strategy
+    ):
+        """Test retrieving a test case with its scripts and components."""
+        test_case_id = sample_test_case.id
+        async_session.expunge_all()
+
+        retrieved = await service.get_test_case(
+            async_session,
+            test_case_id,
+            load_all=True,
+            loader_strategy=loader_strategy
+        )
+
+        assert len(retrieved.test_case_scripts) == 1
+        assert retrieved.test_case_scripts[0].script.name == "Test Script"
+        assert len(retrieved.test_case_components) == 1
+        assert retrieved.test_case_components[0].component.name == "Test Component"
+
+    async def test_get_test_case_scripts_and_components(
+        self,
+        service: AsyncTestCaseService,
+        sample_test_case,
+        async_session: AsyncSession
+    ):
+        """Test retrieving the scripts and components of a test case."""
+        with_scripts = await service.get_test_case(
+            async_session, sample_test_case.id, load_scripts=True
+        )
+        with_components = await service.get_test_case(
+            async_session, sample_test_case.id, load_components=True
+        )
+        scripts = await service.get_test_case_scripts(
+            async_session, sample_test_case.id
+        )
+        components = await service.get_test_case_components(
+            async_session, sample_test_case.id
+        )
+
+        assert len(with_scripts.test_case_scripts) == 1
+        assert len(with_components.test_case_components) == 1
+        assert [tcs.execution_order for tcs in scripts] == [1]
+        assert [tcc.execution_order for tcc in components] == [2]
+
+    async def test_list_and_search_test_cases(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test listing and searching test cases."""
+        await service.create_test_case(
+            async_session,
+            uuid="tc-async-login",
+            name="Login Test",
+            status=TestCaseStatus.ACTIVE
+        )
+        await service.create_test_case(
+            async_session,
+            uuid="tc-async-logout",
+            name="Logout Test",
+            is_automated=False
+        )
+
+        active = await service.list_test_cases(
+            async_session, status=TestCaseStatus.ACTIVE
+        )
+        automated = await service.list_test_cases(async_session, automated_only=True)
+        found = await service.search_test_cases(async_session, "Login")
+
+        assert [tc.name for tc in active] == ["Login Test"]
+        assert [tc.name for tc in automated] == ["Login Test"]
+        assert [tc.name for tc in found] == ["Login Test"]
+
+    async def test_update_test_case(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test updating a test case ignores non-updatable fields."""
+        test_case = await service.create_test_case(
+            async_session,
+            uuid="tc-async-fixed",
+            name="Original Name",
+            priority=TestCasePriority.LOW
+        )
+
+        updated = await service.update_test_case(
+            async_session,
+            test_case.id,
+            uuid="tc-async-changed",
+            name="Updated Name",
+            priority=TestCasePriority.HIGH
+        )
+
+        assert updated.uuid == "tc-async-fixed"
+        assert updated.name == "Updated Name"
+        assert updated.priority == TestCasePriority.HIGH
+        assert await service.update_test_case(async_session, 999, name="x") is None
+
+    async def test_status_transitions(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test activating, deprecating and archiving a test case."""
+        test_case = await service.create_test_case(
+            async_session,
+            uuid="tc-async-status",
+            name="Test Case"
+        )
+
+        activated = await service.activate_test_case(async_session, test_case.id)
+        assert activated.status == TestCaseStatus.ACTIVE
+
+        deprecated = await service.deprecate_test_case(async_session, test_case.id)
+        assert deprecated.status == TestCaseStatus.DEPRECATED
+
+        archived = await service.archive_test_case(async_session, test_case.id)
+        assert archived is test_case
+        assert archived.status == TestCaseStatus.ARCHIVED
+
+        assert await service.activate_test_case(async_session, 999) is None
+
+    async def test_delete_test_case(
+        self,
+        service: AsyncTestCaseService,
+        sample_test_case,
+        async_session: AsyncSession
+    ):
+        """Test deleting a test case together with its associations."""
+        test_case_id = sample_test_case.id
+
+        assert await service.delete_test_case(async_session, test_case_id) is True
+        assert await service.get_test_case(async_session, test_case_id) is None
+        assert await service.script_repository.get_by_test_case_async(
+            async_session, test_case_id, enabled_only=False
+        ) == []
+        assert await service.component_repository.get_by_test_case_async(
+            async_session, test_case_id, enabled_only=False
+        ) == []
+        assert await service.delete_test_case(async_session, test_case_id) is False
+
+    async def test_get_test_case_by_uuid_is_cached(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test that repeated lookups in a session are served from the cache."""
+        test_case = await service.create_test_case(
+            async_session,
+            uuid="tc-async-cached",
+            name="Cached"
+        )
+
+        first = await service.get_test_case_by_uuid(async_session, "tc-async-cached")
+        assert first is test_case
+        cache = async_session.info["test_case_cache"]
+        assert cache[("uuid", "tc-async-cached")] is first
+
+        await service.update_test_case(async_session, test_case.id, name="Renamed")
+        assert "test_case_cache" not in async_session.info
+
+    async def test_update_and_remove_associations(
+        self,
+        service: AsyncTestCaseService,
+        sample_test_case,
+        async_session: AsyncSession
+    ):
+        """Test updating and removing script and component associations."""
+        script = (
+            await service.get_test_case_scripts(async_session, sample_test_case.id)
+        )[0]
+        component = (
+            await service.get_test_case_components(async_session, sample_test_case.id)
+        )[0]
+
+        updated_script = await service.update_test_case_script(
+            async_session, script.id, execution_order=5, is_enabled=False
+        )
+        updated_component = await service.update_test_case_component(
+            async_session, component.id, execution_order=3
+        )
+        assert (updated_script.execution_order, updated_script.is_enabled) == (5, False)
+        assert updated_component.execution_order == 3
+
+        assert await service.remove_script_from_test_case(async_session, script.id)
+        assert await service.remove_component_from_test_case(
+            async_session, component.id
+        )
+        assert not await service.remove_script_from_test_case(async_session, script.id)
+
+    async def test_add_scripts_and_components_to_test_case(
+        self,
+        service: AsyncTestCaseService,
+        sample_script,
+        sample_component,
+        async_session: AsyncSession
+    ):
+        """Test adding several scripts and components in one batch."""
+        test_case = await service.create_test_case(
+            async_session,
+            uuid="tc-async-batch",
+            name="Batch"
+        )
+
+        scripts = await service.add_scripts_to_test_case(
+            async_session,
+            test_case.id,
+            [{"script_id": sample_script.id, "execution_order": 2}]
+        )
+        components = await service.add_components_to_test_case(
+            async_session,
+            test_case.id,
+            [{"component_id": sample_component.id, "is_enabled": False}]
+        )
+
+        assert [tcs.execution_order for tcs in scripts] == [2]
+        assert [tcc.is_enabled for tcc in components] == [False]
+        assert await service.get_test_case_components(async_session, test_case.id) == []
+
+    async def test_get_test_case_execution_plan(
+        self,
+        service: AsyncTestCaseService,
+        sample_test_case,
+        async_session: AsyncSession
+    ):
+        """Test getting complete test case execution plan."""
+        plan = await service.get_test_case_execution_plan(
+            async_session, sample_test_case.id
+        )
+
+        assert plan["test_case"]["name"] == "Async Test Case"
+        assert plan["test_case"]["test_data"] == {"env": "test"}
+        assert [item["type"] for item in plan["execution_items"]] == [
+            "script",
+            "component",
+        ]
+        assert [item["name"] for item in plan["execution_items"]] == [
+            "Test Script",
+            "Test Component",
+        ]
+        assert await service.get_test_case_execution_plan(async_session, 999) is None
+
+    async def test_clone_test_case(
+        self,
+        service: AsyncTestCaseService,
+        sample_test_case,
+        async_session: AsyncSession
+    ):
+        """Test cloning a test case with its scripts and components."""
+        cloned = await service.clone_test_case(
+            async_session, sample_test_case.id, "Cloned Test Case"
+        )
+
+        assert cloned.name == "Cloned Test Case"
+        assert cloned.uuid != sample_test_case.uuid
+        assert cloned.priority == TestCasePriority.HIGH
+        assert cloned.status == TestCaseStatus.DRAFT
+        plan = await service.get_test_case_execution_plan(async_session, cloned.id)
+        assert [item["name"] for item in plan["execution_items"]] == [
+            "Test Script",
+            "Test Component",
+        ]
+        assert await service.clone_test_case(async_session, 999, "Copy") is None
+
+    async def test_transaction_commits_once(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test that service calls inside a transaction share one commit."""
+        commits = []
+        event.listen(async_session.sync_session, "after_commit", commits.append)
+
+        async with service.transaction(async_session):
+            test_case = await service.create_test_case(
+                async_session,
+                uuid="tc-async-tx",
+                name="In Transaction"
+            )
+            await service.activate_test_case(async_session, test_case.id)
+            assert commits == []
+
+        assert len(commits) == 1
+        retrieved = await service.get_test_case_by_uuid(async_session, "tc-async-tx")
+        assert retrieved.status == TestCaseStatus.ACTIVE
+
+    async def test_transaction_rolls_back_on_error(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test that a failing transaction discards all of its changes."""
+
+        async def create_and_fail():
+            async with service.transaction(async_session):
+                await service.create_test_case(
+                    async_session,
+                    uuid="tc-async-tx-fail",
+                    name="Rolled Back"
+                )
+                raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            await create_and_fail()
+
+        assert (
+            await service.get_test_case_by_uuid(async_session, "tc-async-tx-fail")
+            is None
+        )
+
+    async def test_nested_transaction_rolls_back_inner_block(
+        self, service: AsyncTestCaseService, async_session: AsyncSession
+    ):
+        """Test that a failing inner block only discards its own changes."""
+
+        async def create_and_fail():
+            async with service.transaction(async_session):
+                await service.create_test_case(
+                    async_session,
+                    uuid="tc-async-tx-inner",
+                    name="Rolled Back"
+                )
+                raise RuntimeError
+
+        async with service.transaction(async_session):
+            await service.create_test_case(
+                async_session,
+                uuid="tc-async-tx-outer",
+                name="Committed"
+            )
+            with pytest.raises(RuntimeError):
+                await create_and_fail()
+
+        assert await service.get_test_case_by_uuid(async_session, "tc-async-tx-outer")
+        assert (
+            await service.get_test_case_by_uuid(async_session, "tc-async-tx-inner")
+            is None
+        )
@@ -0,0 +1,289 @@
+"""Unit tests for Test Execution Service layer.
+
+Tests business logic for TestExecution and ExecutionResult management.
+"""
+
+import pytest
+from morado.models.test_execution import ExecutionStatus, TestExecution
+from morado.repositories.test_execution import _SecondsSince, _StatementTime
+from morado.services.test_case import TestCaseService
+from morado.services.test_execution import TestExecutionService
+from sqlalchemy import event, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+
+class TestTestExecutionService:
+    """Test TestExecutionService business logic."""
+
+    @pytest.fixture
+    def service(self):
+        """Create TestExecutionService instance."""
+        return TestExecutionService()
+
+    @pytest.fixture
+    def sample_execution(self, service: TestExecutionService, db_session: Session):
+        """Create a sample execution of a test case for testing."""
+        test_case = TestCaseService().create_test_case(
+            db_session,
+            uuid="tc-exec",
+            name="Executed Test Case"
+        )
+        return service.create_execution(
+            db_session,
+            uuid="exec-1",
+            test_case_id=test_case.id
+        )
+
+    def test_add_execution_result(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test adding a single execution result."""
+        result = service.add_execution_result(
+            db_session,
+            sample_execution.id,
+            status=ExecutionStatus.PASSED,
+            response_data={"status_code": 200}
+        )
+
+        assert result.id is not None
+        assert result.execution_id == sample_execution.id
+        assert result.status == ExecutionStatus.PASSED
+        assert result.response_data == {"status_code": 200}
+
+    def test_add_execution_results(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test adding several execution results in one batch."""
+        results = service.add_execution_results(
+            db_session,
+            sample_execution.id,
+            [
+                {"status": ExecutionStatus.PASSED},
+                {"status": ExecutionStatus.FAILED, "error_message": "boom"},
+                {},
+            ]
+        )
+
+        assert [r.status for r in results] == [
+            ExecutionStatus.PASSED,
+            ExecutionStatus.FAILED,
+            ExecutionStatus.PENDING,
+        ]
+        assert results[1].error_message == "boom"
+        assert len(service.get_execution_results(db_session, sample_execution.id)) == 3
+
+    def test_add_execution_results_empty(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test adding an empty batch of execution results."""
+        assert service.add_execution_results(db_session, sample_execution.id, []) == []
+
+    def test_update_execution_result(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test updating a single execution result ignores unknown fields."""
+        result = service.add_execution_result(db_session, sample_execution.id)
+
+        updated = service.update_execution_result(
+            db_session,
+            result.id,
+            status=ExecutionStatus.FAILED,
+            error_message="boom",
+            not_a_column="ignored"
+        )
+
+        assert updated is result
+        assert updated.status == ExecutionStatus.FAILED
+        assert updated.error_message == "boom"
+        assert service.update_execution_result(db_session, 999, status=None) is None
+
+    def test_bulk_update_execution_results(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test updating several execution results in one batch."""
+        results = service.add_execution_results(
+            db_session, sample_execution.id, [{}, {}]
+        )
+
+        service.bulk_update_execution_results(
+            db_session,
+            [
+                {"id": results[0].id, "status": ExecutionStatus.PASSED},
+                {
+                    "id": results[1].id,
+                    "status": ExecutionStatus.FAILED,
+                    "error_message": "boom",
+                },
+            ]
+        )
+
+        assert [r.status for r in results] == [
+            ExecutionStatus.PASSED,
+            ExecutionStatus.FAILED,
+        ]
+        assert results[1].error_message == "boom"
+
+    def test_start_and_complete_execution(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test that start and end times come from the database clock."""
+        started = service.start_execution(db_session, sample_execution.id)
+        assert started is sample_execution
+        assert started.status == ExecutionStatus.RUNNING
+        assert started.start_time is not None
+
+        completed = service.complete_execution(
+            db_session,
+            sample_execution.id,
+            ExecutionStatus.FAILED,
+            error_message="boom"
+        )
+        assert completed.status == ExecutionStatus.FAILED
+        assert completed.error_message == "boom"
+        assert completed.end_time >= completed.start_time
+        assert completed.duration >= 0
+
+        assert service.start_execution(db_session, 999) is None
+        assert service.complete_execution(
+            db_session, 999, ExecutionStatus.PASSED
+        ) is None
+
+    def test_clock_advances_within_transaction_on_postgresql(self):
+        """Test that PostgreSQL stamps use the statement, not transaction, time."""
+        statement = update(TestExecution).values(
+            end_time=_StatementTime(),
+            duration=_SecondsSince(TestExecution.start_time),
+        )
+
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+
+        assert "end_time=statement_timestamp()" in sql
+        assert "EXTRACT(EPOCH FROM (statement_timestamp() - " in sql
+        assert "CURRENT_TIMESTAMP" not in sql
+
+    def test_complete_execution_never_started(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test completing an execution that was never started."""
+        cancelled = service.cancel_execution(db_session, sample_execution.id)
+
+        assert cancelled.status == ExecutionStatus.CANCELLED
+        assert cancelled.end_time is not None
+        assert cancelled.duration is None
+
+    def test_transaction_commits_once(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test that state transitions inside a transaction share one commit."""
+        commits = []
+        event.listen(db_session, "after_commit", commits.append)
+
+        with service.transaction(db_session):
+            service.start_execution(db_session, sample_execution.id)
+            service.complete_execution(
+                db_session, sample_execution.id, ExecutionStatus.PASSED
+            )
+            service.update_execution_stats(
+                db_session, sample_execution.id, total_count=1, passed_count=1
+            )
+            assert commits == []
+
+        assert len(commits) == 1
+        execution = service.get_execution(db_session, sample_execution.id)
+        assert execution.status == ExecutionStatus.PASSED
+        assert execution.passed_count == 1
+
+    def test_get_execution_status_by_uuid(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test getting only the status columns of an execution."""
+        service.start_execution(db_session, sample_execution.id)
+
+        status = service.get_execution_status_by_uuid(db_session, "exec-1")
+
+        assert status["id"] == sample_execution.id
+        assert status["status"] == ExecutionStatus.RUNNING
+        assert status["start_time"] is not None
+        assert status["end_time"] is None
+        assert set(status) == {
+            "id",
+            "uuid",
+            "status",
+            "start_time",
+            "end_time",
+            "duration",
+        }
+        assert service.get_execution_status_by_uuid(db_session, "missing") is None
+
+    def test_list_executions_combines_filters(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test that all given filters apply to the same query."""
+        staging = service.create_execution(
+            db_session,
+            uuid="exec-2",
+            test_case_id=sample_execution.test_case_id,
+            environment="staging"
+        )
+
+        executions = service.list_executions(
+            db_session,
+            test_case_id=sample_execution.test_case_id,
+            environment="staging"
+        )
+        assert executions == [staging]
+
+        executions = service.list_executions(
+            db_session,
+            test_case_id=sample_execution.test_case_id,
+            status=ExecutionStatus.PASSED
+        )
+        assert executions == []
+
+        recent = service.get_recent_executions(
+            db_session, test_case_id=sample_execution.test_case_id
+        )
+        assert {e.uuid for e in recent} == {"exec-1", "exec-2"}
+
+    def test_get_execution_summary(
+        self, service: TestExecutionService, sample_execution, db_session: Session
+    ):
+        """Test that the summary loads only the result columns it reports."""
+        service.add_execution_results(
+            db_session,
+            sample_execution.id,
+            [
+                {"status": ExecutionStatus.PASSED, "response_data": {"big": "x"}},
+                {"status": ExecutionStatus.FAILED, "error_message": "boom"},
+            ]
+        )
+        execution_id = sample_execution.id
+        db_session.expunge_all()
+
+        summary = service.get_execution_summary(db_session, execution_id)
+
+        assert summary["execution"]["uuid"] == "exec-1"
+        assert summary["statistics"] == {
+            "total": 0,
+            "passed": 0,
+            "failed": 0,
+            "error": 0,
+            "skipped": 0,
+        }
+        assert [r["status"] for r in summary["results"]] == [
+            ExecutionStatus.PASSED,
+            ExecutionStatus.FAILED,
+        ]
+        assert summary["results"][1]["error_message"] == "boom"
+
+        results = service.result_repository.get_summaries_by_execution(
+            db_session, execution_id
+        )
+        assert "response_data" not in results[0].__dict__
+
+    def test_get_execution_summary_not_found(
+        self, service: TestExecutionService, db_session: Session
+    ):
+        """Test getting the summary of a nonexistent execution."""
+        assert service.get_execution_summary(db_session, 999) is None
@@ -0,0 +1,180 @@
+"""Unit tests for Test Suite Service layer.
+
+Tests business logic for TestSuite management including test case membership.
+"""
+
+import pytest
+from morado.services.test_case import TestCaseService
+from morado.services.test_suite import TestSuiteService
+from sqlalchemy.orm import Session
+
+
+class TestTestSuiteService:
+    """Test TestSuiteService business logic."""
+
+    @pytest.fixture
+    def service(self):
+        """Create TestSuiteService instance."""
+        return TestSuiteService()
+
+    @pytest.fixture
+    def sample_test_cases(self, db_session: Session):
+        """Create sample test cases for testing."""
+        test_case_service = TestCaseService()
+        return [
+            test_case_service.create_test_case(
+                db_session,
+                uuid=f"tc-suite-{i}",
+                name=f"Suite Case {i}"
+            )
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def sample_suite(
+        self, service: TestSuiteService, sample_test_cases, db_session: Session
+    ):
+        """Create a sample suite with three test cases in reverse order."""
+        suite = service.create_test_suite(
+            db_session,
+            uuid="suite-1",
+            name="Regression Suite"
+        )
+        for order, test_case in zip((3, 2, 1), sample_test_cases, strict=True):
+            service.add_test_case_to_suite(
+                db_session,
+                suite.id,
+                test_case.id,
+                execution_order=order,
+                case_parameters={"order": order}
+            )
+        return suite
+
+    def test_add_test_case_to_suite(
+        self, service: TestSuiteService, sample_test_cases, db_session: Session
+    ):
+        """Test that server defaults are available without a refresh."""
+        suite = service.create_test_suite(db_session, uuid="suite-add", name="Suite")
+
+        suite_case = service.add_test_case_to_suite(
+            db_session, suite.id, sample_test_cases[0].id
+        )
+
+        assert suite_case.id is not None
+        assert suite_case.__dict__["created_at"] is not None
+
+    def test_add_test_cases_to_suite(
+        self, service: TestSuiteService, sample_test_cases, db_session: Session
+    ):
+        """Test adding several test cases to a suite in one batch."""
+        suite = service.create_test_suite(db_session, uuid="suite-bulk", name="Suite")
+
+        suite_cases = service.add_test_cases_to_suite(
+            db_session,
+            suite.id,
+            [
+                {"test_case_id": sample_test_cases[0].id, "execution_order": 2},
+                {
+                    "test_case_id": sample_test_cases[1].id,
+                    "execution_order": 1,
+                    "is_enabled": False,
+                },
+            ]
+        )
+
+        assert [tsc.test_suite_id for tsc in suite_cases] == [suite.id, suite.id]
+        assert [tsc.execution_order for tsc in suite_cases] == [2, 1]
+        assert [tsc.is_enabled for tsc in suite_cases] == [True, False]
+        assert [
+            tsc.test_case_id
+            for tsc in service.get_suite_test_cases(db_session, suite.id)
+        ] == [sample_test_cases[1].id, sample_test_cases[0].id]
+
+    def test_copy_suite_cases(
+        self, service: TestSuiteService, sample_suite, db_session: Session
+    ):
+        """Test copying test case associations to another suite in the database."""
+        target = service.create_test_suite(
+            db_session,
+            uuid="suite-2",
+            name="Regression Suite Copy"
+        )
+
+        copied = service.case_repository.copy_to_test_suite(
+            db_session, sample_suite.id, target.id
+        )
+
+        assert copied == 3
+        target_cases = service.get_suite_test_cases(db_session, target.id)
+        assert [tsc.execution_order for tsc in target_cases] == [1, 2, 3]
+        assert [tsc.case_parameters for tsc in target_cases] == [
+            {"order": 1},
+            {"order": 2},
+            {"order": 3},
+        ]
+
+    def test_clone_test_suite_not_found(
+        self, service: TestSuiteService, db_session: Session
+    ):
+        """Test cloning a nonexistent suite."""
+        assert service.clone_test_suite(db_session, 999, "Copy") is None
+
+    def test_get_suite_test_cases(
+        self, service: TestSuiteService, sample_suite, db_session: Session
+    ):
+        """Test that suite test cases come back in execution order."""
+        suite_id = sample_suite.id
+        db_session.expunge_all()
+
+        suite_cases = service.get_suite_test_cases(db_session, suite_id)
+
+        assert [tsc.execution_order for tsc in suite_cases] == [1, 2, 3]
+        assert suite_cases[0].test_case.__dict__["name"] == "Suite Case 2"
+        assert "test_data" not in suite_cases[0].test_case.__dict__
+
+    def test_update_suite_test_case(
+        self, service: TestSuiteService, sample_suite, db_session: Session
+    ):
+        """Test updating a suite test case ignores unknown fields."""
+        suite_case = service.get_suite_test_cases(db_session, sample_suite.id)[0]
+
+        updated = service.update_suite_test_case(
+            db_session,
+            suite_case.id,
+            execution_order=10,
+            not_a_column="ignored"
+        )
+
+        assert updated is suite_case
+        assert updated.execution_order == 10
+        assert service.update_suite_test_case(db_session, 999, is_enabled=False) is None
+
+    def test_get_suite_execution_plan(
+        self, service: TestSuiteService, sample_suite, db_session: Session
+    ):
+        """Test that the execution plan lists enabled test cases in order."""
+        first = service.get_suite_test_cases(db_session, sample_suite.id)[0]
+        service.update_suite_test_case(db_session, first.id, is_enabled=False)
+
+        plan = service.get_suite_execution_plan(db_session, sample_suite.id)
+
+        assert plan["suite"]["uuid"] == "suite-1"
+        assert [tc["order"] for tc in plan["test_cases"]] == [2, 3]
+        assert [tc["test_case_name"] for tc in plan["test_cases"]] == [
+            "Suite Case 1",
+            "Suite Case 0",
+        ]
+
+    def test_get_test_suite_by_uuid_is_cached(
+        self, service: TestSuiteService, sample_suite, db_session: Session
+    ):
+        """Test that repeated lookups in a session are served from the cache."""
+        first = service.get_test_suite_by_uuid(db_session, "suite-1")
+        assert first is sample_suite
+        assert db_session.info["test_suite_cache"][("uuid", "suite-1")] is first
+
+        service.update_test_suite(db_session, sample_suite.id, name="Renamed")
+        assert "test_suite_cache" not in db_session.info
+
+        second = service.get_test_suite_by_uuid(db_session, "suite-1")
+        assert second.name == "Renamed"
@@ -249,3 +249,32 @@ def test_logger_config_with_uuid_config():
     restored = LoggerConfig.from_dict(config_dict)
     assert restored.request_id_config is not None
     assert restored.request_id_config.format == "alphanumeric"
+
+
+def test_logger_package_lazy_exports():
+    """Test the logger package resolves its lazy exports on access"""
+    import morado.common.logger as logger_package
+
+    assert logger_package.LoggerConfig is LoggerConfig
+    assert logger_package.UUIDConfig is UUIDConfig
+    assert "get_logger" in dir(logger_package)
+    with pytest.raises(AttributeError):
+        logger_package.not_an_export  # noqa: B018
+
+
+def test_configure_logger_skips_equal_config(monkeypatch):
+    """Test reconfiguring the logger with an equal config is a no-op"""
+    from morado.common.logger.logger import LoggerSystem, configure_logger
+
+    calls = []
+    monkeypatch.setattr(LoggerSystem, "_configured", False)
+    monkeypatch.setattr(LoggerSystem, "_config", None)
+    monkeypatch.setattr(LoggerSystem, "_configure_structlog", calls.append)
+    monkeypatch.setattr(LoggerSystem, "_configure_stdlib_logging", lambda _config: None)
+
+    configure_logger(LoggerConfig(level="DEBUG"))
+    configure_logger(LoggerConfig(level="DEBUG"))
+    assert len(calls) == 1
+
+    configure_logger(LoggerConfig(level="INFO"))
+    assert len(calls) == 2
@@ -4,6 +4,7 @@ import asyncio
 
 import pytest
 from morado.common.logger.context import (
+    RequestScope,
     async_request_scope,
     clear_context,
     get_context_data,
@@ -130,6 +131,60 @@ def test_request_scope_with_extra_context():
     assert get_context_data("custom_key") is None
 
 
+def test_request_scope_class_sync():
+    """Test RequestScope used as a sync context manager."""
+    clear_context()
+
+    with RequestScope(request_id="REQ123", user_id=42, custom_key="custom_value"):
+        assert get_request_id() == "REQ123"
+        assert get_context_data("user_id") == 42
+        assert get_context_data("custom_key") == "custom_value"
+
+    assert get_request_id() is None
+    assert get_context_data("user_id") is None
+
+
+def test_request_scope_nested_restores_outer():
+    """Test leaving a nested scope restores the outer scope's context."""
+    clear_context()
+
+    with request_scope(request_id="OUTER", user_id=1):
+        with RequestScope(request_id="INNER", trace_id="TRACE"):
+            assert get_request_id() == "INNER"
+            assert get_context_data() == {"user_id": 1, "trace_id": "TRACE"}
+
+        assert get_request_id() == "OUTER"
+        assert get_context_data() == {"user_id": 1}
+
+    assert get_request_id() is None
+    assert get_context_data() == {}
+
+
+def test_set_context_data_in_nested_scope():
+    """Test values set inside a nested scope do not leak into the outer one."""
+    clear_context()
+
+    with request_scope(user_id=1):
+        with RequestScope():
+            set_context_data("step", "inner")
+            assert get_context_data() == {"user_id": 1, "step": "inner"}
+
+        assert get_context_data() == {"user_id": 1}
+
+
+@pytest.mark.asyncio
+async def test_request_scope_class_async():
+    """Test RequestScope used as an async context manager."""
+    clear_context()
+
+    async with RequestScope(trace_id="TRACE123"):
+        assert get_request_id() is not None
+        assert get_context_data("trace_id") == "TRACE123"
+
+    assert get_request_id() is None
+    assert get_context_data("trace_id") is None
+
+
 @pytest.mark.asyncio
 async def test_async_request_scope_basic():
     """Test basic async_request_scope functionality."""
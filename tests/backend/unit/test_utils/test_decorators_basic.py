@@ -1,8 +1,11 @@
 """Basic tests for decorator functionality."""
 
 import asyncio
+import inspect
+import logging
 
 import pytest
+import structlog
 from morado.common.logger.context import (
     clear_context,
     get_context_data,
@@ -143,6 +146,87 @@ async def test_log_execution_async():
     assert result == 30
 
 
+def test_log_execution_logs_named_args():
+    """Test log_execution logs arguments by parameter name with defaults."""
+
+    @log_execution(include_args=True)
+    def scale(x: int, factor: int = 2, *, offset: int = 0) -> int:
+        return x * factor + offset
+
+    @log_execution(include_args=True)
+    def total(*values: int, **options: int) -> int:
+        return sum(values)
+
+    with structlog.testing.capture_logs() as logs:
+        assert scale(3, offset=1) == 7
+        assert total(1, 2, start=0) == 3
+
+    entries = [log["args"] for log in logs if log["event"] == "function_entry"]
+    assert entries == [
+        {"x": 3, "factor": 2, "offset": 1},
+        {"values": (1, 2), "options": {"start": 0}},
+    ]
+    # Arguments are listed in parameter order, as Signature.bind() gives them
+    assert list(entries[0]) == ["x", "factor", "offset"]
+
+
+def test_log_execution_unknown_level():
+    """Test log_execution falls back to info for unknown level names."""
+
+    @log_execution(level="TRACE")
+    def calculate(x: int, y: int) -> int:
+        return x * y
+
+    assert calculate(4, 5) == 20
+
+
+def test_log_execution_skips_args_when_level_disabled(monkeypatch):
+    """Test log_execution does not bind arguments for filtered-out levels."""
+    saved_config = structlog.get_config()
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+    def fail_bind(*args, **kwargs):
+        raise AssertionError("arguments should not be bound")
+
+    try:
+        @log_execution(level="DEBUG", include_args=True, include_result=True)
+        def calculate(x: int, y: int) -> int:
+            return x - y
+
+        monkeypatch.setattr(inspect.Signature, "bind", fail_bind)
+        assert calculate(5, 3) == 2
+    finally:
+        structlog.configure(**saved_config)
+
+
+def test_log_execution_skips_logging_when_level_disabled():
+    """Test log_execution logs nothing for filtered-out levels."""
+    saved_config = structlog.get_config()
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING)
+    )
+
+    try:
+        @log_execution(level="DEBUG")
+        def quiet(x: int) -> int:
+            return x
+
+        @log_execution(level="WARNING")
+        def loud(x: int) -> int:
+            return x
+
+        with structlog.testing.capture_logs() as logs:
+            assert quiet(1) == 1
+            assert loud(2) == 2
+
+        assert [log["event"] for log in logs] == ["function_entry", "function_exit"]
+        assert {log["function"] for log in logs} == {"loud"}
+    finally:
+        structlog.configure(**saved_config)
+
+
 def test_log_execution_with_exception():
     """Test log_execution decorator handles exceptions."""
 
@@ -184,3 +268,45 @@ def test_with_request_context_partial_context():
 
     result = process_request(request_id="PARTIAL123", data="partial")
     assert result == "partial"
+
+
+def test_with_request_context_positional_and_default_args():
+    """Test with_request_context reads positional arguments and defaults."""
+    clear_context()
+
+    @with_request_context()
+    def process_request(data: str, request_id: str, user_id: int = 7):
+        assert get_request_id() == request_id
+        assert get_context_data("user_id") == user_id
+        return data
+
+    assert process_request("positional", "POS123") == "positional"
+    assert process_request("mixed", "MIX123", user_id=8) == "mixed"
+
+
+def test_with_request_context_ignores_var_keyword():
+    """Test that context names are only read from named parameters."""
+    clear_context()
+
+    @with_request_context(auto_generate=False)
+    def process_request(data: str, **options):
+        assert get_request_id() is None
+        return options["request_id"]
+
+    assert process_request("data", request_id="KW123") == "KW123"
+
+
+def test_decorated_function_metadata():
+    """Test decorated functions keep their name, docstring and signature."""
+
+    @with_request_context()
+    def process_request(request_id: str, data: str) -> str:
+        """Process a request."""
+        return data
+
+    assert process_request.__name__ == "process_request"
+    assert process_request.__doc__ == "Process a request."
+    assert list(inspect.signature(process_request).parameters) == [
+        "request_id",
+        "data",
+    ]
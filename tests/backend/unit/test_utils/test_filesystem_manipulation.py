@@ -1,5 +1,7 @@
 """Basic tests for FileSystemUtil directory and file manipulation methods."""
 
+import builtins
+import os
 import shutil
 import tempfile
 from pathlib import Path
@@ -8,6 +10,7 @@ import pytest
 from morado.common.utils.exceptions import (
     FileExistsError,
     FileNotFoundError,
+    FileSystemError,
 )
 from morado.common.utils.filesystem import FileSystemUtil
 
@@ -81,6 +84,23 @@ def test_delete_directory(temp_dir):
     assert not test_dir.exists()
 
 
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="requires symlinks")
+def test_delete_directory_keeps_symlink_targets(temp_dir):
+    """Test deleting a directory removes symlinks without following them."""
+    outside = temp_dir / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("content")
+    test_dir = temp_dir / "test_dir"
+    (test_dir / "nested").mkdir(parents=True)
+    (test_dir / "nested" / "file.txt").write_text("content")
+    os.symlink(outside, test_dir / "link", target_is_directory=True)
+
+    FileSystemUtil.delete(test_dir)
+
+    assert not test_dir.exists()
+    assert (outside / "keep.txt").exists()
+
+
 def test_delete_missing_ok(temp_dir):
     """Test that missing_ok=True doesn't raise error for non-existent path."""
     non_existent = temp_dir / "does_not_exist.txt"
@@ -112,6 +132,20 @@ def test_copy_file_basic(temp_dir):
     assert src.exists()  # Source should still exist
 
 
+def test_copy_file_without_metadata(temp_dir):
+    """Test copying only the file contents."""
+    src = temp_dir / "source.txt"
+    dst = temp_dir / "dest.txt"
+    src.write_text("test content")
+    os.utime(src, (0, 0))
+
+    result = FileSystemUtil.copy_file(src, dst, preserve_metadata=False)
+
+    assert result == dst
+    assert dst.read_text() == "test content"
+    assert dst.stat().st_mtime != 0
+
+
 def test_copy_file_overwrite_false(temp_dir):
     """Test that overwrite=False raises error when destination exists."""
     src = temp_dir / "source.txt"
@@ -251,6 +285,62 @@ def test_list_files_recursive_with_pattern(temp_dir):
     assert all(f.suffix == ".txt" for f in txt_files)
 
 
+def test_list_files_recursive_matches_rglob(temp_dir):
+    """Test recursive listing finds the same files as Path.rglob."""
+    (temp_dir / "a" / "b").mkdir(parents=True)
+    (temp_dir / "top.txt").write_text("content")
+    (temp_dir / ".hidden.txt").write_text("content")
+    (temp_dir / "a" / "mid.py").write_text("content")
+    (temp_dir / "a" / "b" / "deep.txt").write_text("content")
+
+    for pattern in (None, "*.txt", "**/*.py"):
+        files = FileSystemUtil.list_files(temp_dir, pattern=pattern, recursive=True)
+        expected = [p for p in temp_dir.rglob(pattern or "*") if p.is_file()]
+        assert sorted(files) == sorted(expected)
+
+
+def test_list_files_recursive_skips_unreadable_subdirectories(temp_dir, monkeypatch):
+    """Test that unreadable subdirectories are skipped like Path.rglob does."""
+    (temp_dir / "x.txt").write_text("content")
+    locked = temp_dir / "locked"
+    locked.mkdir()
+    (locked / "y.txt").write_text("content")
+    scandir = os.scandir
+    unreadable = {str(locked)}
+
+    def fake_scandir(path):
+        if os.fspath(path) in unreadable:
+            raise PermissionError(13, "Permission denied", path)
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", fake_scandir)
+
+    files = FileSystemUtil.list_files(temp_dir, recursive=True)
+    assert files == [temp_dir / "x.txt"]
+
+    # The listed directory itself must be readable
+    unreadable.add(str(temp_dir))
+    with pytest.raises(FileSystemError):
+        FileSystemUtil.list_files(temp_dir, recursive=True)
+
+
+def test_iter_files(temp_dir):
+    """Test lazily iterating over files."""
+    (temp_dir / "file1.txt").write_text("content1")
+    subdir = temp_dir / "subdir"
+    subdir.mkdir()
+    (subdir / "file2.txt").write_text("content2")
+
+    files = FileSystemUtil.iter_files(temp_dir, pattern="*.txt", recursive=True)
+
+    assert not isinstance(files, list)
+    assert sorted(files) == [temp_dir / "file1.txt", subdir / "file2.txt"]
+
+    # The directory is checked before iterating
+    with pytest.raises(FileNotFoundError):
+        FileSystemUtil.iter_files(temp_dir / "missing")
+
+
 def test_list_files_not_directory(temp_dir):
     """Test that listing files on a non-directory raises error."""
     test_file = temp_dir / "file.txt"
@@ -282,3 +372,74 @@ def test_invalid_input_validation():
 
     with pytest.raises(ValueError):
         FileSystemUtil.list_files("")
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("file.txt", ".txt"),
+        ("dir/a.tar.gz", ".gz"),
+        (".hidden", ""),
+        ("no_ext", ""),
+        ("dir.d/file", ""),
+        ("dir/file.txt/", ".txt"),
+        ("file.", ""),
+        ("dir/..", ""),
+        ("", ""),
+    ],
+)
+def test_get_extension_matches_path_suffix(path, expected):
+    """Test string extensions follow the same rules as Path.suffix."""
+    assert FileSystemUtil.get_extension(path) == expected
+    assert FileSystemUtil.get_extension(Path(path)) == expected
+
+
+def test_get_modified_time(temp_dir):
+    """Test getting the modification time as a timezone-aware datetime."""
+    test_file = temp_dir / "file.txt"
+    test_file.write_text("content")
+    os.utime(test_file, (1_700_000_000, 1_700_000_000))
+
+    mod_time = FileSystemUtil.get_modified_time(str(test_file))
+
+    assert mod_time.tzinfo is not None
+    assert mod_time.timestamp() == 1_700_000_000
+
+    with pytest.raises(builtins.FileNotFoundError):
+        FileSystemUtil.get_modified_time(temp_dir / "missing.txt")
+    with pytest.raises(builtins.FileNotFoundError):
+        FileSystemUtil.get_modified_time(test_file / "beneath_a_file")
+
+
+def test_get_size(temp_dir):
+    """Test getting the size of a file."""
+    test_file = temp_dir / "file.txt"
+    test_file.write_text("content")
+
+    assert FileSystemUtil.get_size(str(test_file)) == 7
+
+    with pytest.raises(IsADirectoryError):
+        FileSystemUtil.get_size(temp_dir)
+
+    with pytest.raises(builtins.FileNotFoundError):
+        FileSystemUtil.get_size(temp_dir / "missing.txt")
+
+
+@pytest.mark.parametrize(
+    "parts",
+    [
+        ("/base", "subdir", "file.txt"),
+        ("relative", Path("path"), "to", "file"),
+        ("base", "/absolute", "file"),
+        ("base/", "", "file"),
+        (Path("single"),),
+    ],
+)
+def test_join_path_matches_path_division(parts):
+    """Test joining paths gives the same result as chaining Path division."""
+    expected = Path(parts[0])
+    for part in parts[1:]:
+        expected = expected / part
+
+    assert FileSystemUtil.join_path(*parts) == expected
+    assert FileSystemUtil.join_path() == Path()
@@ -4,7 +4,7 @@ This module contains unit tests for the TimeUtil class, focusing on
 specific examples and edge cases for time operations.
 """
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from morado.common.utils.time import TimeUtil
@@ -212,3 +212,29 @@ class TestConvenienceMethods:
         """Test that subtract_from_time raises TypeError for invalid dt type."""
         with pytest.raises(TypeError):
             TimeUtil.subtract_from_time("not a datetime", hours=1)
+
+    def test_add_to_now_without_duration(self):
+        """Test that add_to_now without a duration returns the current time."""
+        before = TimeUtil.now_utc()
+        result = TimeUtil.add_to_now()
+
+        assert result.tzinfo is not None
+        assert 0 <= (result - before).total_seconds() < 1
+
+    def test_add_to_now_with_invalid_duration(self):
+        """Test that add_to_now raises TypeError for invalid duration arguments."""
+        with pytest.raises(TypeError, match="Invalid duration arguments"):
+            TimeUtil.add_to_now(years=1)
+
+    def test_add_to_now_batch(self):
+        """Test that add_to_now_batch offsets one reading of the current time."""
+        before = TimeUtil.now_utc()
+        results = TimeUtil.add_to_now_batch(
+            [timedelta(0), timedelta(hours=1), timedelta(days=-1)]
+        )
+
+        assert len(results) == 3
+        assert all(result.tzinfo is not None for result in results)
+        assert 0 <= (results[0] - before).total_seconds() < 1
+        assert results[1] - results[0] == timedelta(hours=1)
+        assert results[0] - results[2] == timedelta(days=1)
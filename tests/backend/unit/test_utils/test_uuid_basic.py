@@ -63,6 +63,33 @@ def test_uuid4_generation():
     assert uuid.count("-") == 4
 
 
+def test_uuid4_many_generation():
+    """Test batch UUID4 generation"""
+    import uuid as stdlib_uuid
+
+    uuids = UUIDGenerator.uuid4_many(50)
+    assert len(set(uuids)) == 50
+    for value in uuids:
+        parsed = stdlib_uuid.UUID(value)
+        assert str(parsed) == value
+        assert parsed.version == 4
+        assert parsed.variant == stdlib_uuid.RFC_4122
+    assert UUIDGenerator.uuid4_many(0) == []
+
+
+def test_uuid4_bytes_generation():
+    """Test raw-bytes UUID4 generation"""
+    import uuid as stdlib_uuid
+
+    raw = UUIDGenerator.uuid4_bytes()
+    assert isinstance(raw, bytes)
+    assert len(raw) == 16
+    parsed = stdlib_uuid.UUID(bytes=raw)
+    assert parsed.version == 4
+    assert parsed.variant == stdlib_uuid.RFC_4122
+    assert UUIDGenerator.uuid4_bytes() != raw
+
+
 def test_ulid_generation():
     """Test ULID generation"""
     ulid = UUIDGenerator.ulid()
@@ -86,6 +113,32 @@ def test_alphanumeric_generation():
     assert len(uuid) == 24
 
 
+def test_alphanumeric_charset():
+    """Test secure alphanumeric IDs only use the given charset"""
+    uuid = UUIDGenerator.alphanumeric(length=200, charset="abc")
+    assert len(uuid) == 200
+    assert set(uuid) <= set("abc")
+
+    # Non-ASCII charsets fall back to per-character choice
+    uuid = UUIDGenerator.alphanumeric(length=10, charset="αβγ")
+    assert len(uuid) == 10
+    assert set(uuid) <= set("αβγ")
+
+
+def test_alphanumeric_many_generation():
+    """Test batch alphanumeric ID generation"""
+    uuids = UUIDGenerator.alphanumeric_many(20, length=16, prefix="REQ", suffix="X")
+    assert len(set(uuids)) == 20
+    for uuid in uuids:
+        assert len(uuid) == 16
+        assert uuid.startswith("REQ")
+        assert uuid.endswith("X")
+        assert set(uuid[3:-1]) <= set(UUIDGenerator.ALPHANUMERIC_UPPER)
+
+    with pytest.raises(ValueError, match="exceeds or equals total length"):
+        UUIDGenerator.alphanumeric_many(2, length=4, prefix="REQ", suffix="X")
+
+
 def test_numeric_generation():
     """Test numeric ID generation"""
     uuid = UUIDGenerator.numeric(length=20)
@@ -138,3 +191,15 @@ def test_stateless_generator():
     uuid1 = UUIDGenerator.uuid4()
     uuid2 = UUIDGenerator.uuid4()
     assert uuid1 != uuid2  # Should generate different UUIDs
+
+
+def test_utils_package_lazy_exports():
+    """Test the utils package resolves its UUID exports on access"""
+    import morado.common.utils as utils_package
+
+    assert utils_package.UUIDGenerator is UUIDGenerator
+    assert utils_package.uuid4 == UUIDGenerator.uuid4
+    assert len(utils_package.alphanumeric()) == 24
+    assert "numeric" in dir(utils_package)
+    with pytest.raises(AttributeError):
+        utils_package.not_an_export  # noqa: B018